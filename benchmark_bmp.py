@@ -0,0 +1,699 @@
+#!/usr/bin/env python3
+"""
+BMP Benchmark Suite - Stage timings for the decode pipeline
+
+Generates a synthetic corpus of BMP files across sizes, bit depths, row
+padding cases (width % 4 = 0..3), row order and compression. Each stage of
+the pipeline is then timed separately:
+
+    load_bmp_and_log_header   read the file and log the headers
+    parse_bmp_header          parse the 54-byte header from memory
+    extract_rgb_values        decode pixels (decode_pixels for indexed/RLE)
+    render_rgb_to_image       build the PIL image from the RGB array
+    render_bmp_buffer         build the PIL image straight from the file bytes
+                              (uncompressed files only)
+
+Each stage reports ns/pixel, MB/s and peak traced memory. With --threads N
+the corpus is instead decoded with BmpDecoder.decode_many at 1, 2, 4 ... N
+threads to show how throughput scales inside one process. With --startup
+the import time of main.py and run_bmp_viewer.py is measured instead, with
+python -X importtime in fresh interpreters. It fails if the import exceeds
+--import-budget, or if NumPy or PIL get loaded just to parse headers. With
+--server-processes N, N worker processes fetch the whole corpus, once by
+decoding every file themselves and once from a bmp_server decode daemon
+through shared memory. Every RLE case is also paired with the BI_RGB
+file holding the same image, and the ratio of their decode times is
+reported per size. Results can be written as JSON and compared against a
+stored baseline. Any stage that gets slower or uses more memory than the
+tolerance allows (or whose RLE/BI_RGB ratio grows by more than it) is
+reported, and the script exits with status 1.
+
+Usage:
+    python benchmark_bmp.py                                  # default corpus
+    python benchmark_bmp.py --sizes tiny,small --bit-counts 24 --output base.json
+    python benchmark_bmp.py --baseline base.json --tolerance 0.25
+    python benchmark_bmp.py --sizes gigapixel --bit-counts 8 --corpus /data/bench
+    python benchmark_bmp.py --sizes medium,large --threads 8
+    python benchmark_bmp.py --startup --import-budget 50
+    python benchmark_bmp.py --sizes medium --bit-counts 8,24 --server-processes 4
+"""
+
+import argparse
+import contextlib
+import json
+import os
+import platform
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+import main
+from main import (
+    BI_RGB,
+    BI_RLE4,
+    BI_RLE8,
+    BmpDecoder,
+    decode_bmp_file,
+    decode_pixels,
+    extract_rgb_values,
+    load_bmp_and_log_header,
+    padded_row_size,
+    parse_bmp_header,
+    render_bmp_buffer,
+    render_rgb_to_image,
+)
+
+# Named image sizes as (width, height); widths are multiples of 4 so that
+# adding the padding case gives width % 4 == padding
+SIZES = {
+    "tiny": (4, 4),
+    "small": (64, 64),
+    "medium": (1024, 768),
+    "large": (4096, 4096),
+    "gigapixel": (32768, 32768),
+}
+DEFAULT_SIZES = ("tiny", "small", "medium")
+BIT_COUNTS = (1, 4, 8, 16, 24, 32)
+RLE_COMPRESSION = {8: BI_RLE8, 4: BI_RLE4}
+
+# Differences below these floors are treated as noise, not regressions
+MIN_SECONDS_DELTA = 50e-6
+MIN_MEMORY_DELTA = 64 * 1024
+
+# Modules that header-only work must not import, and the default budget for
+# importing main.py (cumulative -X importtime, best of several runs)
+HEAVY_MODULES = ("numpy", "PIL", "asyncio", "concurrent.futures")
+DEFAULT_IMPORT_BUDGET_MS = 100.0
+
+# ============================================================================
+# SYNTHETIC CORPUS
+# ============================================================================
+
+def _run_lengths(rng, width, max_run=64):
+    """Random run lengths (each 1..max_run) that add up to width."""
+    lengths = rng.integers(1, max_run + 1, size=width)
+    ends = np.cumsum(lengths)
+    count = int(np.searchsorted(ends, width)) + 1
+    lengths = lengths[:count]
+    lengths[-1] -= ends[count - 1] - width
+    return lengths
+
+def _pack_index_row(indices, bit_count, row_size):
+    """Pack one row of indices into a padded stored row."""
+    if bit_count == 8:
+        packed = indices.astype(np.uint8)
+    elif bit_count == 4:
+        padded = np.append(indices, 0) if indices.size % 2 else indices
+        packed = ((padded[0::2] << 4) | padded[1::2]).astype(np.uint8)
+    else:
+        packed = np.packbits(indices.astype(np.uint8))
+    row = np.zeros(row_size, dtype=np.uint8)
+    row[:packed.size] = packed
+    return row
+
+def _encode_rle_row(lengths, values, bit_count):
+    """Encode one row of runs as RLE8/RLE4 (count, value) pairs plus end-of-line."""
+    if bit_count == 4:
+        values = (values << 4) | values
+    pairs = np.empty((lengths.size, 2), dtype=np.uint8)
+    pairs[:, 0] = lengths
+    pairs[:, 1] = values
+    return pairs.tobytes() + b'\x00\x00'
+
+def write_synthetic_bmp(file_path, width, height, bit_count, top_down=False,
+                        compression=BI_RGB, seed=0, rows_per_band=256):
+    """
+    Write a synthetic BMP file band by band with bounded memory.
+
+    Direct-color images get random pixels. Indexed images get rows made of
+    random-length runs, which is also what the RLE variants encode.
+
+    Args:
+        file_path (str): Path of the file to write
+        width (int): Image width
+        height (int): Image height
+        bit_count (int): 1, 4, 8, 16 (5-5-5), 24 or 32
+        top_down (bool): Store rows top-to-bottom (not allowed with RLE)
+        compression (int): BI_RGB, BI_RLE8 (8-bit) or BI_RLE4 (4-bit)
+        seed (int): Random seed
+        rows_per_band (int): Rows generated per write
+
+    Returns:
+        int: Size of the written file in bytes
+    """
+    rng = np.random.default_rng(seed)
+    indexed = bit_count <= 8
+    palette_size = (1 << bit_count) if indexed else 0
+    data_offset = main.BMP_HEADER_SIZE + palette_size * 4
+    row_size = padded_row_size(width, bit_count)
+
+    with open(file_path, 'wb') as f:
+        f.write(b'\x00' * data_offset)
+        if indexed:
+            palette = rng.integers(0, 256, size=(palette_size, 4), dtype=np.uint8)
+            palette[:, 3] = 0
+            f.seek(main.BMP_HEADER_SIZE)
+            f.write(palette.tobytes())
+
+        for start in range(0, height, rows_per_band):
+            band_rows = min(rows_per_band, height - start)
+            if not indexed:
+                f.write(rng.integers(0, 256, size=band_rows * row_size, dtype=np.uint8).tobytes())
+                continue
+
+            chunks = []
+            for _ in range(band_rows):
+                lengths = _run_lengths(rng, width)
+                values = rng.integers(0, palette_size, size=lengths.size)
+                if compression == BI_RGB:
+                    row = _pack_index_row(np.repeat(values, lengths), bit_count, row_size)
+                    chunks.append(row.tobytes())
+                else:
+                    chunks.append(_encode_rle_row(lengths, values, bit_count))
+            f.write(b''.join(chunks))
+
+        if compression != BI_RGB:
+            f.write(b'\x00\x01')
+        file_size = f.tell()
+        image_size = file_size - data_offset
+
+        f.seek(0)
+        f.write(main._BMP_HEADER_STRUCT.pack(
+            b'BM', file_size, 0, 0, data_offset, 40, width,
+            -height if top_down else height, 1, bit_count, compression, image_size,
+            2835, 2835, palette_size, 0))
+    return file_size
+
+def build_corpus(directory, sizes, bit_counts, paddings, orientations, include_rle=True):
+    """
+    Generate (or reuse) the synthetic corpus.
+
+    Files that already exist in directory are reused, so a large corpus only
+    has to be generated once.
+
+    Returns:
+        list: Case dicts with name, path, width, height, bit_count,
+        compression and top_down
+    """
+    cases = []
+    for size in sizes:
+        base_width, height = SIZES[size]
+        for bit_count in bit_counts:
+            for padding in paddings:
+                width = base_width + padding
+                variants = [(BI_RGB, top_down) for top_down in orientations]
+                if include_rle and bit_count in RLE_COMPRESSION and False in orientations:
+                    variants.append((RLE_COMPRESSION[bit_count], False))
+
+                for compression, top_down in variants:
+                    name = (f"{size}-{bit_count}bit-w{width}"
+                            f"{'-rle' if compression != BI_RGB else ''}"
+                            f"-{'topdown' if top_down else 'bottomup'}")
+                    path = os.path.join(directory, name + ".bmp")
+                    if not os.path.exists(path):
+                        write_synthetic_bmp(path, width, height, bit_count, top_down, compression)
+                    cases.append({
+                        "name": name, "path": path, "width": width, "height": height,
+                        "bit_count": bit_count, "compression": compression, "top_down": top_down,
+                    })
+    return cases
+
+# ============================================================================
+# TIMING
+# ============================================================================
+
+def time_stage(fn, repeats=None, target_seconds=0.2, max_repeats=50):
+    """
+    Return the best wall time of fn over several runs.
+
+    Args:
+        fn (callable): Stage to time
+        repeats (int): Fixed number of runs (default: enough runs to fill
+            target_seconds, at most max_repeats)
+
+    Returns:
+        float: Fastest run in seconds
+    """
+    start = time.perf_counter()
+    fn()
+    best = time.perf_counter() - start
+    if repeats is None:
+        repeats = min(max_repeats, max(1, int(target_seconds / max(best, 1e-9))))
+    for _ in range(repeats - 1):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def peak_memory(fn):
+    """Return the peak traced allocation size of one run of fn in bytes."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def benchmark_case(case, repeats=None):
+    """
+    Time every pipeline stage for one corpus file.
+
+    Returns:
+        list: One result dict per stage
+    """
+    path = case["path"]
+    file_bytes = os.path.getsize(path)
+    with open(path, 'rb') as f:
+        buffer = f.read()
+    header = parse_bmp_header(buffer)
+    pixels = header.width * header.abs_height
+
+    if header.bit_count in main.DIRECT_BIT_COUNTS:
+        extract_name = "extract_rgb_values"
+        extract = lambda: extract_rgb_values(buffer, header.data_offset, header.width,
+                                             header.height, bit_count=header.bit_count)
+    else:
+        extract_name = "decode_pixels"
+        extract = lambda: decode_pixels(buffer, header)
+    rgb_values = extract()
+
+    stages = [
+        ("load_bmp_and_log_header", lambda: load_bmp_and_log_header(path)),
+        ("parse_bmp_header", lambda: parse_bmp_header(buffer)),
+        (extract_name, extract),
+        ("render_rgb_to_image",
+         lambda: render_rgb_to_image(rgb_values, header.width, header.abs_height)),
+    ]
+    if header.compression == BI_RGB and header.bit_count in main._PIL_RAW_MODES:
+        stages.append(("render_bmp_buffer", lambda: render_bmp_buffer(buffer, header)))
+
+    results = []
+    for stage, fn in stages:
+        seconds = time_stage(fn, repeats)
+        results.append({
+            "case": case["name"],
+            "stage": stage,
+            "seconds": seconds,
+            "ns_per_pixel": seconds * 1e9 / pixels,
+            "mb_per_second": file_bytes / 1e6 / seconds if seconds else 0.0,
+            "peak_bytes": peak_memory(fn),
+        })
+    return results
+
+def _thread_counts(max_threads):
+    counts = {1, max_threads}
+    threads = 2
+    while threads < max_threads:
+        counts.add(threads)
+        threads *= 2
+    return sorted(counts)
+
+def thread_scaling(cases, max_threads, repeats=3):
+    """
+    Measure decode throughput of BmpDecoder.decode_many as threads increase.
+
+    Every corpus file is decoded once per run; the best of repeats runs is
+    reported for each thread count from 1 up to max_threads.
+
+    Returns:
+        list: One result dict per thread count with files/s, MB/s and the
+        speedup over one thread
+    """
+    paths = [case["path"] for case in cases]
+    total_bytes = sum(os.path.getsize(path) for path in paths)
+    decoder = BmpDecoder()
+
+    results = []
+    for threads in _thread_counts(max_threads):
+        # deque(maxlen=0) drains the generator without keeping the arrays
+        seconds = time_stage(
+            lambda: deque(decoder.decode_many(paths, max_workers=threads), maxlen=0), repeats)
+        results.append({
+            "threads": threads,
+            "seconds": seconds,
+            "files_per_second": len(paths) / seconds,
+            "mb_per_second": total_bytes / 1e6 / seconds,
+            "speedup": results[0]["seconds"] / seconds if results else 1.0,
+        })
+    return results
+
+def rle_ratios(results, cases):
+    """
+    Compare RLE decode time with BI_RGB decode time for the same image.
+
+    write_synthetic_bmp draws the same pixels for both compressions, so each
+    RLE case has an uncompressed twin of the same size, bit depth and width.
+    The ratio of their decode_pixels times is the cost of RLE expansion and
+    depends much less on the machine than either time alone.
+
+    Returns:
+        list: One dict per RLE case with both times in seconds and the ratio
+    """
+    seconds = {(entry["case"], entry["stage"]): entry["seconds"] for entry in results}
+    ratios = []
+    for case in cases:
+        if case["compression"] == BI_RGB:
+            continue
+        rle = seconds.get((case["name"], "decode_pixels"))
+        rgb = seconds.get((case["name"].replace("-rle", ""), "decode_pixels"))
+        if rle is None or rgb is None:
+            continue
+        ratios.append({
+            "case": case["name"],
+            "width": case["width"],
+            "height": case["height"],
+            "bit_count": case["bit_count"],
+            "rle_seconds": rle,
+            "rgb_seconds": rgb,
+            "ratio": rle / rgb if rgb else float("inf"),
+        })
+    return ratios
+
+# ============================================================================
+# DECODE SERVER
+# ============================================================================
+
+def _decode_in_process(paths):
+    """Worker: decode every file itself, as each short-lived process does today."""
+    for path in paths:
+        decode_bmp_file(path)
+    return len(paths)
+
+def _fetch_from_server(socket_path, paths):
+    """Worker: attach to every file's pixels through the decode server."""
+    from bmp_server import BmpServerClient
+
+    with BmpServerClient(socket_path) as client:
+        for path in paths:
+            client.acquire(path).close()
+    return len(paths)
+
+def _start_server(socket_path, timeout=10.0):
+    server = subprocess.Popen([sys.executable, os.path.join(os.path.dirname(
+        os.path.abspath(__file__)), "bmp_server.py"), "--socket", socket_path],
+        stdout=subprocess.DEVNULL)
+    deadline = time.perf_counter() + timeout
+    while not os.path.exists(socket_path):
+        if server.poll() is not None or time.perf_counter() > deadline:
+            server.kill()
+            raise RuntimeError(f"Decode server did not start on {socket_path}")
+        time.sleep(0.01)
+    return server
+
+def server_comparison(cases, processes, repeats=3):
+    """
+    Compare per-process decoding with fetching from a bmp_server daemon.
+
+    processes worker processes each obtain every corpus file as an array,
+    either by decoding it themselves or by attaching to the server's shared
+    memory. The pool is warmed up first, so process start-up is not counted.
+    The server is started in its own interpreter, and its first (cold) pass
+    is reported separately from the warm passes that hit its cache.
+
+    Returns:
+        list: One result dict per mode with seconds, files/s and the speedup
+        over per-process decoding
+    """
+    paths = [case["path"] for case in cases]
+    socket_dir = tempfile.mkdtemp()
+    socket_path = os.path.join(socket_dir, "bmp_server.sock")
+    server = _start_server(socket_path)
+    try:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            # Sleeping tasks make the pool start every worker up front
+            list(executor.map(time.sleep, [0.05] * processes))
+
+            def run(fn):
+                return sum(executor.map(fn, [paths] * processes))
+
+            fetch = partial(_fetch_from_server, socket_path)
+            modes = [("per-process decode", time_stage(lambda: run(_decode_in_process), repeats)),
+                     ("decode server (cold)", time_stage(lambda: run(fetch), 1)),
+                     ("decode server (warm)", time_stage(lambda: run(fetch), repeats))]
+    finally:
+        # SIGINT lets the server unlink its shared blocks and socket
+        server.send_signal(signal.SIGINT)
+        server.wait()
+        os.rmdir(socket_dir)
+
+    results = []
+    for mode, seconds in modes:
+        results.append({
+            "mode": mode,
+            "processes": processes,
+            "seconds": seconds,
+            "files_per_second": processes * len(paths) / seconds,
+            "speedup": modes[0][1] / seconds,
+        })
+    return results
+
+# ============================================================================
+# STARTUP TIME
+# ============================================================================
+
+def import_time(module, repeats=5):
+    """
+    Measure the cumulative import time of a module in fresh interpreters.
+
+    Each run starts a new python -X importtime process, imports the module
+    and parses its cumulative time from the report on stderr.
+
+    Args:
+        module (str): Module to import, e.g. "main"
+        repeats (int): Interpreter runs; the fastest is reported (default: 5)
+
+    Returns:
+        dict: module, best import time in ms, and the HEAVY_MODULES it loaded
+    """
+    script = (f"import sys, {module}; "
+              f"print('heavy:' + ','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))")
+    best = None
+    for _ in range(repeats):
+        completed = subprocess.run([sys.executable, "-X", "importtime", "-c", script],
+                                   cwd=os.path.dirname(os.path.abspath(__file__)),
+                                   capture_output=True, text=True, check=True)
+        # Lines look like "import time:  self [us] | cumulative | name"
+        for line in completed.stderr.splitlines():
+            fields = line.split("|")
+            if len(fields) == 3 and fields[2].strip() == module:
+                cumulative = int(fields[1]) / 1e3
+                best = cumulative if best is None else min(best, cumulative)
+        # The module itself may print, so the report line is found by its prefix
+        report = [line for line in completed.stdout.splitlines() if line.startswith("heavy:")][-1]
+        heavy = [name for name in report[len("heavy:"):].split(",") if name]
+    return {"module": module, "ms": best, "heavy_modules": heavy}
+
+def check_startup(budget_ms, repeats=5):
+    """
+    Check that importing main.py stays within budget and stays header-only.
+
+    Returns:
+        tuple: (results, problems) where results holds one import_time dict
+        per module and problems lists the budget/heavy-import violations
+    """
+    results = [import_time(module, repeats) for module in ("main", "run_bmp_viewer")]
+    problems = []
+    for entry in results:
+        if entry["heavy_modules"]:
+            problems.append(f"import {entry['module']} loads {', '.join(entry['heavy_modules'])}")
+    if results[0]["ms"] > budget_ms:
+        problems.append(f"import main takes {results[0]['ms']:.1f} ms "
+                        f"(budget {budget_ms:.1f} ms)")
+    return results, problems
+
+# ============================================================================
+# BASELINE COMPARISON
+# ============================================================================
+
+def compare_to_baseline(results, baseline, tolerance):
+    """
+    Compare results with a baseline run.
+
+    Args:
+        results (list): Result dicts from this run
+        baseline (list): Result dicts from the baseline JSON
+        tolerance (float): Allowed relative slowdown/growth, e.g. 0.25 for 25%
+
+    Returns:
+        list: Regression descriptions (empty if none)
+    """
+    previous = {(entry["case"], entry["stage"]): entry for entry in baseline}
+    regressions = []
+    for entry in results:
+        base = previous.get((entry["case"], entry["stage"]))
+        if base is None:
+            continue
+        if (entry["seconds"] > base["seconds"] * (1 + tolerance)
+                and entry["seconds"] - base["seconds"] > MIN_SECONDS_DELTA):
+            # Sub-resolution stages can have a baseline time of exactly 0
+            growth = (f"+{(entry['seconds'] / base['seconds'] - 1) * 100:.0f}%"
+                      if base['seconds'] else "was below timer resolution")
+            regressions.append(f"{entry['case']} {entry['stage']}: time "
+                               f"{base['seconds'] * 1e3:.3f} ms -> {entry['seconds'] * 1e3:.3f} ms "
+                               f"({growth})")
+        if (entry["peak_bytes"] > base["peak_bytes"] * (1 + tolerance)
+                and entry["peak_bytes"] - base["peak_bytes"] > MIN_MEMORY_DELTA):
+            regressions.append(f"{entry['case']} {entry['stage']}: peak memory "
+                               f"{base['peak_bytes'] / 1e6:.2f} MB -> {entry['peak_bytes'] / 1e6:.2f} MB")
+    return regressions
+
+def compare_rle_ratios(ratios, baseline, tolerance):
+    """
+    Compare RLE/BI_RGB decode time ratios with a baseline run.
+
+    Only cases whose RLE decode also got slower in absolute terms are
+    reported, so a faster BI_RGB path alone does not count as a regression.
+
+    Returns:
+        list: Regression descriptions (empty if none)
+    """
+    previous = {entry["case"]: entry for entry in baseline}
+    regressions = []
+    for entry in ratios:
+        base = previous.get(entry["case"])
+        if base is None:
+            continue
+        if (entry["ratio"] > base["ratio"] * (1 + tolerance)
+                and entry["rle_seconds"] - base["rle_seconds"] > MIN_SECONDS_DELTA):
+            regressions.append(f"{entry['case']} RLE/BI_RGB decode time ratio "
+                               f"{base['ratio']:.2f} -> {entry['ratio']:.2f}")
+    return regressions
+
+def _parse_list(value, convert=str):
+    return [convert(item) for item in value.split(",") if item]
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the BMP decode pipeline.")
+    parser.add_argument("--sizes", default=",".join(DEFAULT_SIZES),
+                        help=f"Comma-separated sizes from {', '.join(SIZES)}")
+    parser.add_argument("--bit-counts", default=",".join(map(str, BIT_COUNTS)),
+                        help="Comma-separated bit depths (default: 1,4,8,16,24,32)")
+    parser.add_argument("--paddings", default="0,1,2,3",
+                        help="Comma-separated width %% 4 cases (default: 0,1,2,3)")
+    parser.add_argument("--orientations", default="bottomup,topdown",
+                        help="Comma-separated row orders: bottomup, topdown")
+    parser.add_argument("--no-rle", action="store_true", help="Skip RLE8/RLE4 cases")
+    parser.add_argument("--corpus", default=None,
+                        help="Directory to generate/reuse the corpus in (default: temporary)")
+    parser.add_argument("--repeats", type=int, default=None,
+                        help="Runs per stage (default: adaptive)")
+    parser.add_argument("--output", "-o", default=None, help="Write results as JSON")
+    parser.add_argument("--baseline", "-b", default=None, help="Baseline JSON to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Allowed relative regression (default: 0.25)")
+    parser.add_argument("--threads", type=int, default=None,
+                        help="Run the thread scaling test up to this many threads "
+                             "instead of the stage timings")
+    parser.add_argument("--server-processes", type=int, default=None,
+                        help="Compare per-process decoding with the bmp_server daemon "
+                             "using this many worker processes")
+    parser.add_argument("--startup", action="store_true",
+                        help="Check import time and lazy imports instead of decoding")
+    parser.add_argument("--import-budget", type=float, default=DEFAULT_IMPORT_BUDGET_MS,
+                        help=f"Import budget for main.py in ms (default: {DEFAULT_IMPORT_BUDGET_MS:g})")
+    options = parser.parse_args(argv)
+
+    if options.startup:
+        results, problems = check_startup(options.import_budget, options.repeats or 5)
+        for entry in results:
+            print(f"import {entry['module']:<16} {entry['ms']:>8.1f} ms  "
+                  f"heavy modules: {', '.join(entry['heavy_modules']) or 'none'}")
+        if options.output:
+            with open(options.output, "w") as f:
+                json.dump({"startup": results}, f, indent=2)
+        if problems:
+            for line in problems:
+                print(f"❌ {line}")
+            return 1
+        print(f"✅ Startup within budget ({options.import_budget:g} ms)")
+        return 0
+
+    sizes = _parse_list(options.sizes)
+    unknown = [size for size in sizes if size not in SIZES]
+    if unknown:
+        parser.error(f"unknown sizes: {', '.join(unknown)}")
+    orientations = [name == "topdown" for name in _parse_list(options.orientations)]
+
+    with contextlib.ExitStack() as stack:
+        corpus_dir = options.corpus or stack.enter_context(tempfile.TemporaryDirectory())
+        os.makedirs(corpus_dir, exist_ok=True)
+        print(f"📦 Building corpus in {corpus_dir}...")
+        cases = build_corpus(corpus_dir, sizes, _parse_list(options.bit_counts, int),
+                             _parse_list(options.paddings, int), orientations,
+                             include_rle=not options.no_rle)
+
+        results = []
+        ratios = []
+        scaling = []
+        server = []
+        if options.server_processes:
+            print(f"{'mode':<22} {'ms':>10} {'files/s':>10} {'speedup':>8}")
+            for entry in server_comparison(cases, options.server_processes, options.repeats or 3):
+                server.append(entry)
+                print(f"{entry['mode']:<22} {entry['seconds'] * 1e3:>10.1f} "
+                      f"{entry['files_per_second']:>10.1f} {entry['speedup']:>7.2f}x")
+        elif options.threads:
+            print(f"{'threads':>7} {'files/s':>10} {'MB/s':>9} {'speedup':>8}")
+            for entry in thread_scaling(cases, options.threads, options.repeats or 3):
+                scaling.append(entry)
+                print(f"{entry['threads']:>7} {entry['files_per_second']:>10.1f} "
+                      f"{entry['mb_per_second']:>9.1f} {entry['speedup']:>7.2f}x")
+        else:
+            print(f"{'case':<36} {'stage':<24} {'ms':>10} {'ns/px':>9} {'MB/s':>9} {'peak MB':>9}")
+            for case in cases:
+                for entry in benchmark_case(case, options.repeats):
+                    results.append(entry)
+                    print(f"{entry['case']:<36} {entry['stage']:<24} "
+                          f"{entry['seconds'] * 1e3:>10.3f} {entry['ns_per_pixel']:>9.2f} "
+                          f"{entry['mb_per_second']:>9.1f} {entry['peak_bytes'] / 1e6:>9.2f}")
+            ratios = rle_ratios(results, cases)
+            if ratios:
+                print(f"\n{'RLE case':<36} {'RLE ms':>10} {'BI_RGB ms':>10} {'ratio':>7}")
+                for entry in ratios:
+                    print(f"{entry['case']:<36} {entry['rle_seconds'] * 1e3:>10.3f} "
+                          f"{entry['rgb_seconds'] * 1e3:>10.3f} {entry['ratio']:>6.2f}x")
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "results": results,
+    }
+    if ratios:
+        report["rle"] = ratios
+    if scaling:
+        report["scaling"] = scaling
+    if server:
+        report["server"] = server
+    if options.output:
+        with open(options.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"💾 Wrote {len(results)} results to {options.output}")
+
+    if options.baseline:
+        with open(options.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline["results"], options.tolerance)
+        regressions += compare_rle_ratios(ratios, baseline.get("rle", []), options.tolerance)
+        if regressions:
+            print(f"❌ {len(regressions)} regressions against {options.baseline} "
+                  f"(tolerance {options.tolerance:.0%}):")
+            for line in regressions:
+                print(f"   {line}")
+            return 1
+        print(f"✅ No regressions against {options.baseline} (tolerance {options.tolerance:.0%})")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
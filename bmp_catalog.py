@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+BMP Catalog - Persistent header index for large BMP directories
+
+Builds an on-disk SQLite index of BMP header fields by reading only the
+first 54 bytes of each file. Entries are keyed by path, size and mtime, so
+re-scanning a directory only re-reads files that were added or changed.
+Queries such as "all 24-bit images wider than 4000px" then run against the
+index without touching pixel data.
+
+Usage:
+    from bmp_catalog import BmpCatalog
+
+    with BmpCatalog("bmp_catalog.sqlite3") as catalog:
+        catalog.update("images")
+        wide = catalog.query(bit_count=24, min_width=4000)
+"""
+
+import os
+import sqlite3
+
+from main import BMP_HEADER_SIZE, parse_bmp_header
+
+DEFAULT_CATALOG_PATH = "bmp_catalog.sqlite3"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS bmp_files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    signature TEXT,
+    file_size INTEGER,
+    data_offset INTEGER,
+    header_size INTEGER,
+    width INTEGER,
+    height INTEGER,
+    bit_count INTEGER,
+    compression INTEGER,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS bmp_files_format ON bmp_files (bit_count, width, height);
+CREATE INDEX IF NOT EXISTS bmp_files_size ON bmp_files (width, height);
+"""
+
+_COLUMNS = ("path", "size", "mtime_ns", "signature", "file_size", "data_offset",
+            "header_size", "width", "height", "bit_count", "compression", "error")
+
+def scan_bmp_entries(root, recursive=True):
+    """
+    Yield os.DirEntry objects for every *.bmp file under root.
+
+    Uses os.scandir so that file sizes and mtimes come from the directory
+    listing instead of a separate stat call per file where the OS allows it.
+
+    Args:
+        root (str): Directory to scan
+        recursive (bool): Descend into subdirectories (default: True)
+
+    Yields:
+        os.DirEntry: Entries for BMP files
+    """
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive:
+                        stack.append(entry.path)
+                elif entry.name.lower().endswith(".bmp") and entry.is_file():
+                    yield entry
+
+def read_header_record(file_path):
+    """
+    Read the header fields of one BMP file for the catalog.
+
+    Only the first 54 bytes are read. Unreadable or invalid files are
+    recorded with an error message so they are not re-read until they change.
+
+    Args:
+        file_path (str): Path to the BMP file
+
+    Returns:
+        dict: Header fields keyed by catalog column name
+    """
+    try:
+        with open(file_path, "rb") as f:
+            header = parse_bmp_header(f.read(BMP_HEADER_SIZE))
+    except (OSError, ValueError) as e:
+        return {"error": str(e)}
+
+    return {
+        "signature": header.signature.decode("latin-1"),
+        "file_size": header.file_size,
+        "data_offset": header.data_offset,
+        "header_size": header.header_size,
+        "width": header.width,
+        "height": header.height,
+        "bit_count": header.bit_count,
+        "compression": header.compression,
+        "error": None if header.is_bmp else "Invalid BMP signature",
+    }
+
+class BmpCatalog:
+    """
+    On-disk index of BMP header fields keyed by path, size and mtime.
+    """
+
+    def __init__(self, db_path=DEFAULT_CATALOG_PATH):
+        """
+        Open (or create) a catalog database.
+
+        Args:
+            db_path (str): Path to the SQLite database file
+        """
+        self.db_path = db_path
+        self.connection = sqlite3.connect(db_path)
+        self.connection.row_factory = sqlite3.Row
+        self.connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the database connection."""
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def update(self, source, recursive=True):
+        """
+        Incrementally index every BMP file under a directory.
+
+        Files whose size and mtime match the stored entry are skipped without
+        being opened. Entries under source that no longer exist are removed;
+        a non-recursive update only removes entries directly inside source.
+
+        Args:
+            source (str): Directory to scan
+            recursive (bool): Descend into subdirectories (default: True)
+
+        Returns:
+            dict: Counts of scanned, updated, unchanged and removed files
+        """
+        root = os.path.abspath(source)
+        prefix = os.path.join(root, "")
+        known = {
+            row["path"]: (row["size"], row["mtime_ns"])
+            for row in self.connection.execute(
+                "SELECT path, size, mtime_ns FROM bmp_files WHERE substr(path, 1, ?) = ?",
+                (len(prefix), prefix))
+            # A flat scan only sees direct children, so it must not treat
+            # entries in subdirectories as deleted
+            if recursive or os.path.dirname(row["path"]) == root
+        }
+
+        changed = []
+        scanned = 0
+        for entry in scan_bmp_entries(root, recursive):
+            scanned += 1
+            stat = entry.stat()
+            path = os.path.abspath(entry.path)
+            key = (stat.st_size, stat.st_mtime_ns)
+            if known.pop(path, None) == key:
+                continue
+
+            record = read_header_record(path)
+            record.update(path=path, size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+            changed.append(tuple(record.get(column) for column in _COLUMNS))
+
+        with self.connection:
+            self.connection.executemany(
+                f"INSERT OR REPLACE INTO bmp_files ({', '.join(_COLUMNS)}) "
+                f"VALUES ({', '.join('?' * len(_COLUMNS))})", changed)
+            # Anything left in known was not seen on disk during this scan
+            self.connection.executemany("DELETE FROM bmp_files WHERE path = ?",
+                                        ((path,) for path in known))
+
+        return {
+            "scanned": scanned,
+            "updated": len(changed),
+            "unchanged": scanned - len(changed),
+            "removed": len(known),
+        }
+
+    def query(self, bit_count=None, compression=None, min_width=None, max_width=None,
+              min_height=None, max_height=None, include_errors=False):
+        """
+        Find indexed files by header fields without touching pixel data.
+
+        Args:
+            bit_count (int): Exact bits per pixel to match
+            compression (int): Exact compression value to match
+            min_width (int): Minimum width in pixels (inclusive)
+            max_width (int): Maximum width in pixels (inclusive)
+            min_height (int): Minimum absolute height in rows (inclusive)
+            max_height (int): Maximum absolute height in rows (inclusive)
+            include_errors (bool): Also return files that failed to parse
+
+        Returns:
+            list: sqlite3.Row objects with the catalog columns
+        """
+        conditions = []
+        params = []
+        for clause, value in (("bit_count = ?", bit_count),
+                              ("compression = ?", compression),
+                              ("width >= ?", min_width),
+                              ("width <= ?", max_width),
+                              ("abs(height) >= ?", min_height),
+                              ("abs(height) <= ?", max_height)):
+            if value is not None:
+                conditions.append(clause)
+                params.append(value)
+        if not include_errors:
+            conditions.append("error IS NULL")
+
+        sql = "SELECT * FROM bmp_files"
+        if conditions:
+            sql += " WHERE " + " AND ".join(conditions)
+        return self.connection.execute(sql + " ORDER BY path", params).fetchall()
@@ -0,0 +1,425 @@
+#!/usr/bin/env python3
+"""
+BMP Server - Local decode daemon serving images through shared memory
+
+A long-running process decodes each BMP once and keeps the pixels in named
+multiprocessing.shared_memory blocks. Clients on the same host talk to it
+over a Unix domain socket. They ask for a file and get back a handle (block
+name, shape and dtype), then attach to the block directly. No pixel data
+crosses the socket and nothing is copied.
+
+Every handed-out block is reference counted. Blocks in use are never
+evicted; unused ones are evicted least recently used first once the cache
+exceeds its byte budget. A client that disconnects, or crashes, releases
+everything it still holds.
+
+Protocol: one JSON object per line in each direction, e.g.
+    {"op": "acquire", "path": "/abs/image.bmp", "output": "rgb"}
+    {"ok": true, "name": "psm_1a2b", "shape": [426, 640, 3], "dtype": "uint8", ...}
+    {"op": "release", "name": "psm_1a2b"}
+    {"op": "stats"}
+
+Usage:
+    python bmp_server.py --socket /tmp/bmp_server.sock --max-mb 1024
+
+    from bmp_server import BmpServerClient
+
+    with BmpServerClient("/tmp/bmp_server.sock") as client:
+        with client.acquire("images/image-1.bmp") as image:
+            process(image.array)
+"""
+
+import argparse
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from main import (
+    DecodedImageCache,
+    OUTPUT_FORMATS,
+    SharedImage,
+    _attach_shared_memory,
+    _create_shared_memory,
+    decode_bmp_file,
+)
+
+DEFAULT_SOCKET_PATH = os.path.join(tempfile.gettempdir(), "bmp_server.sock")
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+
+# ============================================================================
+# SHARED-MEMORY CACHE
+# ============================================================================
+
+class _SharedEntry:
+    """One decoded image in a shared block, with its reference count."""
+
+    __slots__ = ("key", "image", "header", "refs", "stale")
+
+    def __init__(self, key, image, header):
+        self.key = key
+        self.image = image
+        self.header = header
+        self.refs = 0
+        self.stale = False
+
+    @property
+    def nbytes(self):
+        return self.image.array.nbytes
+
+    def handle(self):
+        array = self.image.array
+        return {
+            "name": self.image.name,
+            "shape": list(array.shape),
+            "dtype": array.dtype.str,
+            "width": self.header.width,
+            "height": self.header.height,
+            "bit_count": self.header.bit_count,
+        }
+
+class SharedImageCache:
+    """
+    Byte-budgeted LRU cache of decoded images in named shared memory blocks.
+
+    Entries are keyed by (absolute path, size, mtime_ns, output) like
+    DecodedImageCache, so a rewritten file is decoded again. acquire() and
+    release() keep a reference count per block. Only blocks nobody holds are
+    evicted, so the cache can go over budget while every entry is in use.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Args:
+            max_bytes (int): Budget for the pixel bytes of all cached images
+                (default: 1 GiB)
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._by_name = {}
+        self._keys_by_path = {}
+        self._decoding = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, file_path, output="rgb"):
+        """
+        Return the handle of a decoded image, decoding it on a miss.
+
+        Concurrent requests for the same file wait for a single decode. Each
+        call takes a reference that must be given back with release().
+
+        Args:
+            file_path (str): Path to the BMP file
+            output (str): Layout of the pixels, one of OUTPUT_FORMATS
+
+        Returns:
+            dict: name, shape and dtype of the shared block plus header fields
+        """
+        if output not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown output {output!r}; expected one of {OUTPUT_FORMATS}")
+        key = DecodedImageCache.make_key(file_path) + (output,)
+
+        while True:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry is not None:
+                    self._entries.move_to_end(key)
+                    entry.refs += 1
+                    self.hits += 1
+                    return entry.handle()
+                pending = self._decoding.get(key)
+                if pending is None:
+                    self._decoding[key] = threading.Event()
+                    self.misses += 1
+                    break
+            # Another thread is decoding this file; use its result (or retry
+            # the decode ourselves if it failed)
+            pending.wait()
+
+        try:
+            entry = self._decode(key, file_path, output)
+            with self._lock:
+                self._insert(entry)
+                entry.refs += 1
+                self._evict()
+                return entry.handle()
+        finally:
+            with self._lock:
+                self._decoding.pop(key).set()
+
+    def release(self, name):
+        """
+        Give back one reference to a block returned by acquire().
+
+        Args:
+            name (str): Shared memory block name from the handle
+        """
+        with self._lock:
+            entry = self._by_name.get(name)
+            if entry is None or entry.refs == 0:
+                raise ValueError(f"Shared block {name!r} is not acquired")
+            entry.refs -= 1
+            if entry.refs == 0 and entry.stale:
+                self._remove(entry)
+            else:
+                self._evict()
+
+    def _decode(self, key, file_path, output):
+        header, pixels = decode_bmp_file(file_path, output=output)
+        shm = _create_shared_memory(pixels.nbytes)
+        image = SharedImage(shm, pixels.shape, dtype=pixels.dtype)
+        np.copyto(image.array, pixels)
+        return _SharedEntry(key, image, header)
+
+    def _insert(self, entry):
+        # An older version of the same file is dropped once nobody holds it;
+        # key[0::3] is (path, output), shared by every version of the file
+        stale_key = self._keys_by_path.get(entry.key[0::3])
+        if stale_key is not None:
+            stale = self._entries[stale_key]
+            if stale.refs:
+                stale.stale = True
+            else:
+                self._remove(stale)
+        self._entries[entry.key] = entry
+        self._by_name[entry.image.name] = entry
+        self._keys_by_path[entry.key[0::3]] = entry.key
+        self.current_bytes += entry.nbytes
+
+    def _evict(self):
+        if self.current_bytes <= self.max_bytes:
+            return
+        for entry in [entry for entry in self._entries.values() if entry.refs == 0]:
+            self._remove(entry)
+            self.evictions += 1
+            if self.current_bytes <= self.max_bytes:
+                break
+
+    def _remove(self, entry):
+        del self._entries[entry.key]
+        del self._by_name[entry.image.name]
+        if self._keys_by_path.get(entry.key[0::3]) == entry.key:
+            del self._keys_by_path[entry.key[0::3]]
+        self.current_bytes -= entry.nbytes
+        entry.image.close()
+
+    def close(self):
+        """Free every shared block, held or not."""
+        with self._lock:
+            for entry in list(self._entries.values()):
+                self._remove(entry)
+
+    def stats(self):
+        """
+        Returns:
+            dict: Entry count, byte usage, references held and
+            hit/miss/eviction counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "references": sum(entry.refs for entry in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+# ============================================================================
+# SERVER
+# ============================================================================
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Serves one client connection until it disconnects."""
+
+    def handle(self):
+        cache = self.server.cache
+        held = {}
+        try:
+            for line in self.rfile:
+                try:
+                    request = json.loads(line)
+                    op = request.get("op")
+                    if op == "acquire":
+                        reply = cache.acquire(request["path"], request.get("output", "rgb"))
+                        held[reply["name"]] = held.get(reply["name"], 0) + 1
+                    elif op == "release":
+                        name = request["name"]
+                        if not held.get(name):
+                            raise ValueError(f"Shared block {name!r} is not held by this client")
+                        cache.release(name)
+                        held[name] -= 1
+                        reply = {}
+                    elif op == "stats":
+                        reply = cache.stats()
+                    else:
+                        raise ValueError(f"Unknown op {op!r}")
+                    reply["ok"] = True
+                except Exception as e:
+                    reply = {"ok": False, "error": f"{type(e).__name__}: {e}"}
+                self.wfile.write(json.dumps(reply).encode() + b"\n")
+        finally:
+            # A client that goes away gives back whatever it still holds
+            for name, count in held.items():
+                for _ in range(count):
+                    cache.release(name)
+
+class BmpDecodeServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Unix domain socket server handing out shared-memory decoded images.
+
+    Each client connection gets its own thread. Decodes run in that thread,
+    and NumPy releases the GIL for the bulk copies.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, cache=None):
+        """
+        Args:
+            socket_path (str): Filesystem path of the socket; a leftover
+                socket file from a previous run is replaced
+            cache (SharedImageCache): Cache to serve from (default: a new
+                one with the default budget)
+        """
+        self.cache = cache or SharedImageCache()
+        if os.path.exists(socket_path):
+            os.unlink(socket_path)
+        super().__init__(socket_path, _RequestHandler)
+
+    def server_close(self):
+        """Stop listening, remove the socket file and free every block."""
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+        self.cache.close()
+
+def serve(socket_path=DEFAULT_SOCKET_PATH, max_bytes=DEFAULT_MAX_BYTES):
+    """Run a decode server until interrupted."""
+    server = BmpDecodeServer(socket_path, SharedImageCache(max_bytes))
+    print(f"🛰️  Serving decoded BMPs on {socket_path} "
+          f"(cache budget {max_bytes / 2**20:,.0f} MiB)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+# ============================================================================
+# CLIENT
+# ============================================================================
+
+class LeasedImage(SharedImage):
+    """
+    A decoded image attached from the server's shared memory.
+
+    The array is read-only and shared with every other client. close()
+    detaches and hands the reference back to the server, so drop any other
+    references to array (or copy it) first.
+    """
+
+    def __init__(self, client, handle):
+        shm = _attach_shared_memory(handle["name"])
+        super().__init__(shm, handle["shape"], owner=False, dtype=handle["dtype"])
+        self.array.setflags(write=False)
+        self.handle = handle
+        self._client = client
+
+    def close(self):
+        """Detach from the block and release it on the server."""
+        if self.array is None:
+            return
+        try:
+            super().close()
+        finally:
+            # Hand the reference back even if detaching failed, or the
+            # server would pin the block until this client disconnects
+            self._client._request(op="release", name=self.name)
+
+class BmpServerClient:
+    """
+    Connection to a running decode server.
+
+    One client can be shared by threads; requests are serialized on the
+    connection.
+    """
+
+    def __init__(self, socket_path=DEFAULT_SOCKET_PATH, timeout=None):
+        """
+        Args:
+            socket_path (str): Socket the server listens on
+            timeout (float): Seconds to wait for each reply (default: no limit)
+        """
+        self.socket_path = socket_path
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(timeout)
+        self.sock.connect(socket_path)
+        self._file = self.sock.makefile("rwb")
+        self._lock = threading.Lock()
+
+    def _request(self, **message):
+        with self._lock:
+            self._file.write(json.dumps(message).encode() + b"\n")
+            self._file.flush()
+            line = self._file.readline()
+        if not line:
+            raise ConnectionError(f"Decode server at {self.socket_path} closed the connection")
+        reply = json.loads(line)
+        if not reply.pop("ok"):
+            raise ValueError(reply["error"])
+        return reply
+
+    def acquire(self, file_path, output="rgb"):
+        """
+        Get a decoded image from the server without copying its pixels.
+
+        Args:
+            file_path (str): Path to the BMP file (resolved on this side)
+            output (str): Layout of the pixels, one of OUTPUT_FORMATS
+
+        Returns:
+            LeasedImage: Attached image; close it (or use it as a context
+            manager) to give the reference back
+        """
+        handle = self._request(op="acquire", path=os.path.abspath(file_path), output=output)
+        return LeasedImage(self, handle)
+
+    def stats(self):
+        """Return the server's cache statistics."""
+        return self._request(op="stats")
+
+    def close(self):
+        """Close the connection; the server releases anything still held."""
+        self._file.close()
+        self.sock.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def main_cli(argv=None):
+    parser = argparse.ArgumentParser(description="Serve decoded BMPs through shared memory.")
+    parser.add_argument("--socket", "-s", default=DEFAULT_SOCKET_PATH,
+                        help=f"Unix socket path (default: {DEFAULT_SOCKET_PATH})")
+    parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_BYTES / 2**20,
+                        help=f"Cache budget in MiB (default: {DEFAULT_MAX_BYTES // 2**20})")
+    options = parser.parse_args(argv)
+    serve(options.socket, int(options.max_mb * 2**20))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main_cli())
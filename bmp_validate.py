@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+BMP Validate - Structural integrity checks for whole directories of BMPs
+
+Checks every BMP under a directory using only its 54-byte header and the
+size reported by os.scandir. No pixel data is read or decoded. The header
+fields are checked for consistency with each other and with the on-disk
+file size. Corrupt or truncated files are reported in a JSON-serializable
+report, so they can be rejected before anything tries to decode them.
+
+Usage:
+    from bmp_validate import validate_tree
+
+    report = validate_tree("incoming", workers=16)
+    for entry in report["files"]:
+        if not entry["ok"]:
+            print(entry["path"], [error["code"] for error in entry["errors"]])
+"""
+
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from bmp_catalog import scan_bmp_entries
+from main import (
+    BI_ALPHABITFIELDS,
+    BI_BITFIELDS,
+    BI_RGB,
+    BITFIELDS_COMPRESSIONS,
+    BMP_HEADER_SIZE,
+    INDEXED_BIT_COUNTS,
+    parse_bmp_header,
+    unsupported_reason,
+)
+
+# BITMAPFILEHEADER size; the info header starts right after it
+FILE_HEADER_SIZE = 14
+
+# BITMAPINFOHEADER and its V2/V3/V4/V5 extensions
+INFO_HEADER_SIZES = (40, 52, 56, 108, 124)
+
+# Errors after which the expected pixel data size cannot be computed
+_LAYOUT_ERRORS = ("bad_info_header_size", "bad_dimensions", "unsupported_format",
+                  "bad_data_offset")
+
+def check_header(header, file_size):
+    """
+    Check a parsed header against itself and the size of its file.
+
+    Args:
+        header (BmpHeader): The parsed header
+        file_size (int): Size of the file on disk in bytes
+
+    Returns:
+        list: Error dicts with a machine-readable "code" and a "message"
+    """
+    errors = []
+
+    def error(code, message):
+        errors.append({"code": code, "message": message})
+
+    if not header.is_bmp:
+        error("bad_signature", f"signature is {header.signature!r}, expected b'BM'")
+        return errors
+
+    if header.file_size != file_size:
+        error("file_size_mismatch",
+              f"header says {header.file_size} bytes, file has {file_size}")
+    if header.header_size not in INFO_HEADER_SIZES:
+        error("bad_info_header_size", f"unsupported info header size {header.header_size}")
+    if header.planes != 1:
+        error("bad_planes", f"planes is {header.planes}, expected 1")
+    if header.width <= 0 or header.height == 0:
+        error("bad_dimensions", f"invalid dimensions {header.width} x {header.height}")
+
+    reason = unsupported_reason(header, allow_bitfields=True)
+    if reason is not None:
+        error("unsupported_format", reason)
+
+    # The color table or channel masks (if any) sit between the info header
+    # and the pixels; V2+ headers already contain the masks
+    table_end = FILE_HEADER_SIZE + header.header_size
+    if header.bit_count in INDEXED_BIT_COUNTS:
+        table_end += 4 * (header.colors_used or 2 ** header.bit_count)
+    elif header.compression == BI_BITFIELDS:
+        table_end = max(table_end, FILE_HEADER_SIZE + 52)
+    elif header.compression == BI_ALPHABITFIELDS:
+        table_end = max(table_end, FILE_HEADER_SIZE + 56)
+    if header.data_offset < table_end:
+        error("bad_data_offset",
+              f"data offset {header.data_offset} overlaps the headers/color table "
+              f"ending at {table_end}")
+    elif header.data_offset >= file_size:
+        error("bad_data_offset", f"data offset {header.data_offset} is past the end "
+                                 f"of the {file_size}-byte file")
+
+    # The pixel data size is only meaningful if the layout fields are sane
+    if any(found["code"] in _LAYOUT_ERRORS for found in errors):
+        return errors
+
+    # Uncompressed rows must all be present; RLE data must fit its stated size
+    if header.compression == BI_RGB or header.compression in BITFIELDS_COMPRESSIONS:
+        needed = header.pixel_data_size
+    else:
+        needed = header.image_size
+        if needed == 0:
+            error("missing_image_size", "compressed image has no image size")
+    if header.data_offset + needed > file_size:
+        error("truncated_pixel_data",
+              f"{needed} bytes of pixel data at offset {header.data_offset} need "
+              f"{header.data_offset + needed} bytes, file has {file_size}")
+    return errors
+
+def validate_file(file_path, file_size=None):
+    """
+    Structurally validate one BMP file from its header alone.
+
+    Args:
+        file_path (str): Path to the BMP file
+        file_size (int): Size of the file on disk (default: stat the file)
+
+    Returns:
+        dict: path, size, ok, errors and the key header fields
+    """
+    result = {"path": file_path, "size": file_size, "ok": False, "errors": []}
+    try:
+        with open(file_path, "rb") as f:
+            if file_size is None:
+                file_size = result["size"] = os.fstat(f.fileno()).st_size
+            data = f.read(BMP_HEADER_SIZE)
+    except OSError as e:
+        result["errors"].append({"code": "unreadable", "message": str(e)})
+        return result
+
+    if len(data) < BMP_HEADER_SIZE:
+        result["errors"].append({"code": "truncated_header",
+                                 "message": f"file has only {len(data)} bytes"})
+        return result
+
+    header = parse_bmp_header(data)
+    result.update(width=header.width, height=header.height, bit_count=header.bit_count,
+                  compression=header.compression)
+    result["errors"] = check_header(header, file_size)
+    result["ok"] = not result["errors"]
+    return result
+
+def validate_tree(root, recursive=True, workers=None, include_valid=True, max_in_flight=None):
+    """
+    Validate every BMP file under a directory.
+
+    The directory is walked with os.scandir. Each file is then stat'ed and
+    its header read on a thread pool, because that work is I/O bound and
+    releases the GIL. A file removed mid-scan is reported as unreadable.
+    At most max_in_flight files are queued at a time, so memory stays
+    bounded however large the tree is.
+
+    Args:
+        root (str): Directory to scan
+        recursive (bool): Descend into subdirectories (default: True)
+        workers (int): Reader threads (default: 4 per CPU, at most 32)
+        include_valid (bool): List valid files in the report as well
+            (default: True)
+        max_in_flight (int): Maximum queued files (default: 4 per worker)
+
+    Returns:
+        dict: Report with root, checked, valid, invalid, seconds, error
+        counts by code, and a "files" list of per-file results
+    """
+    start = time.perf_counter()
+    workers = workers or min(32, 4 * (os.cpu_count() or 1))
+    max_in_flight = max_in_flight or workers * 4
+    paths = (entry.path for entry in scan_bmp_entries(root, recursive))
+
+    files = []
+    error_counts = {}
+    checked = invalid = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = set()
+        while True:
+            # Keep the pool fed without queueing the whole tree up front
+            for file_path in paths:
+                pending.add(executor.submit(validate_file, file_path))
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                result = future.result()
+                checked += 1
+                if not result["ok"]:
+                    invalid += 1
+                    for error in result["errors"]:
+                        error_counts[error["code"]] = error_counts.get(error["code"], 0) + 1
+                if include_valid or not result["ok"]:
+                    files.append(result)
+    # Results arrive in completion order
+    files.sort(key=lambda result: result["path"])
+
+    return {
+        "root": os.path.abspath(root),
+        "checked": checked,
+        "valid": checked - invalid,
+        "invalid": invalid,
+        "seconds": time.perf_counter() - start,
+        "error_counts": error_counts,
+        "files": files,
+    }
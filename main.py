@@ -1,513 +1,2889 @@
-#!/usr/bin/env python3
-"""
-BMP Endian Challenge - Python Edition
-
-This project teaches you how to parse and render BMP image files using Python,
-focusing on binary data manipulation, endianness concepts, and image processing.
-Perfect for Python programmers with web development experience and data science backgrounds.
-
-Author: Your Name
-Date: 2024
-"""
-
-import struct
-import numpy as np
-from PIL import Image
-import os
-
-# ============================================================================
-# STUDENT CONFIGURATION - CHANGE THIS TO ENABLE TESTING
-# ============================================================================
-# Change this number to run tests for completed tickets
-# 0 = no tests, 1 = test ticket 1, 2 = test tickets 1-2, etc.
-CURRENT_TICKET = 0
-
-# Flag to track if a file has been loaded (for Ticket 6 testing)
-file_loaded = False
-loaded_file_data = None
-
-# ============================================================================
-# HELPER FUNCTIONS
-# ============================================================================
-
-def create_test_buffer():
-    """
-    Creates test data for development and testing.
-    Returns a bytes object with known values for testing.
-    """
-    return b'\x78\x56\x34\x12\x00\x00\x80\xFF\xCD\xAB'
-
-def validate_bmp_file(file_path):
-    """
-    Validates that a file is a valid BMP file.
-    
-    Args:
-        file_path (str): Path to the BMP file
-        
-    Returns:
-        bool: True if valid BMP, False otherwise
-    """
-    try:
-        with open(file_path, 'rb') as f:
-            signature = f.read(2)
-            return signature == b'BM'
-    except Exception:
-        return False
-
-# ============================================================================
-# MAIN FUNCTIONS TO IMPLEMENT
-# ============================================================================
-
-def create_random_array(width=100, height=100):
-    """
-    Creates a NumPy array with random RGB values.
-    
-    TODO: Implement this function for Ticket 1
-    - Generate a 2D NumPy array with random RGB values (0-255)
-    - The array should have shape (height, width, 3) for RGB channels
-    - Use numpy.random for generating random values
-    
-    Args:
-        width (int): Width of the array (default: 100)
-        height (int): Height of the array (default: 100)
-        
-    Returns:
-        numpy.ndarray: Array with shape (height, width, 3) containing random RGB values
-    """
-    # TODO: Implement random array creation
-    # 1. Use numpy.random.randint to generate random values (0-255)
-    # 2. Create array with shape (height, width, 3)
-    # 3. Return the array
-    pass
-
-def read_uint32_le(buffer, offset):
-    """
-    Reads a 32-bit unsigned integer from a buffer in little-endian format.
-    
-    TODO: Implement this function for Ticket 2
-    - Use struct.unpack to read 4 bytes as little-endian unsigned integer
-    - Return the integer value
-    
-    Args:
-        buffer (bytes): The buffer to read from
-        offset (int): The offset in the buffer to start reading from
-        
-    Returns:
-        int: The 32-bit unsigned integer value
-    """
-    # TODO: Implement 32-bit unsigned little-endian reading
-    # Use struct.unpack('<I', buffer[offset:offset+4]) to read 4 bytes as little-endian unsigned
-    # Return the first (and only) value from the unpacked tuple
-    return 0
-
-def read_int32_le(buffer, offset):
-    """
-    Reads a 32-bit signed integer from a buffer in little-endian format.
-    
-    TODO: Implement this function for Ticket 2
-    - Use struct.unpack to read 4 bytes as little-endian signed integer
-    - Return the integer value
-    
-    Args:
-        buffer (bytes): The buffer to read from
-        offset (int): The offset in the buffer to start reading from
-        
-    Returns:
-        int: The 32-bit signed integer value
-    """
-    # TODO: Implement 32-bit signed little-endian reading
-    # Use struct.unpack('<i', buffer[offset:offset+4]) to read 4 bytes as little-endian signed
-    # Return the first (and only) value from the unpacked tuple
-    return 0
-
-def read_uint16_le(buffer, offset):
-    """
-    Reads a 16-bit unsigned integer from a buffer in little-endian format.
-    
-    TODO: Implement this function for Ticket 2
-    - Use struct.unpack to read 2 bytes as little-endian unsigned integer
-    - Return the integer value
-    
-    Args:
-        buffer (bytes): The buffer to read from
-        offset (int): The offset in the buffer to start reading from
-        
-    Returns:
-        int: The 16-bit unsigned integer value
-    """
-    # TODO: Implement 16-bit unsigned little-endian reading
-    # Use struct.unpack('<H', buffer[offset:offset+2]) to read 2 bytes as little-endian unsigned
-    # Return the first (and only) value from the unpacked tuple
-    return 0
-
-def load_bmp_and_log_header(file_path):
-    """
-    Parses a BMP file and logs the BITMAPFILEHEADER data.
-    
-    TODO: Implement this function for Ticket 3
-    - Read the BMP file into a bytes buffer
-    - Extract and log the file signature (bytes 0-1)
-    - Extract and log the data offset (bytes 10-13)
-    - Validate that the signature is "BM"
-    - Call log_bmp_info_header if valid
-    - Set file_loaded = True and store loaded_file_data for testing
-    
-    Args:
-        file_path (str): Path to the BMP file to parse
-        
-    Returns:
-        None
-    """
-    global file_loaded, loaded_file_data
-    
-    # TODO: Implement BMP file loading and header parsing
-    # 1. Open and read the file into a bytes buffer
-    # 2. Extract signature from bytes 0-1 using read_uint16_le
-    # 3. Extract data offset from bytes 10-13 using read_uint32_le
-    # 4. Log the extracted values
-    # 5. Validate signature is 0x4D42 ("BM" in little-endian)
-    # 6. Call log_bmp_info_header if valid
-    # 7. Set file_loaded = True and store loaded_file_data
-    pass
-
-def log_bmp_info_header(buffer):
-    """
-    Logs the BITMAPINFOHEADER data from the BMP buffer.
-    
-    TODO: Implement this function for Ticket 4
-    - Extract width from bytes 18-21
-    - Extract height from bytes 22-25
-    - Extract bit count from bytes 28-29
-    - Log all extracted values
-    - Validate that bit count is 24
-    - Call extract_rgb_values if valid
-    
-    Args:
-        buffer (bytes): The buffer containing BMP data
-        
-    Returns:
-        None
-    """
-    # TODO: Implement BITMAPINFOHEADER parsing
-    # 1. Extract width from bytes 18-21 using read_int32_le
-    # 2. Extract height from bytes 22-25 using read_int32_le
-    # 3. Extract bit count from bytes 28-29 using read_uint16_le
-    # 4. Log all extracted values
-    # 5. Validate that bit count is 24
-    # 6. Call extract_rgb_values if valid
-    pass
-
-def extract_rgb_values(buffer, data_offset, width, height):
-    """
-    Extracts RGB values from the BMP pixel data as a NumPy array.
-    
-    TODO: Implement this function for Ticket 5
-    - Calculate bytes per row and padding
-    - Handle bottom-up row order (BMP format)
-    - Extract BGR values (BMP stores as BGR, not RGB)
-    - Convert to RGB format using NumPy
-    - Return NumPy array of RGB values
-    
-    Args:
-        buffer (bytes): The buffer containing BMP data
-        data_offset (int): The offset to the pixel data
-        width (int): The image width
-        height (int): The image height
-        
-    Returns:
-        numpy.ndarray: Array with shape (height, width, 3) containing RGB values
-    """
-    # TODO: Implement RGB value extraction
-    # 1. Calculate bytes per row and padding (4-byte alignment)
-    # 2. Handle bottom-up row order (BMP format)
-    # 3. Extract BGR values (BMP stores as BGR, not RGB)
-    # 4. Convert to RGB format using NumPy array operations
-    # 5. Return NumPy array with shape (height, width, 3)
-    return np.array([])
-
-def render_rgb_to_image(rgb_values, width, height):
-    """
-    Renders RGB data as a PIL Image.
-    
-    TODO: Implement this function for Ticket 6
-    - Convert NumPy array to PIL Image
-    - Set image dimensions to match the data
-    - Display the image
-    - Return the PIL Image object
-    
-    Args:
-        rgb_values (numpy.ndarray): Array with shape (height, width, 3) containing RGB values
-        width (int): The image width
-        height (int): The image height
-        
-    Returns:
-        PIL.Image.Image: The rendered image
-    """
-    # TODO: Implement RGB to PIL Image rendering
-    # 1. Convert NumPy array to PIL Image using PIL.Image.fromarray
-    # 2. Ensure the array is uint8 type
-    # 3. Display the image using .show() method
-    # 4. Return the PIL Image object
-    pass
-
-def load_bmp_file(file_path):
-    """
-    Complete BMP file loading and processing pipeline.
-    This function demonstrates the complete workflow.
-    
-    Args:
-        file_path (str): Path to the BMP file to load
-        
-    Returns:
-        PIL.Image.Image: The rendered image, or None if failed
-    """
-    try:
-        print(f"Loading BMP file: {file_path}")
-        
-        # Load and parse the BMP file
-        load_bmp_and_log_header(file_path)
-        
-        if file_loaded and loaded_file_data:
-            # Extract image dimensions from the loaded data
-            width = read_int32_le(loaded_file_data, 18)
-            height = read_int32_le(loaded_file_data, 22)
-            data_offset = read_uint32_le(loaded_file_data, 10)
-            
-            # Extract RGB values
-            rgb_values = extract_rgb_values(loaded_file_data, data_offset, width, height)
-            
-            # Render to image
-            image = render_rgb_to_image(rgb_values, width, height)
-            
-            print(f"Successfully loaded and rendered {width}x{height} image")
-            return image
-        else:
-            print("Failed to load BMP file")
-            return None
-            
-    except Exception as e:
-        print(f"Error loading BMP file: {e}")
-        return None
-
-# ============================================================================
-# ⚠️  DO NOT EDIT ANYTHING BELOW THIS LINE  ⚠️
-# ============================================================================
-# This section contains the automated test system.
-# Modifying this code may break the testing functionality.
-# ============================================================================
-
-def run_tests_for_ticket(ticket_number):
-    """
-    Runs tests based on the current ticket number.
-    Tests are cumulative - setting ticket 3 will test tickets 1, 2, and 3.
-    """
-    if ticket_number < 1:
-        print("🎯 No tests to run. Set CURRENT_TICKET to 1 or higher to start testing.")
-        return
-
-    print(f"🧪 Running tests for tickets 1-{ticket_number}...")
-    print("=" * 50)
-
-    # Test data for Ticket 2
-    test_buffer = create_test_buffer()
-
-    # Mock BMP data for Tickets 3-6
-    mock_bmp_data = bytes([
-        # BITMAPFILEHEADER (14 bytes)
-        0x42, 0x4D,             # Signature: "BM"
-        0x4A, 0x00, 0x00, 0x00, # FileSize: 74 bytes
-        0x00, 0x00, 0x00, 0x00, # Reserved: 0
-        0x36, 0x00, 0x00, 0x00, # DataOffset: 54 bytes
-        
-        # BITMAPINFOHEADER (40 bytes)
-        0x28, 0x00, 0x00, 0x00, # Size: 40
-        0x02, 0x00, 0x00, 0x00, # Width: 2 pixels
-        0x02, 0x00, 0x00, 0x00, # Height: 2 pixels
-        0x01, 0x00,             # Planes: 1
-        0x18, 0x00,             # BitCount: 24 bits
-        0x00, 0x00, 0x00, 0x00, # Compression: 0 (none)
-        0x14, 0x00, 0x00, 0x00, # ImageSize: 20 bytes (2x2 with padding)
-        0x00, 0x00, 0x00, 0x00, # XpixelsPerM: 0
-        0x00, 0x00, 0x00, 0x00, # YpixelsPerM: 0
-        0x00, 0x00, 0x00, 0x00, # ColorsUsed: 0
-        0x00, 0x00, 0x00, 0x00, # ColorsImportant: 0
-        
-        # Pixel data (2x2 with 4-byte row padding)
-        # Row 1: Red pixel, Blue pixel + 2 bytes padding
-        0xFF, 0x00, 0x00, 0x00, 0x00, 0xFF, 0x00, 0x00,
-        # Row 2: Green pixel, White pixel + 2 bytes padding
-        0x00, 0xFF, 0x00, 0xFF, 0xFF, 0xFF, 0x00, 0x00
-    ])
-
-    # Ticket 1: NumPy Array Creation
-    if ticket_number >= 1:
-        print("=== Testing Ticket 1: NumPy Array Creation ===")
-        if callable(create_random_array):
-            try:
-                result = create_random_array(10, 10)
-                if isinstance(result, np.ndarray) and result.shape == (10, 10, 3):
-                    print("✅ Ticket 1: PASSED (random array created successfully)")
-                else:
-                    print("❌ Ticket 1: FAILED - expected shape (10, 10, 3), got", result.shape if hasattr(result, 'shape') else type(result))
-            except Exception as error:
-                print(f"❌ Ticket 1: FAILED - {error}")
-        else:
-            print("⏭️ Ticket 1: SKIPPED (function not implemented)")
-        print()
-
-    # Ticket 2: Struct Module Functions
-    if ticket_number >= 2:
-        print("=== Testing Ticket 2: Struct Module Functions ===")
-        
-        if callable(read_uint32_le):
-            result1 = read_uint32_le(test_buffer, 0)
-            expected1 = 0x12345678
-            if result1 == expected1:
-                print("✅ read_uint32_le: PASSED")
-            else:
-                print(f"❌ read_uint32_le: FAILED - expected {expected1}, got {result1}")
-        else:
-            print("⏭️ read_uint32_le: SKIPPED (function not implemented)")
-
-        if callable(read_int32_le):
-            result2 = read_int32_le(test_buffer, 4)
-            expected2 = -8388608
-            if result2 == expected2:
-                print("✅ read_int32_le: PASSED")
-            else:
-                print(f"❌ read_int32_le: FAILED - expected {expected2}, got {result2}")
-        else:
-            print("⏭️ read_int32_le: SKIPPED (function not implemented)")
-
-        if callable(read_uint16_le):
-            result3 = read_uint16_le(test_buffer, 8)
-            expected3 = 0xABCD
-            if result3 == expected3:
-                print("✅ read_uint16_le: PASSED")
-            else:
-                print(f"❌ read_uint16_le: FAILED - expected {expected3}, got {result3}")
-        else:
-            print("⏭️ read_uint16_le: SKIPPED (function not implemented)")
-        print()
-
-    # Ticket 3: BMP Loading and Header Logging
-    if ticket_number >= 3:
-        print("=== Testing Ticket 3: BMP Header Parsing ===")
-        
-        if callable(read_uint16_le) and callable(read_uint32_le):
-            signature = read_uint16_le(mock_bmp_data, 0)
-            expected_signature = 0x4D42  # "BM" in little-endian
-            if signature == expected_signature:
-                print("✅ BMP Signature: PASSED")
-            else:
-                print(f"❌ BMP Signature: FAILED - expected {expected_signature}, got {signature}")
-
-            data_offset = read_uint32_le(mock_bmp_data, 10)
-            expected_offset = 54
-            if data_offset == expected_offset:
-                print("✅ Data Offset: PASSED")
-            else:
-                print(f"❌ Data Offset: FAILED - expected {expected_offset}, got {data_offset}")
-        else:
-            print("⏭️ Ticket 3: SKIPPED (read functions not implemented)")
-        print()
-
-    # Ticket 4: Info Header Logging
-    if ticket_number >= 4:
-        print("=== Testing Ticket 4: BMP Info Header ===")
-        
-        if callable(read_int32_le) and callable(read_uint16_le):
-            width = read_int32_le(mock_bmp_data, 18)
-            height = read_int32_le(mock_bmp_data, 22)
-            bit_count = read_uint16_le(mock_bmp_data, 28)
-            
-            if width == 2 and height == 2 and bit_count == 24:
-                print("✅ Image Dimensions & Bit Count: PASSED")
-            else:
-                print(f"❌ Image Dimensions & Bit Count: FAILED - width: {width}, height: {height}, bitCount: {bit_count}")
-        else:
-            print("⏭️ Ticket 4: SKIPPED (read functions not implemented)")
-        print()
-
-    # Ticket 5: RGB Values Extraction
-    if ticket_number >= 5:
-        print("=== Testing Ticket 5: RGB Values Extraction ===")
-        
-        if callable(extract_rgb_values):
-            data_offset = 54
-            width = 2
-            height = 2
-            
-            try:
-                rgb_values = extract_rgb_values(mock_bmp_data, data_offset, width, height)
-                
-                if isinstance(rgb_values, np.ndarray) and rgb_values.shape == (2, 2, 3):
-                    print("✅ RGB Extraction: PASSED")
-                    print("   Extracted RGB values:", rgb_values.tolist())
-                else:
-                    print("❌ RGB Extraction: FAILED - expected NumPy array with shape (2, 2, 3)")
-            except Exception as error:
-                print(f"❌ RGB Extraction: FAILED - {error}")
-        else:
-            print("⏭️ Ticket 5: SKIPPED (function not implemented)")
-        print()
-
-    print("=" * 50)
-    print(f"🎯 Tests complete for tickets 1-{ticket_number}")
-    if ticket_number >= 6:
-        print("💡 Use load_bmp_file() to test Ticket 6 (complete workflow)")
-    else:
-        print("💡 Change CURRENT_TICKET to test more tickets as you complete them!")
-    print()
-
-def run_ticket6_test(file_path):
-    """
-    Runs Ticket 6 test when a file is actually loaded by the user.
-    This tests the complete end-to-end workflow with real file data.
-    """
-    print("=" * 50)
-    print("=== Testing Ticket 6: Complete Workflow with Real File ===")
-    
-    if (callable(render_rgb_to_image) and 
-        callable(log_bmp_info_header) and 
-        callable(extract_rgb_values) and 
-        file_loaded and loaded_file_data):
-        
-        try:
-            # Get image dimensions from the loaded data
-            width = read_int32_le(loaded_file_data, 18)
-            height = read_int32_le(loaded_file_data, 22)
-            data_offset = read_uint32_le(loaded_file_data, 10)
-            
-            # Extract RGB values
-            rgb_values = extract_rgb_values(loaded_file_data, data_offset, width, height)
-            
-            # Render to image
-            image = render_rgb_to_image(rgb_values, width, height)
-            
-            if image is not None:
-                print("✅ Ticket 6: PASSED (file successfully loaded and rendered)")
-                print(f"   File: {file_path}")
-                print(f"   Image dimensions: {width} x {height}")
-                print("   🎉 Complete workflow working!")
-            else:
-                print("❌ Ticket 6: FAILED - image rendering failed")
-                
-        except Exception as error:
-            print(f"❌ Ticket 6: FAILED - {error}")
-    else:
-        print("⏭️ Ticket 6: SKIPPED (required functions not implemented or no file loaded)")
-        print("   Need: log_bmp_info_header, extract_rgb_values, render_rgb_to_image")
-    
-    print("=" * 50)
-    print()
-
-if __name__ == "__main__":
-    # Run tests based on current ticket
-    run_tests_for_ticket(CURRENT_TICKET)
-    
-    # Example usage for Ticket 6 testing
-    if CURRENT_TICKET >= 6:
-        print("Example: To test the complete workflow with a real BMP file:")
-        print("load_bmp_file('images/image-1.bmp')")
+#!/usr/bin/env python3
+"""
+BMP Endian Challenge - Python Edition
+
+This project teaches you how to parse and render BMP image files using Python,
+focusing on binary data manipulation, endianness concepts, and image processing.
+Perfect for Python programmers with web development experience and data science backgrounds.
+
+Author: Your Name
+Date: 2024
+"""
+
+import contextlib
+import functools
+import importlib
+import logging
+import mmap
+import struct
+import sys
+import threading
+import time
+from collections import deque
+from collections import OrderedDict
+import os
+
+class _LazyModule:
+    """
+    Stand-in for a module that is only imported on first attribute access.
+    
+    NumPy, Pillow and the concurrency modules account for most of the time
+    it takes to import this file. Header-only work such as parsing,
+    validation and catalog queries never touches them. The first attribute
+    access imports the real module and rebinds the global name to it, so
+    later lookups go straight to the module.
+    """
+    
+    def __init__(self, name, alias):
+        self._name = name
+        self._alias = alias
+    
+    def __getattr__(self, attr):
+        module = importlib.import_module(self._name)
+        globals()[self._alias] = module
+        return getattr(module, attr)
+    
+    def __repr__(self):
+        return f"<lazy module {self._name!r}>"
+
+np = _LazyModule("numpy", "np")
+Image = _LazyModule("PIL.Image", "Image")
+asyncio = _LazyModule("asyncio", "asyncio")
+futures = _LazyModule("concurrent.futures", "futures")
+shared_memory = _LazyModule("multiprocessing.shared_memory", "shared_memory")
+
+# ============================================================================
+# STUDENT CONFIGURATION - CHANGE THIS TO ENABLE TESTING
+# ============================================================================
+# Change this number to run tests for completed tickets
+# 0 = no tests, 1 = test ticket 1, 2 = test tickets 1-2, etc.
+CURRENT_TICKET = 0
+
+# Progress and header details are logged here; see configure_logging
+logger = logging.getLogger("bmp")
+
+# Flag to track if a file has been loaded (for Ticket 6 testing). These are
+# only published for the test harness; the pipeline itself never reads them.
+file_loaded = False
+loaded_file_data = None
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def create_test_buffer():
+    """
+    Creates test data for development and testing.
+    Returns a bytes object with known values for testing.
+    """
+    return b'\x78\x56\x34\x12\x00\x00\x80\xFF\xCD\xAB'
+
+def validate_bmp_file(file_path):
+    """
+    Validates that a file is a valid BMP file.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        
+    Returns:
+        bool: True if valid BMP, False otherwise
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            signature = f.read(2)
+            return signature == b'BM'
+    except Exception:
+        return False
+
+def padded_row_size(width, bit_count=24):
+    """
+    Returns the size in bytes of one stored BMP row, including padding.
+    BMP rows are always padded up to a multiple of 4 bytes.
+    
+    Args:
+        width (int): The image width in pixels
+        bit_count (int): Bits per pixel (default: 24)
+        
+    Returns:
+        int: Number of bytes per stored row
+    """
+    return ((width * bit_count + 31) // 32) * 4
+
+def bgr_rows_to_rgb_view(buffer, data_offset, width, height, bit_count=24):
+    """
+    Exposes 24 or 32-bit BMP pixel rows as an RGB NumPy view without copying.
+    
+    The view uses the padded row size as its row stride, a negative row
+    stride for bottom-up files and a reversed channel axis for BGR -> RGB,
+    so no pixel data is touched until the caller reads it. For 32-bit
+    pixels the fourth (unused) byte is skipped.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        data_offset (int): The offset to the pixel data
+        width (int): The image width
+        height (int): The image height (negative for top-down BMPs)
+        bit_count (int): Bits per pixel, 24 or 32 (default: 24)
+        
+    Returns:
+        numpy.ndarray: Read-only view with shape (abs(height), width, 3)
+    """
+    rows = abs(height)
+    bytes_per_pixel = bit_count // 8
+    row_size = padded_row_size(width, bit_count)
+    if data_offset + row_size * rows > len(buffer):
+        raise ValueError(f"Pixel data truncated: need {data_offset + row_size * rows} bytes, "
+                         f"got {len(buffer)}")
+    
+    raw = np.frombuffer(buffer, dtype=np.uint8, count=row_size * rows, offset=data_offset)
+    bgr = raw.reshape(rows, row_size)[:, :width * bytes_per_pixel]
+    bgr = bgr.reshape(rows, width, bytes_per_pixel)
+    if height > 0:
+        # Bottom-up storage: flip rows with a negative stride
+        bgr = bgr[::-1]
+    return bgr[:, :, 2::-1]
+
+# BITMAPFILEHEADER (14 bytes) followed by the first 40 bytes of the info header,
+# unpacked in one call instead of one struct.unpack per field
+_BMP_HEADER_STRUCT = struct.Struct('<2sIHHIIiiHHIIiiII')
+BMP_HEADER_SIZE = _BMP_HEADER_STRUCT.size
+
+class BmpHeader:
+    """
+    Parsed BITMAPFILEHEADER and BITMAPINFOHEADER fields.
+    
+    Instances are created by parse_bmp_header, which fills every field from a
+    single precompiled struct.Struct.unpack_from call over the first 54 bytes
+    of the file.
+    """
+    __slots__ = (
+        'signature', 'file_size', 'reserved1', 'reserved2', 'data_offset',
+        'header_size', 'width', 'height', 'planes', 'bit_count', 'compression',
+        'image_size', 'x_pixels_per_m', 'y_pixels_per_m', 'colors_used',
+        'colors_important',
+    )
+    
+    @property
+    def is_bmp(self):
+        """bool: True if the signature is "BM"."""
+        return self.signature == b'BM'
+    
+    @property
+    def top_down(self):
+        """bool: True if rows are stored top-to-bottom (negative height)."""
+        return self.height < 0
+    
+    @property
+    def abs_height(self):
+        """int: The image height in rows, regardless of row order."""
+        return abs(self.height)
+    
+    @property
+    def row_size(self):
+        """int: Bytes per stored row, including padding."""
+        return padded_row_size(self.width, self.bit_count)
+    
+    @property
+    def pixel_data_size(self):
+        """int: Bytes of uncompressed pixel data, including padding."""
+        return self.row_size * self.abs_height
+    
+    def __repr__(self):
+        return (f"BmpHeader({self.width}x{self.height}, {self.bit_count}-bit, "
+                f"compression={self.compression}, data_offset={self.data_offset})")
+
+def parse_bmp_header(buffer, offset=0):
+    """
+    Parses the 54-byte BMP file and info headers in a single pass.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        offset (int): The offset of the "BM" signature (default: 0)
+        
+    Returns:
+        BmpHeader: The parsed header fields
+    """
+    try:
+        fields = _BMP_HEADER_STRUCT.unpack_from(buffer, offset)
+    except struct.error:
+        raise ValueError(f"BMP header truncated: need {BMP_HEADER_SIZE} bytes, "
+                         f"got {len(buffer) - offset}") from None
+    
+    header = BmpHeader.__new__(BmpHeader)
+    (header.signature, header.file_size, header.reserved1, header.reserved2,
+     header.data_offset, header.header_size, header.width, header.height,
+     header.planes, header.bit_count, header.compression, header.image_size,
+     header.x_pixels_per_m, header.y_pixels_per_m, header.colors_used,
+     header.colors_important) = fields
+    return header
+
+def read_bmp_header(file_path):
+    """
+    Reads and parses only the first 54 bytes of a BMP file.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        
+    Returns:
+        BmpHeader: The parsed header fields
+    """
+    with open(file_path, 'rb') as f:
+        return parse_bmp_header(f.read(BMP_HEADER_SIZE))
+
+# Compression values from the info header (offset 30)
+BI_RGB = 0
+BI_RLE8 = 1
+BI_RLE4 = 2
+BI_BITFIELDS = 3
+BI_ALPHABITFIELDS = 6
+
+# Uncompressed (BI_RGB) bit depths handled by decode_pixels
+INDEXED_BIT_COUNTS = (1, 4, 8)
+DIRECT_BIT_COUNTS = (24, 32)
+SUPPORTED_BIT_COUNTS = INDEXED_BIT_COUNTS + DIRECT_BIT_COUNTS
+
+# Run-length encodings handled by decode_pixels and the bit count each needs
+RLE_BIT_COUNTS = {BI_RLE8: 8, BI_RLE4: 4}
+
+# Bit depths decoded through red/green/blue/alpha channel masks, either
+# explicit (BI_BITFIELDS) or the defaults for BI_RGB
+BITFIELDS_COMPRESSIONS = (BI_BITFIELDS, BI_ALPHABITFIELDS)
+MASKED_BIT_COUNTS = (16, 32)
+
+def unsupported_reason(header, bit_counts=SUPPORTED_BIT_COUNTS, allow_rle=True,
+                       allow_bitfields=False):
+    """
+    Explains why a header cannot be decoded.
+    
+    Args:
+        header (BmpHeader): The parsed header
+        bit_counts (tuple): Accepted bits per pixel for uncompressed images
+            (default: SUPPORTED_BIT_COUNTS)
+        allow_rle (bool): Accept RLE8/RLE4 compressed images (default: True)
+        allow_bitfields (bool): Accept 16-bit and BI_BITFIELDS images, which
+            are decoded through channel masks (default: False)
+        
+    Returns:
+        str: A description of the problem, or None if the image is supported
+    """
+    if not header.is_bmp:
+        return "not a BMP file (signature is not 'BM')"
+    if header.compression == BI_RGB and header.bit_count in bit_counts:
+        return None
+    if allow_rle and RLE_BIT_COUNTS.get(header.compression) == header.bit_count:
+        return None
+    if (allow_bitfields and header.bit_count in MASKED_BIT_COUNTS
+            and header.compression in (BI_RGB,) + BITFIELDS_COMPRESSIONS):
+        return None
+    return f"unsupported {header.bit_count}-bit image with compression {header.compression}"
+
+def _require_decodable(header, file_path, mode, bit_counts=SUPPORTED_BIT_COUNTS, allow_rle=True,
+                       allow_bitfields=False):
+    """
+    Raises ValueError unless the header describes an image the given
+    decoding mode can handle.
+    
+    Args:
+        header (BmpHeader): The parsed header
+        file_path (str): Path used in error messages
+        mode (str): Name of the decoding mode used in error messages
+        bit_counts (tuple): Accepted bits per pixel for uncompressed images
+            (default: SUPPORTED_BIT_COUNTS)
+        allow_rle (bool): Accept RLE8/RLE4 compressed images (default: True)
+        allow_bitfields (bool): Accept 16-bit and BI_BITFIELDS images
+            (default: False)
+    """
+    reason = unsupported_reason(header, bit_counts, allow_rle, allow_bitfields)
+    if reason is not None:
+        raise ValueError(f"{mode} cannot handle {file_path}: {reason}")
+
+# ============================================================================
+# LOGGING AND INSTRUMENTATION
+# ============================================================================
+
+def configure_logging(level=logging.INFO):
+    """
+    Sends the "bmp" logger's messages to the console without decoration.
+    
+    Scripts call this so the pipeline's progress output looks like plain
+    prints. Services can skip it (or pass logging.WARNING) to silence the
+    per-file messages under load.
+    
+    Args:
+        level (int): Logging level (default: logging.INFO)
+    """
+    if not logger.handlers:
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.propagate = False
+    logger.setLevel(level)
+
+class DecodeMetrics:
+    """
+    Collects per-stage durations and counters from the decode pipeline.
+    
+    Install an instance with set_decode_metrics (or collect_decode_metrics)
+    to start recording. Every stage duration is added to an aggregated
+    histogram. Counters (bytes read, pixels decoded, bytes allocated) are
+    summed. Listeners receive one record per decode call with that call's
+    stage timings and counters. When no instance is installed the pipeline
+    only pays for a global lookup per stage.
+    """
+    
+    # Upper bounds in seconds of the stage duration histogram buckets
+    BUCKET_BOUNDS = (0.0001, 0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float('inf'))
+    
+    def __init__(self, listeners=()):
+        """
+        Args:
+            listeners (iterable): Callables that receive a dict per decode call
+        """
+        self.listeners = list(listeners)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.reset()
+    
+    def reset(self):
+        """Clears all aggregated stages and counters."""
+        with self._lock:
+            self.calls = 0
+            self.stages = {}
+            self.counters = {}
+    
+    def add_listener(self, listener):
+        """Registers a callable that receives a dict per decode call."""
+        self.listeners.append(listener)
+    
+    @contextlib.contextmanager
+    def call(self, file_path):
+        """
+        Groups the stages and counters recorded on this thread into one call.
+        
+        Nested calls (e.g. load_bmp_file using decode_bmp_file) are folded into
+        the outermost one.
+        """
+        if getattr(self._local, 'record', None) is not None:
+            yield
+            return
+        
+        record = {"path": str(file_path), "stages": {}, "counters": {}}
+        self._local.record = record
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self._local.record = None
+            record["seconds"] = time.perf_counter() - start
+            with self._lock:
+                self.calls += 1
+            for listener in self.listeners:
+                listener(record)
+    
+    @contextlib.contextmanager
+    def stage(self, name):
+        """Times the enclosed block as one pipeline stage."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record_stage(name, time.perf_counter() - start)
+    
+    def record_stage(self, name, seconds):
+        """Adds one stage duration to the histograms and the current call."""
+        record = getattr(self._local, 'record', None)
+        if record is not None:
+            record["stages"][name] = record["stages"].get(name, 0.0) + seconds
+        
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = {
+                    "count": 0, "total_seconds": 0.0, "max_seconds": 0.0,
+                    "buckets": [0] * len(self.BUCKET_BOUNDS),
+                }
+            stats["count"] += 1
+            stats["total_seconds"] += seconds
+            stats["max_seconds"] = max(stats["max_seconds"], seconds)
+            for i, bound in enumerate(self.BUCKET_BOUNDS):
+                if seconds <= bound:
+                    stats["buckets"][i] += 1
+                    break
+    
+    def count(self, **amounts):
+        """Adds to named counters, e.g. count(bytes_read=1024)."""
+        record = getattr(self._local, 'record', None)
+        if record is not None:
+            for name, amount in amounts.items():
+                record["counters"][name] = record["counters"].get(name, 0) + amount
+        
+        with self._lock:
+            for name, amount in amounts.items():
+                self.counters[name] = self.counters.get(name, 0) + amount
+    
+    def snapshot(self):
+        """
+        Returns:
+            dict: JSON-serializable copy of the aggregated calls, stages and counters
+        """
+        with self._lock:
+            return {
+                "calls": self.calls,
+                "stages": {
+                    name: dict(stats, buckets={
+                        str(bound): count for bound, count in zip(self.BUCKET_BOUNDS, stats["buckets"])
+                    })
+                    for name, stats in self.stages.items()
+                },
+                "counters": dict(self.counters),
+            }
+    
+    def to_prometheus(self, prefix="bmp_decode"):
+        """
+        Renders the aggregated metrics in the Prometheus text exposition format.
+        
+        Returns:
+            str: Histogram series per stage and a total per counter
+        """
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {prefix}_stage_seconds histogram"]
+        for name, stats in snapshot["stages"].items():
+            cumulative = 0
+            for bound, count in stats["buckets"].items():
+                cumulative += count
+                le = "+Inf" if bound == "inf" else bound
+                lines.append(f'{prefix}_stage_seconds_bucket{{stage="{name}",le="{le}"}} {cumulative}')
+            lines.append(f'{prefix}_stage_seconds_sum{{stage="{name}"}} {stats["total_seconds"]}')
+            lines.append(f'{prefix}_stage_seconds_count{{stage="{name}"}} {stats["count"]}')
+        lines.append(f"# TYPE {prefix}_calls_total counter")
+        lines.append(f"{prefix}_calls_total {snapshot['calls']}")
+        for name, total in snapshot["counters"].items():
+            lines.append(f"# TYPE {prefix}_{name}_total counter")
+            lines.append(f"{prefix}_{name}_total {total}")
+        return "\n".join(lines) + "\n"
+
+# The installed DecodeMetrics, or None when instrumentation is off
+_decode_metrics = None
+_NO_OP = contextlib.nullcontext()
+
+def set_decode_metrics(metrics):
+    """
+    Installs (or with None, removes) the process-wide DecodeMetrics.
+    
+    Returns:
+        DecodeMetrics: The previously installed instance, or None
+    """
+    global _decode_metrics
+    previous = _decode_metrics
+    _decode_metrics = metrics
+    return previous
+
+@contextlib.contextmanager
+def collect_decode_metrics(metrics=None):
+    """
+    Records decode metrics for the duration of a with-block.
+    
+    Args:
+        metrics (DecodeMetrics): Instance to record into (default: a new one)
+        
+    Yields:
+        DecodeMetrics: The active instance
+    """
+    metrics = metrics if metrics is not None else DecodeMetrics()
+    previous = set_decode_metrics(metrics)
+    try:
+        yield metrics
+    finally:
+        set_decode_metrics(previous)
+
+def _call(file_path):
+    metrics = _decode_metrics
+    return _NO_OP if metrics is None else metrics.call(file_path)
+
+def _stage(name):
+    metrics = _decode_metrics
+    return _NO_OP if metrics is None else metrics.stage(name)
+
+def _count(**amounts):
+    metrics = _decode_metrics
+    if metrics is not None:
+        metrics.count(**amounts)
+
+# ============================================================================
+# MAIN FUNCTIONS TO IMPLEMENT
+# ============================================================================
+
+def create_random_array(width=100, height=100):
+    """
+    Creates a NumPy array with random RGB values.
+    
+    TODO: Implement this function for Ticket 1
+    - Generate a 2D NumPy array with random RGB values (0-255)
+    - The array should have shape (height, width, 3) for RGB channels
+    - Use numpy.random for generating random values
+    
+    Args:
+        width (int): Width of the array (default: 100)
+        height (int): Height of the array (default: 100)
+        
+    Returns:
+        numpy.ndarray: Array with shape (height, width, 3) containing random RGB values
+    """
+    # TODO: Implement random array creation
+    # 1. Use numpy.random.randint to generate random values (0-255)
+    # 2. Create array with shape (height, width, 3)
+    # 3. Return the array
+    pass
+
+def read_uint32_le(buffer, offset):
+    """
+    Reads a 32-bit unsigned integer from a buffer in little-endian format.
+    
+    Args:
+        buffer (bytes): The buffer to read from
+        offset (int): The offset in the buffer to start reading from
+        
+    Returns:
+        int: The 32-bit unsigned integer value
+    """
+    return struct.unpack('<I', buffer[offset:offset + 4])[0]
+
+def read_int32_le(buffer, offset):
+    """
+    Reads a 32-bit signed integer from a buffer in little-endian format.
+    
+    Args:
+        buffer (bytes): The buffer to read from
+        offset (int): The offset in the buffer to start reading from
+        
+    Returns:
+        int: The 32-bit signed integer value
+    """
+    return struct.unpack('<i', buffer[offset:offset + 4])[0]
+
+def read_uint16_le(buffer, offset):
+    """
+    Reads a 16-bit unsigned integer from a buffer in little-endian format.
+    
+    Args:
+        buffer (bytes): The buffer to read from
+        offset (int): The offset in the buffer to start reading from
+        
+    Returns:
+        int: The 16-bit unsigned integer value
+    """
+    return struct.unpack('<H', buffer[offset:offset + 2])[0]
+
+def load_bmp_and_log_header(file_path):
+    """
+    Parses a BMP file and logs the BITMAPFILEHEADER data.
+    
+    Reads the BMP file into a bytes buffer, parses both headers in a single
+    pass with parse_bmp_header, logs the signature and data offset and then
+    hands over to log_bmp_info_header. On success file_loaded is set to True
+    and the buffer is stored in loaded_file_data for testing.
+    
+    Args:
+        file_path (str): Path to the BMP file to parse
+        
+    Returns:
+        BmpHeader: The parsed header, or None if the file is not a valid BMP
+    """
+    header, buffer = _read_and_log_header(file_path)
+    _publish_loaded_file(buffer)
+    return header
+
+def _read_and_log_header(file_path):
+    """
+    Reentrant core of load_bmp_and_log_header.
+    
+    Returns:
+        tuple: (BmpHeader, bytes), or (None, None) if the file is not a
+        decodable BMP
+    """
+    with _stage("read"):
+        with open(file_path, 'rb') as f:
+            buffer = f.read()
+    _count(bytes_read=len(buffer))
+    
+    with _stage("parse"):
+        header = parse_bmp_header(buffer)
+    logger.info("Signature: 0x%04X (%s)", int.from_bytes(header.signature, 'little'),
+                header.signature.decode('latin-1'))
+    logger.info("Data Offset: %d bytes", header.data_offset)
+    
+    if not header.is_bmp:
+        logger.error("Invalid BMP signature - expected 'BM'")
+        return None, None
+    
+    if not log_bmp_info_header(buffer, header):
+        return None, None
+    return header, buffer
+
+def _publish_loaded_file(buffer):
+    """Records the most recently loaded file for the Ticket 6 test."""
+    global file_loaded, loaded_file_data
+    file_loaded = buffer is not None
+    loaded_file_data = buffer
+
+def log_bmp_info_header(buffer, header=None):
+    """
+    Logs the BITMAPINFOHEADER data from the BMP buffer.
+    
+    Logs the width, height, bit count and compression and validates that the
+    image can be decoded (uncompressed 1/4/8/24/32-bit, or RLE8/RLE4). Pixel
+    extraction is left to the caller so the image is only decoded once.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        header (BmpHeader): Already parsed header to reuse (default: parse
+            it from buffer)
+        
+    Returns:
+        bool: True if the image can be decoded, False otherwise
+    """
+    if header is None:
+        header = parse_bmp_header(buffer)
+    
+    logger.info("Width: %d pixels", header.width)
+    logger.info("Height: %d pixels", header.height)
+    logger.info("Bit Count: %d bits per pixel", header.bit_count)
+    logger.info("Compression: %d", header.compression)
+    
+    reason = unsupported_reason(header, allow_bitfields=True)
+    if reason is not None:
+        logger.error("Cannot decode image: %s", reason)
+        return False
+    return True
+
+def extract_rgb_values(buffer, data_offset, width, height, copy=True, bit_count=24,
+                       output='rgb'):
+    """
+    Extracts RGB values from the BMP pixel data as a NumPy array.
+    
+    The padded, bottom-up BGR rows are first exposed as a strided view over
+    ``buffer`` (see ``bgr_rows_to_rgb_view``). The view is only copied into a
+    new contiguous array when ``copy`` is True, so callers that just need to
+    read pixels can avoid holding the image in memory twice. The copy runs
+    without the GIL, so threads can extract several images at once.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data (bytes, bytearray,
+            memoryview or mmap)
+        data_offset (int): The offset to the pixel data
+        width (int): The image width
+        height (int): The image height (negative for top-down BMPs)
+        copy (bool): Return a contiguous copy instead of a view (default: True)
+        bit_count (int): Bits per pixel, 24 or 32 (default: 24)
+        output (str): Layout to produce, one of OUTPUT_FORMATS (default: 'rgb').
+            Other layouts are written band by band straight from the BGR
+            bytes into a preallocated array; see decode_output.
+        
+    Returns:
+        numpy.ndarray: Array with shape (height, width, 3) containing RGB values,
+        or the requested output layout
+    """
+    if output != 'rgb':
+        if not copy:
+            raise ValueError(f"Only 'rgb' output can be returned as a view, not {output!r}")
+        out = _extract_output(buffer, data_offset, width, height, bit_count, output)
+        _count(bytes_allocated=out.nbytes)
+        return out
+    
+    rgb_view = bgr_rows_to_rgb_view(buffer, data_offset, width, height, bit_count)
+    if not copy:
+        return rgb_view
+    
+    # Per-channel strided copies are several times faster than copying through
+    # the reversed channel axis, and NumPy releases the GIL while they run
+    rgb_values = np.empty(rgb_view.shape, dtype=np.uint8)
+    for channel in range(3):
+        np.copyto(rgb_values[:, :, channel], rgb_view[:, :, channel])
+    _count(bytes_allocated=rgb_values.nbytes)
+    return rgb_values
+
+def render_rgb_to_image(rgb_values, width, height, show=False):
+    """
+    Renders RGB data as a PIL Image.
+    
+    Args:
+        rgb_values (numpy.ndarray): Array with shape (height, width, 3) containing
+            RGB values, or (height, width, 4) for RGBA
+        width (int): The image width
+        height (int): The image height
+        show (bool): Open the image in the system viewer (default: False, so
+            servers and batch jobs stay headless)
+        
+    Returns:
+        PIL.Image.Image: The rendered image ('RGBA' if an alpha channel is given)
+    """
+    rgb_values = np.asarray(rgb_values, dtype=np.uint8)
+    image = Image.fromarray(rgb_values, 'RGBA' if rgb_values.shape[-1] == 4 else 'RGB')
+    if show:
+        image.show()
+    return image
+
+# PIL raw decoder modes for the uncompressed bit depths render_bmp_buffer handles
+_PIL_RAW_MODES = {1: ('P', 'P;1'), 4: ('P', 'P;4'), 8: ('P', 'P'), 24: ('RGB', 'BGR'), 32: ('RGB', 'BGRX')}
+
+def render_bmp_buffer(buffer, header, show=False):
+    """
+    Renders the pixel data of an uncompressed BMP straight into a PIL Image.
+    
+    Image.frombuffer's raw decoder reads the BGR (or palette index) rows
+    directly from the BMP bytes, using the padded row size as the stride and
+    orientation -1 for bottom-up files. This skips the NumPy flip and the
+    intermediate RGB array that decode_pixels + render_rgb_to_image need, so
+    one full-image copy per file is saved. Indexed images are converted to
+    RGB through their color table.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        header (BmpHeader): The parsed header
+        show (bool): Open the image in the system viewer (default: False)
+        
+    Returns:
+        PIL.Image.Image: An 'RGB' image
+    """
+    if header.compression != BI_RGB or header.bit_count not in _PIL_RAW_MODES:
+        raise ValueError(f"Cannot render {header.bit_count}-bit data with compression "
+                         f"{header.compression} directly from the buffer")
+    
+    mode, raw_mode = _PIL_RAW_MODES[header.bit_count]
+    size = (header.width, header.abs_height)
+    start = header.data_offset
+    pixel_data = memoryview(buffer)[start:start + header.pixel_data_size]
+    image = Image.frombuffer(mode, size, pixel_data, 'raw', raw_mode, header.row_size,
+                             1 if header.top_down else -1)
+    
+    if mode == 'P':
+        image.putpalette(read_color_table(buffer, header).tobytes())
+        image = image.convert('RGB')
+    
+    if show:
+        image.show()
+    return image
+
+def load_bmp_file(file_path, use_mmap=False, cache=None, show=False):
+    """
+    Complete BMP file loading and processing pipeline.
+    This function demonstrates the complete workflow.
+    
+    Uncompressed files are rendered straight from the file bytes with
+    render_bmp_buffer; RLE files go through decode_pixels.
+    
+    Args:
+        file_path (str): Path to the BMP file to load
+        use_mmap (bool): Decode through load_bmp_mmap instead of reading the
+            whole file into memory (default: False)
+        cache (DecodedImageCache): Reuse decoded pixels from this cache when
+            the file is unchanged (default: no caching)
+        show (bool): Open the image in the system viewer (default: False)
+        
+    Returns:
+        PIL.Image.Image: The rendered image, or None if failed
+    """
+    try:
+        with _call(file_path):
+            return _load_bmp_file(file_path, use_mmap, cache, show)
+    except Exception as e:
+        logger.error("Error loading BMP file: %s", e)
+        return None
+
+def _load_bmp_file(file_path, use_mmap, cache, show):
+    logger.info("Loading BMP file: %s", file_path)
+    
+    if cache is not None or use_mmap:
+        # Fast paths that bypass the logging pipeline and global state
+        if cache is not None:
+            _, rgb_values = decode_bmp_file(file_path, cache=cache)
+        else:
+            with _stage("map"):
+                rgb_values = load_bmp_mmap(file_path)
+            _count(pixels_decoded=rgb_values.shape[0] * rgb_values.shape[1])
+        height, width = rgb_values.shape[:2]
+    else:
+        # Load and parse the BMP file. The buffer is kept local so concurrent
+        # calls cannot see each other's data through the globals.
+        header, buffer = _read_and_log_header(file_path)
+        _publish_loaded_file(buffer)
+        if header is None:
+            logger.error("Failed to load BMP file")
+            return None
+        
+        width = header.width
+        height = header.abs_height
+        _count(pixels_decoded=width * height)
+        
+        if header.compression == BI_RGB and header.bit_count in _PIL_RAW_MODES:
+            with _stage("render"):
+                image = render_bmp_buffer(buffer, header, show=show)
+            logger.info("Successfully loaded and rendered %dx%d image", width, height)
+            return image
+        
+        # RLE and channel-mask data has to be expanded before it can be rendered
+        with _stage("extract"):
+            rgb_values = decode_pixels(buffer, header)
+    
+    # Render to image
+    with _stage("render"):
+        image = render_rgb_to_image(rgb_values, width, height, show=show)
+    
+    logger.info("Successfully loaded and rendered %dx%d image", width, height)
+    return image
+
+def decode_bmp_file(file_path, cache=None, output='rgb'):
+    """
+    Reads and decodes a BMP file without logging or touching global state.
+    
+    This is the quiet counterpart of load_bmp_file for batch jobs and worker
+    processes: it returns the pixels instead of rendering them.
+    
+    Args:
+        file_path (str): Path to the BMP file to decode
+        cache (DecodedImageCache): Cache to look up and store the result in
+            (default: no caching). Cached arrays are read-only.
+        output (str): Layout to decode into, one of OUTPUT_FORMATS
+            (default: 'rgb'). The cache only holds 'rgb' results.
+        
+    Returns:
+        tuple: (BmpHeader, numpy.ndarray) with the RGB array shaped (height, width, 3)
+        or the requested output layout
+    """
+    if cache is not None and output != 'rgb':
+        raise ValueError(f"The decoded image cache only holds 'rgb' output, not {output!r}")
+    
+    with _call(file_path):
+        with _stage("read"):
+            with open(file_path, 'rb') as f:
+                if cache is not None:
+                    # Key on the stat of the open file so a concurrent rewrite
+                    # cannot pair new contents with an old key
+                    key = cache.make_key(file_path, os.fstat(f.fileno()))
+                    cached = cache.get(key)
+                    if cached is not None:
+                        return cached
+                buffer = f.read()
+        _count(bytes_read=len(buffer))
+        
+        with _stage("parse"):
+            header = parse_bmp_header(buffer)
+            _require_decodable(header, file_path, "Decoding", allow_bitfields=True)
+        with _stage("extract"):
+            rgb_values = decode_pixels(buffer, header, output=output)
+        _count(pixels_decoded=header.width * header.abs_height)
+        
+        if cache is not None:
+            return cache.put(key, header, rgb_values)
+        return header, rgb_values
+
+# ============================================================================
+# BULK FIELD READERS
+# ============================================================================
+
+# The 54 bytes unpacked by _BMP_HEADER_STRUCT as packed NumPy record fields,
+# so many headers can be decoded with one np.frombuffer call. The dtype is
+# built on first use (bmp_header_dtype) so importing this module does not
+# load NumPy.
+_BMP_HEADER_FIELDS = [
+    ('signature', 'S2'), ('file_size', '<u4'), ('reserved1', '<u2'), ('reserved2', '<u2'),
+    ('data_offset', '<u4'), ('header_size', '<u4'), ('width', '<i4'), ('height', '<i4'),
+    ('planes', '<u2'), ('bit_count', '<u2'), ('compression', '<u4'), ('image_size', '<u4'),
+    ('x_pixels_per_m', '<i4'), ('y_pixels_per_m', '<i4'), ('colors_used', '<u4'),
+    ('colors_important', '<u4'),
+]
+
+@functools.lru_cache(maxsize=None)
+def bmp_header_dtype():
+    """
+    Returns the packed 54-byte numpy.dtype of a BMP header record, with the
+    same field names as BmpHeader. Also available as BMP_HEADER_DTYPE.
+    """
+    return np.dtype(_BMP_HEADER_FIELDS)
+
+def __getattr__(name):
+    # BMP_HEADER_DTYPE is resolved on first access to keep NumPy unloaded
+    if name == 'BMP_HEADER_DTYPE':
+        return bmp_header_dtype()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def _read_records(buffer, dtype, offsets=None, start=0, stride=None, count=None):
+    """
+    Reads one dtype-sized record at each of many byte offsets.
+    
+    Either offsets gives arbitrary (possibly unaligned) positions, or start,
+    stride and count describe evenly spaced records. The strided form is a
+    single np.frombuffer view; the offsets form gathers the bytes of every
+    record with one fancy-indexing operation.
+    """
+    dtype = np.dtype(dtype)
+    data = np.frombuffer(buffer, dtype=np.uint8)
+    
+    if offsets is None:
+        stride = dtype.itemsize if stride is None else stride
+        if stride <= 0:
+            raise ValueError(f"Record stride must be positive, got {stride}")
+        if count is None:
+            count = max(0, (len(data) - start - dtype.itemsize) // stride + 1)
+        if count and (start < 0 or start + (count - 1) * stride + dtype.itemsize > len(data)):
+            raise ValueError(f"{count} records of {dtype.itemsize} bytes every {stride} "
+                             f"bytes from offset {start} do not fit in {len(data)} bytes")
+        # Records are read through a strided view and copied out once
+        records = np.ndarray((count,), dtype=dtype, buffer=data, offset=start,
+                             strides=(stride,))
+        return records.copy()
+    
+    offsets = np.asarray(offsets, dtype=np.intp)
+    if offsets.size and (offsets.min() < 0 or offsets.max() + dtype.itemsize > len(data)):
+        raise ValueError(f"Offsets must lie within the {len(data)}-byte buffer "
+                         f"minus the {dtype.itemsize}-byte field size")
+    raw = data[offsets[..., np.newaxis] + np.arange(dtype.itemsize)]
+    return raw.view(dtype).reshape(offsets.shape)
+
+def read_uint32_le_many(buffer, offsets=None, start=0, stride=4, count=None):
+    """
+    Reads many 32-bit unsigned little-endian integers in one call.
+    
+    Vectorized counterpart of read_uint32_le. Pass either an array of byte
+    offsets, or start/stride/count for evenly spaced fields (e.g. the same
+    field of consecutive fixed-size records).
+    
+    Args:
+        buffer (bytes): The buffer to read from
+        offsets (array-like): Byte offsets of the fields (default: use stride)
+        start (int): Offset of the first field when offsets is None
+        stride (int): Bytes between consecutive fields (default: 4)
+        count (int): Number of fields (default: as many as fit)
+        
+    Returns:
+        numpy.ndarray: uint32 values, shaped like offsets
+    """
+    return _read_records(buffer, '<u4', offsets, start, stride, count)
+
+def read_int32_le_many(buffer, offsets=None, start=0, stride=4, count=None):
+    """
+    Reads many 32-bit signed little-endian integers in one call.
+    
+    Vectorized counterpart of read_int32_le; see read_uint32_le_many.
+    
+    Returns:
+        numpy.ndarray: int32 values, shaped like offsets
+    """
+    return _read_records(buffer, '<i4', offsets, start, stride, count)
+
+def read_uint16_le_many(buffer, offsets=None, start=0, stride=2, count=None):
+    """
+    Reads many 16-bit unsigned little-endian integers in one call.
+    
+    Vectorized counterpart of read_uint16_le; see read_uint32_le_many.
+    
+    Returns:
+        numpy.ndarray: uint16 values, shaped like offsets
+    """
+    return _read_records(buffer, '<u2', offsets, start, stride, count)
+
+def parse_bmp_headers(buffer, offsets=None, start=0, stride=BMP_HEADER_SIZE, count=None):
+    """
+    Parses many 54-byte BMP headers from one buffer into a structured array.
+    
+    Vectorized counterpart of parse_bmp_header for archive blobs or packed
+    header dumps. Fields have the same names as BmpHeader, so queries such
+    as ``headers['width'] > 4000`` run over every header at once.
+    
+    Args:
+        buffer (bytes): The buffer containing the headers
+        offsets (array-like): Byte offset of each header (default: use stride)
+        start (int): Offset of the first header when offsets is None
+        stride (int): Bytes between consecutive headers (default: 54)
+        count (int): Number of headers (default: as many as fit)
+        
+    Returns:
+        numpy.ndarray: Records of BMP_HEADER_DTYPE, shaped like offsets
+    """
+    return _read_records(buffer, bmp_header_dtype(), offsets, start, stride, count)
+
+# ============================================================================
+# OUTPUT LAYOUTS
+# ============================================================================
+
+# Layouts the decoders can produce directly:
+#   rgb      (height, width, 3) uint8, interleaved
+#   gray     (height, width) uint8 luminance
+#   planar   (3, height, width) uint8, one plane per channel
+#   float32  (height, width, 3) float32 scaled to 0.0-1.0
+OUTPUT_FORMATS = ('rgb', 'gray', 'planar', 'float32')
+
+# Rec. 601 luma weights scaled to sum to 256
+LUMA_WEIGHTS = (77, 150, 29)
+
+# Rows converted per step; keeps band temporaries small and in cache
+OUTPUT_BAND_ROWS = 256
+
+def _luma(band):
+    """Returns the uint16 luminance (0-255) of a (rows, width, 3+) uint8 band."""
+    luma = band[:, :, 0].astype(np.uint16)
+    luma *= LUMA_WEIGHTS[0]
+    term = np.empty_like(luma)
+    for channel in (1, 2):
+        np.multiply(band[:, :, channel], LUMA_WEIGHTS[channel], out=term, dtype=np.uint16)
+        luma += term
+    luma += 128
+    luma >>= 8
+    return luma
+
+def _allocate_output(output, rows, width, channels=3):
+    """Allocates the array for a decode into one of OUTPUT_FORMATS."""
+    if output == 'rgb':
+        return np.empty((rows, width, channels), dtype=np.uint8)
+    if output == 'gray':
+        return np.empty((rows, width), dtype=np.uint8)
+    if output == 'planar':
+        return np.empty((channels, rows, width), dtype=np.uint8)
+    if output == 'float32':
+        return np.empty((rows, width, channels), dtype=np.float32)
+    raise ValueError(f"Unknown output {output!r}, expected one of {', '.join(OUTPUT_FORMATS)}")
+
+def _write_output_band(band, out, top, output):
+    """
+    Converts a top-down RGB(A) band (often a strided view over the file
+    bytes) into rows [top, top + len(band)) of a preallocated output.
+    """
+    rows = slice(top, top + band.shape[0])
+    if output == 'gray':
+        np.copyto(out[rows], _luma(band), casting='unsafe')
+        return
+    for channel in range(band.shape[2]):
+        source = band[:, :, channel]
+        if output == 'planar':
+            np.copyto(out[channel, rows], source)
+        elif output == 'float32':
+            np.divide(source, np.float32(255), out=out[rows, :, channel], dtype=np.float32)
+        else:
+            np.copyto(out[rows, :, channel], source)
+
+def _extract_output(buffer, data_offset, width, height, bit_count, output):
+    """extract_rgb_values for layouts other than interleaved RGB."""
+    rows = abs(height)
+    row_size = padded_row_size(width, bit_count)
+    out = _allocate_output(output, rows, width)
+    for top in range(0, rows, OUTPUT_BAND_ROWS):
+        band_rows = min(OUTPUT_BAND_ROWS, rows - top)
+        stored_row = top if height < 0 else rows - top - band_rows
+        band = bgr_rows_to_rgb_view(buffer, data_offset + stored_row * row_size, width,
+                                    -band_rows if height < 0 else band_rows, bit_count)
+        _write_output_band(band, out, top, output)
+    return out
+
+def decode_output(buffer, header, output, palette=None, data_offset=None, height=None,
+                  masks=None):
+    """
+    Decodes pixel data straight into one of OUTPUT_FORMATS.
+    
+    The image is walked in bands of OUTPUT_BAND_ROWS rows. 24/32-bit bands
+    are strided views over the padded BGR bytes, so they are converted
+    without any copy in between. Indexed and channel-mask bands are expanded
+    one band at a time. In every case the only full-size allocation is the
+    output itself.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        header (BmpHeader): The parsed header
+        output (str): One of OUTPUT_FORMATS
+        palette, data_offset, height, masks: As for decode_pixels
+        
+    Returns:
+        numpy.ndarray: The decoded image in the requested layout; images with
+        alpha keep it as a fourth channel in the rgb, planar and float32 layouts
+    """
+    if data_offset is None:
+        data_offset = header.data_offset
+    if height is None:
+        height = header.height
+    rows = abs(height)
+    width = header.width
+    
+    indices = None
+    channels = 3
+    if header.bit_count in INDEXED_BIT_COUNTS:
+        if palette is None:
+            palette = read_color_table(buffer, header)
+        if header.compression in RLE_BIT_COUNTS:
+            # RLE rows cannot be located without decoding, so expand the
+            # (one byte per pixel) indices first
+            indices = decode_pixels(buffer, header, palette=palette, data_offset=data_offset,
+                                    height=height, raw_palette=True)[0]
+    elif _uses_channel_masks(header):
+        if masks is None:
+            masks = read_channel_masks(buffer, header)
+        channels = 4 if masks[3] else 3
+    
+    out = _allocate_output(output, rows, width, channels)
+    row_size = header.row_size
+    for top in range(0, rows, OUTPUT_BAND_ROWS):
+        band_rows = min(OUTPUT_BAND_ROWS, rows - top)
+        if indices is not None:
+            band = np.take(palette, indices[top:top + band_rows], axis=0)
+        else:
+            stored_row = top if height < 0 else rows - top - band_rows
+            band = _band_rgb(buffer, header, data_offset + stored_row * row_size,
+                             -band_rows if height < 0 else band_rows, palette, masks)
+        _write_output_band(band, out, top, output)
+    return out
+
+def _band_rgb(buffer, header, band_offset, band_height, palette=None, masks=None):
+    """
+    Returns a band of uncompressed rows as top-down RGB(A): a strided view
+    for 24/32-bit data, a band-sized array for indexed and masked data.
+    """
+    if masks is not None:
+        return extract_masked_values(buffer, band_offset, header.width, band_height,
+                                     header.bit_count, masks)
+    if palette is not None:
+        return np.take(palette, extract_palette_indices(
+            buffer, band_offset, header.width, band_height, header.bit_count), axis=0)
+    return bgr_rows_to_rgb_view(buffer, band_offset, header.width, band_height,
+                                header.bit_count)
+
+# ============================================================================
+# PALETTE-INDEXED DECODING
+# ============================================================================
+
+def read_color_table(buffer, header):
+    """
+    Reads the color table that follows the info header of an indexed BMP.
+    
+    Each entry is stored as 4 bytes (blue, green, red, reserved). The table
+    is always padded to 2 ** bit_count entries so corrupt indices map to
+    black instead of failing the lookup.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data (at least up to the
+            pixel data offset)
+        header (BmpHeader): The parsed header
+        
+    Returns:
+        numpy.ndarray: Array with shape (2 ** bit_count, 3) containing RGB values
+    """
+    max_colors = 1 << header.bit_count
+    num_colors = min(header.colors_used or max_colors, max_colors)
+    table_offset = 14 + header.header_size
+    if table_offset + num_colors * 4 > len(buffer):
+        raise ValueError(f"Color table truncated: need {num_colors} entries at offset "
+                         f"{table_offset}, got {len(buffer)} bytes")
+    
+    entries = np.frombuffer(buffer, dtype=np.uint8, count=num_colors * 4,
+                            offset=table_offset).reshape(num_colors, 4)
+    palette = np.zeros((max_colors, 3), dtype=np.uint8)
+    palette[:num_colors] = entries[:, 2::-1]
+    return palette
+
+def extract_palette_indices(buffer, data_offset, width, height, bit_count):
+    """
+    Extracts the color-table indices of a 1, 4 or 8-bit BMP.
+    
+    Whole rows are unpacked at once: np.unpackbits for 1-bit images and
+    nibble shifts for 4-bit images, with no per-pixel Python loops.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        data_offset (int): The offset to the pixel data
+        width (int): The image width
+        height (int): The image height (negative for top-down BMPs)
+        bit_count (int): Bits per pixel (1, 4 or 8)
+        
+    Returns:
+        numpy.ndarray: Array with shape (abs(height), width) of uint8 indices
+    """
+    rows = abs(height)
+    row_size = padded_row_size(width, bit_count)
+    if data_offset + row_size * rows > len(buffer):
+        raise ValueError(f"Pixel data truncated: need {data_offset + row_size * rows} bytes, "
+                         f"got {len(buffer)}")
+    
+    packed = np.frombuffer(buffer, dtype=np.uint8, count=row_size * rows,
+                           offset=data_offset).reshape(rows, row_size)
+    if height > 0:
+        packed = packed[::-1]
+    
+    return _unpack_index_rows(packed, width, bit_count)
+
+def _unpack_index_rows(packed, width, bit_count, skip=0):
+    """
+    Unpacks rows of packed 1, 4 or 8-bit indices into one index per pixel.
+    
+    Args:
+        packed (numpy.ndarray): uint8 array with one packed row per line
+        width (int): Number of pixels to return per row
+        bit_count (int): Bits per pixel (1, 4 or 8)
+        skip (int): Pixels to drop from the start of each packed row (default: 0)
+        
+    Returns:
+        numpy.ndarray: Array with shape (rows, width) of uint8 indices
+    """
+    if bit_count == 8:
+        return np.ascontiguousarray(packed[:, skip:skip + width])
+    if bit_count == 4:
+        packed = packed[:, :(skip + width + 1) // 2]
+        indices = np.empty((packed.shape[0], packed.shape[1] * 2), dtype=np.uint8)
+        np.right_shift(packed, 4, out=indices[:, 0::2])
+        np.bitwise_and(packed, 0x0F, out=indices[:, 1::2])
+        return np.ascontiguousarray(indices[:, skip:skip + width])
+    if bit_count == 1:
+        indices = np.unpackbits(packed, axis=1, count=skip + width)
+        return np.ascontiguousarray(indices[:, skip:]) if skip else indices
+    raise ValueError(f"Unsupported indexed bit count: {bit_count}")
+
+def decode_pixels(buffer, header, palette=None, data_offset=None, height=None,
+                  raw_palette=False, masks=None, output='rgb'):
+    """
+    Decodes the pixel data described by a header into RGB values.
+    
+    Dispatches on the bit count: 24/32-bit data goes through extract_rgb_values
+    and 1/4/8-bit data is mapped through the color table with a single
+    np.take lookup. RLE8/RLE4 data is first expanded by decode_rle_indices.
+    16-bit and BI_BITFIELDS data goes through extract_masked_values.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        header (BmpHeader): The parsed header
+        palette (numpy.ndarray): Color table to use for indexed images
+            (default: read it from buffer)
+        data_offset (int): Override for the pixel data offset, e.g. when
+            buffer only holds a band of rows (default: header.data_offset)
+        height (int): Override for the number of stored rows, negative for
+            top-down (default: header.height)
+        raw_palette (bool): For indexed images, return (indices, palette)
+            instead of expanding to RGB (default: False)
+        masks (tuple): Channel masks to use for 16-bit and BI_BITFIELDS
+            images (default: read them from buffer)
+        output (str): Layout to produce, one of OUTPUT_FORMATS (default:
+            'rgb'); other layouts are decoded by decode_output
+        
+    Returns:
+        numpy.ndarray: Array with shape (abs(height), width, 3) containing RGB
+        values (or (abs(height), width, 4) RGBA values for images with an
+        alpha mask), or an (indices, palette) tuple when raw_palette is True
+    """
+    if output != 'rgb' and not raw_palette:
+        out = decode_output(buffer, header, output, palette=palette, data_offset=data_offset,
+                            height=height, masks=masks)
+        _count(bytes_allocated=out.nbytes)
+        return out
+    
+    if data_offset is None:
+        data_offset = header.data_offset
+    if height is None:
+        height = header.height
+    
+    if _uses_channel_masks(header):
+        if masks is None:
+            masks = read_channel_masks(buffer, header)
+        rgb_values = extract_masked_values(buffer, data_offset, header.width, height,
+                                           header.bit_count, masks)
+        _count(bytes_allocated=rgb_values.nbytes)
+        return rgb_values
+    
+    if header.bit_count in DIRECT_BIT_COUNTS:
+        # extract_rgb_values records its own allocation
+        return extract_rgb_values(buffer, data_offset, header.width, height,
+                                  bit_count=header.bit_count)
+    
+    if header.bit_count in INDEXED_BIT_COUNTS:
+        if palette is None:
+            palette = read_color_table(buffer, header)
+        if header.compression in RLE_BIT_COUNTS:
+            end = data_offset + header.image_size if header.image_size else len(buffer)
+            indices = decode_rle_indices(memoryview(buffer)[data_offset:end], header.width,
+                                         height, header.bit_count)
+        else:
+            indices = extract_palette_indices(buffer, data_offset, header.width, height,
+                                              header.bit_count)
+        if raw_palette:
+            return indices, palette
+        rgb_values = np.take(palette, indices, axis=0)
+        _count(bytes_allocated=rgb_values.nbytes)
+        return rgb_values
+    
+    raise ValueError(f"Unsupported bit count: {header.bit_count}")
+
+# ============================================================================
+# BITFIELDS DECODING
+# ============================================================================
+
+# Channel masks (red, green, blue, alpha) implied by BI_RGB at each depth
+DEFAULT_CHANNEL_MASKS = {16: (0x7C00, 0x03E0, 0x001F, 0), 32: (0xFF0000, 0xFF00, 0xFF, 0)}
+
+# BI_BITFIELDS masks follow the 40-byte info header, which is also where
+# V2-V5 headers store them
+_MASKS_OFFSET = 14 + 40
+
+def _uses_channel_masks(header):
+    """True for images decoded by extract_masked_values."""
+    return header.bit_count == 16 or header.compression in BITFIELDS_COMPRESSIONS
+
+def read_channel_masks(buffer, header):
+    """
+    Reads the red, green, blue and alpha channel masks of a 16/32-bit BMP.
+    
+    BI_BITFIELDS stores three masks right after the 40-byte info header;
+    V3+ headers (56 bytes and up) and BI_ALPHABITFIELDS add an alpha mask.
+    Uncompressed images use the default 5-5-5 or 8-8-8 layout without alpha.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data (at least up to the
+            pixel data offset)
+        header (BmpHeader): The parsed header
+        
+    Returns:
+        tuple: (red, green, blue, alpha) masks; alpha is 0 if absent
+    """
+    if header.compression not in BITFIELDS_COMPRESSIONS:
+        return DEFAULT_CHANNEL_MASKS[header.bit_count]
+    
+    count = 4 if header.header_size >= 56 or header.compression == BI_ALPHABITFIELDS else 3
+    if _MASKS_OFFSET + 4 * count > len(buffer):
+        raise ValueError(f"Channel masks truncated: need {_MASKS_OFFSET + 4 * count} bytes, "
+                         f"got {len(buffer)}")
+    masks = struct.unpack_from(f'<{count}I', buffer, _MASKS_OFFSET)
+    return masks + (0,) * (4 - count)
+
+def _mask_shift_and_max(mask):
+    """Returns the shift of a mask's lowest set bit and the channel's maximum value."""
+    if mask == 0:
+        return 0, 0
+    shift = (mask & -mask).bit_length() - 1
+    return shift, mask >> shift
+
+def _scale_channel(pixels, mask):
+    """Extracts one masked channel from an integer pixel array, scaled to 0-255."""
+    shift, maximum = _mask_shift_and_max(mask)
+    if maximum == 0:
+        return np.zeros(pixels.shape, dtype=np.uint8)
+    values = (pixels & mask) >> shift
+    if maximum == 255:
+        return values.astype(np.uint8)
+    if maximum <= 0xFFFF:
+        # Round to the nearest 8-bit value through a small per-channel table
+        scale = (np.arange(maximum + 1, dtype=np.uint32) * 255 + maximum // 2) // maximum
+        return scale.astype(np.uint8)[values]
+    # Wide channels: uint64 keeps the multiplication from overflowing
+    return ((values.astype(np.uint64) * 255 + maximum // 2) // maximum).astype(np.uint8)
+
+@functools.lru_cache(maxsize=8)
+def _mask_lut(masks):
+    """
+    Builds the 65536-entry lookup table that maps every 16-bit pixel value
+    to its RGB (or RGBA) bytes. Tables are cached per mask layout, so a
+    batch of 565 images builds the table once.
+    """
+    channels = 4 if masks[3] else 3
+    values = np.arange(1 << 16, dtype=np.uint32)
+    lut = np.empty((1 << 16, channels), dtype=np.uint8)
+    for channel in range(channels):
+        lut[:, channel] = _scale_channel(values, masks[channel])
+    lut.flags.writeable = False
+    return lut
+
+def extract_masked_values(buffer, data_offset, width, height, bit_count, masks):
+    """
+    Extracts RGB(A) values from 16 or 32-bit pixels using channel masks.
+    
+    Shifts and scales are derived from the masks once per call. 16-bit
+    pixels are mapped through a 65536-entry lookup table with a single
+    np.take. 32-bit channels whose mask covers a whole byte (the usual BGRA
+    layout) are copied straight from that byte. Any other mask is applied
+    to the whole image with one vectorized mask/shift/scale pass.
+    
+    Args:
+        buffer (bytes): The buffer containing BMP data
+        data_offset (int): The offset to the pixel data
+        width (int): The image width
+        height (int): The image height (negative for top-down BMPs)
+        bit_count (int): 16 or 32 bits per pixel
+        masks (tuple): (red, green, blue, alpha) masks, alpha 0 if absent
+        
+    Returns:
+        numpy.ndarray: Array with shape (abs(height), width, 3) containing RGB
+        values, or (abs(height), width, 4) with alpha when the alpha mask is set
+    """
+    if bit_count not in MASKED_BIT_COUNTS:
+        raise ValueError(f"Channel masks need 16 or 32-bit pixels, got {bit_count}-bit")
+    
+    rows = abs(height)
+    bytes_per_pixel = bit_count // 8
+    row_size = padded_row_size(width, bit_count)
+    if data_offset + row_size * rows > len(buffer):
+        raise ValueError(f"Pixel data truncated: need {data_offset + row_size * rows} bytes, "
+                         f"got {len(buffer)}")
+    
+    raw = np.frombuffer(buffer, dtype=np.uint8, count=row_size * rows, offset=data_offset)
+    pixel_bytes = raw.reshape(rows, row_size)[:, :width * bytes_per_pixel]
+    if height > 0:
+        pixel_bytes = pixel_bytes[::-1]
+    pixels = pixel_bytes.view('<u2' if bit_count == 16 else '<u4')
+    
+    masks = tuple(masks)
+    if bit_count == 16:
+        return np.take(_mask_lut(masks), pixels, axis=0)
+    
+    channels = 4 if masks[3] else 3
+    values = np.empty((rows, width, channels), dtype=np.uint8)
+    pixel_bytes = pixel_bytes.reshape(rows, width, 4)
+    for channel in range(channels):
+        mask = masks[channel]
+        if mask in (0xFF, 0xFF00, 0xFF0000, 0xFF000000):
+            np.copyto(values[:, :, channel], pixel_bytes[:, :, _mask_shift_and_max(mask)[0] // 8])
+        else:
+            values[:, :, channel] = _scale_channel(pixels, mask)
+    return values
+
+# ============================================================================
+# RLE DECOMPRESSION
+# ============================================================================
+
+# Each byte of an RLE4 absolute run expanded to its two 4-bit indices
+_NIBBLE_PAIRS = [bytes((value >> 4, value & 0x0F)) for value in range(256)]
+
+def decode_rle_indices(data, width, height, bit_count):
+    """
+    Decompresses BI_RLE8 or BI_RLE4 pixel data into color-table indices.
+    
+    The output buffer is allocated once from width x height and every run
+    is written with a single slice assignment. End-of-line, end-of-bitmap
+    and delta escapes are handled; pixels skipped by escapes keep index 0.
+    Runs that overflow a row are clipped to the row.
+    
+    Args:
+        data (bytes): The compressed pixel data
+        width (int): The image width
+        height (int): The image height (RLE bitmaps are always bottom-up)
+        bit_count (int): 8 for RLE8, 4 for RLE4
+        
+    Returns:
+        numpy.ndarray: Array with shape (height, width) of uint8 indices
+    """
+    if height < 0:
+        raise ValueError("RLE-compressed BMPs cannot be stored top-down")
+    if bit_count not in (4, 8):
+        raise ValueError(f"RLE needs a 4 or 8-bit image, got {bit_count}-bit")
+    
+    data = bytes(data)
+    size = len(data)
+    indices = bytearray(width * height)
+    x = y = pos = 0
+    
+    while y < height:
+        if pos + 2 > size:
+            raise ValueError(f"RLE data truncated at byte {pos} (row {y} of {height})")
+        count = data[pos]
+        value = data[pos + 1]
+        pos += 2
+        
+        if count:
+            # Encoded run: repeat one index (RLE8) or alternate two (RLE4)
+            count = max(0, min(count, width - x))
+            start = y * width + x
+            if bit_count == 8:
+                indices[start:start + count] = bytes((value,)) * count
+            else:
+                indices[start:start + count] = (_NIBBLE_PAIRS[value] * ((count + 1) // 2))[:count]
+            x += count
+        elif value == 0:
+            # End of line
+            x = 0
+            y += 1
+        elif value == 1:
+            # End of bitmap
+            break
+        elif value == 2:
+            # Delta: move right and up
+            if pos + 2 > size:
+                raise ValueError(f"RLE delta escape truncated at byte {pos}")
+            x += data[pos]
+            y += data[pos + 1]
+            pos += 2
+        else:
+            # Absolute run of `value` literal indices, padded to a 16-bit boundary
+            num_bytes = value if bit_count == 8 else (value + 1) // 2
+            if pos + num_bytes > size:
+                raise ValueError(f"RLE absolute run truncated at byte {pos}")
+            literal = data[pos:pos + num_bytes]
+            if bit_count == 4:
+                literal = b''.join([_NIBBLE_PAIRS[byte] for byte in literal])[:value]
+            pos += num_bytes + (num_bytes & 1)
+            
+            count = min(value, width - x)
+            if count > 0:
+                start = y * width + x
+                indices[start:start + count] = literal[:count]
+            x += value
+    
+    # Rows were decoded bottom-up; flip to top-down
+    return np.frombuffer(indices, dtype=np.uint8).reshape(height, width)[::-1].copy()
+
+# ============================================================================
+# DECODED IMAGE CACHE
+# ============================================================================
+
+class DecodedImageCache:
+    """
+    Thread-safe LRU cache of decoded images with a byte budget.
+    
+    Entries are keyed by (absolute path, size, mtime_ns), so a rewritten file
+    is decoded again instead of being served stale. Least recently used
+    entries are evicted once the stored pixel bytes exceed max_bytes. Cached
+    arrays are marked read-only because every caller shares them.
+    """
+    
+    def __init__(self, max_bytes=256 * 1024 * 1024):
+        """
+        Args:
+            max_bytes (int): Budget for the pixel bytes of all cached images
+                (default: 256 MiB)
+        """
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._keys_by_path = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def make_key(file_path, stat_result=None):
+        """
+        Builds the cache key for a file.
+        
+        Args:
+            file_path (str): Path to the BMP file
+            stat_result (os.stat_result): Stat of the file (default: stat it now)
+            
+        Returns:
+            tuple: (absolute path, size, mtime_ns)
+        """
+        if stat_result is None:
+            stat_result = os.stat(file_path)
+        return (os.path.abspath(file_path), stat_result.st_size, stat_result.st_mtime_ns)
+    
+    def get(self, key):
+        """
+        Returns the cached (header, rgb_values) for key, or None on a miss.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+    
+    def put(self, key, header, rgb_values):
+        """
+        Stores a decoded image and evicts least recently used entries.
+        
+        Images larger than the whole budget are returned without being cached.
+        
+        Returns:
+            tuple: (header, rgb_values) with rgb_values marked read-only
+        """
+        rgb_values.setflags(write=False)
+        entry = (header, rgb_values)
+        if rgb_values.nbytes > self.max_bytes:
+            return entry
+        
+        with self._lock:
+            # Drop a previous version of the same file along with its key
+            stale_key = self._keys_by_path.get(key[0])
+            if stale_key is not None:
+                self._remove(stale_key)
+            
+            self._entries[key] = entry
+            self._keys_by_path[key[0]] = key
+            self.current_bytes += rgb_values.nbytes
+            
+            while self.current_bytes > self.max_bytes:
+                oldest_key = next(iter(self._entries))
+                self._remove(oldest_key)
+                self.evictions += 1
+        return entry
+    
+    def _remove(self, key):
+        _, rgb_values = self._entries.pop(key)
+        del self._keys_by_path[key[0]]
+        self.current_bytes -= rgb_values.nbytes
+    
+    def clear(self):
+        """Removes every entry (counters are kept)."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_path.clear()
+            self.current_bytes = 0
+    
+    def stats(self):
+        """
+        Returns:
+            dict: Entry count, byte usage and hit/miss/eviction counters
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self.current_bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+    
+    def __len__(self):
+        return len(self._entries)
+
+# ============================================================================
+# THREADED DECODING
+# ============================================================================
+
+class DecodeResult:
+    """
+    Outcome of decoding one file with BmpDecoder.
+    
+    Either rgb holds the decoded (height, width, 3) array, or error holds the
+    exception that stopped the decode.
+    """
+    
+    __slots__ = ('file_path', 'header', 'rgb', 'error', 'seconds')
+    
+    def __init__(self, file_path, header=None, rgb=None, error=None, seconds=0.0):
+        self.file_path = file_path
+        self.header = header
+        self.rgb = rgb
+        self.error = error
+        self.seconds = seconds
+    
+    @property
+    def ok(self):
+        return self.error is None
+    
+    @property
+    def width(self):
+        return self.header.width if self.header is not None else None
+    
+    @property
+    def height(self):
+        return self.header.abs_height if self.header is not None else None
+    
+    def __repr__(self):
+        if self.error is not None:
+            return f"DecodeResult({self.file_path!r}, error={self.error!r})"
+        return f"DecodeResult({self.file_path!r}, {self.width}x{self.height})"
+
+class BmpDecoder:
+    """
+    Reentrant BMP decoder that keeps its state on the instance.
+    
+    Unlike load_bmp_file it never touches the module globals, so one decoder
+    can be shared by many threads. File reads and the pixel copy both run
+    without the GIL, which lets decode_many overlap them across a thread
+    pool inside a single process.
+    
+    Usage:
+        decoder = BmpDecoder()
+        result = decoder.decode("images/image-1.bmp")
+        for result in decoder.decode_many(paths, max_workers=8):
+            ...
+    """
+    
+    def __init__(self, cache=None, output='rgb'):
+        """
+        Args:
+            cache (DecodedImageCache): Shared cache for decoded pixels
+                (default: no caching)
+            output (str): Layout to decode into, one of OUTPUT_FORMATS
+                (default: 'rgb')
+        """
+        self.cache = cache
+        self.output = output
+        self._lock = threading.Lock()
+        self._decoded = 0
+        self._failed = 0
+        self._bytes = 0
+    
+    def decode(self, file_path):
+        """
+        Decodes one file.
+        
+        Args:
+            file_path (str): Path to the BMP file
+            
+        Returns:
+            DecodeResult: The decoded pixels and header
+            
+        Raises:
+            ValueError: If the file is not a decodable BMP
+            OSError: If the file cannot be read
+        """
+        start = time.perf_counter()
+        try:
+            header, rgb_values = decode_bmp_file(file_path, cache=self.cache, output=self.output)
+        except Exception:
+            with self._lock:
+                self._failed += 1
+            raise
+        
+        with self._lock:
+            self._decoded += 1
+            self._bytes += rgb_values.nbytes
+        return DecodeResult(file_path, header, rgb_values,
+                            seconds=time.perf_counter() - start)
+    
+    def try_decode(self, file_path):
+        """
+        Like decode, but reports failures in the result instead of raising.
+        
+        Returns:
+            DecodeResult: With error set if the decode failed
+        """
+        start = time.perf_counter()
+        try:
+            return self.decode(file_path)
+        except Exception as e:
+            return DecodeResult(file_path, error=e, seconds=time.perf_counter() - start)
+    
+    def decode_many(self, file_paths, max_workers=None, max_in_flight=None):
+        """
+        Decodes files on a thread pool and yields results in input order.
+        
+        At most max_in_flight files are decoded (and held in memory) ahead of
+        the consumer, so arbitrarily long path iterables are fine.
+        
+        Args:
+            file_paths (iterable): Paths of the BMP files to decode
+            max_workers (int): Number of threads (default: CPU count)
+            max_in_flight (int): Decodes allowed to run ahead of the consumer
+                (default: 2 * max_workers)
+            
+        Yields:
+            DecodeResult: One result per path, with error set on failure
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        max_in_flight = max(max_in_flight or 2 * max_workers, 1)
+        
+        with futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            pending = deque()
+            for file_path in file_paths:
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+                pending.append(executor.submit(self.try_decode, file_path))
+            while pending:
+                yield pending.popleft().result()
+    
+    def stats(self):
+        """
+        Returns:
+            dict: Files decoded and failed, and bytes of RGB output produced
+        """
+        with self._lock:
+            return {"decoded": self._decoded, "failed": self._failed, "bytes": self._bytes}
+
+# ============================================================================
+# ASYNCIO DECODING
+# ============================================================================
+
+async def aload_bmp(file_path, decoder=None, executor=None, timeout=None, semaphore=None):
+    """
+    Decodes a BMP file without blocking the event loop.
+    
+    The file read and the NumPy decode run in an executor thread through
+    BmpDecoder.decode. Cancelling the awaiting task (or hitting the timeout)
+    returns control immediately; a decode that has already started finishes
+    in its thread and its result is discarded.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        decoder (BmpDecoder): Decoder to use (default: a new one)
+        executor (concurrent.futures.Executor): Where to run the decode
+            (default: the event loop's default executor)
+        timeout (float): Seconds to wait before raising asyncio.TimeoutError
+            (default: no timeout)
+        semaphore (asyncio.Semaphore): Held while the file is in flight, to
+            share a concurrency limit between callers (default: no limit)
+        
+    Returns:
+        DecodeResult: The decoded pixels and header
+    """
+    decoder = decoder if decoder is not None else BmpDecoder()
+    loop = asyncio.get_running_loop()
+    
+    async with (semaphore if semaphore is not None else _NO_OP_ASYNC):
+        future = loop.run_in_executor(executor, decoder.decode, file_path)
+        return await asyncio.wait_for(future, timeout)
+
+async def aiter_bmp(file_paths, max_concurrency=64, timeout=None, decoder=None, executor=None):
+    """
+    Decodes many BMP files concurrently and yields results as they finish.
+    
+    At most max_concurrency files are in flight at once, which bounds both
+    the memory held by decoded-but-unconsumed images and the work queued on
+    the executor. The executor's own size bounds the number of threads, so
+    thousands of slow reads can be queued without thousands of threads.
+    Closing the generator (await results.aclose() after breaking out, or
+    cancelling the consuming task) cancels every file still in flight.
+    
+    Args:
+        file_paths (iterable): Paths of the BMP files to decode
+        max_concurrency (int): Files in flight at once (default: 64)
+        timeout (float): Per-file timeout in seconds (default: none)
+        decoder (BmpDecoder): Decoder to share (default: a new one)
+        executor (concurrent.futures.Executor): Where to run the decodes
+            (default: the event loop's default executor)
+        
+    Yields:
+        DecodeResult: One result per path in completion order, with error set
+        for failed or timed-out files
+    """
+    decoder = decoder if decoder is not None else BmpDecoder()
+    
+    async def load(file_path):
+        start = time.perf_counter()
+        try:
+            return await aload_bmp(file_path, decoder, executor, timeout)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            return DecodeResult(file_path, error=e, seconds=time.perf_counter() - start)
+    
+    pending = set()
+    try:
+        for file_path in file_paths:
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    yield task.result()
+            pending.add(asyncio.ensure_future(load(file_path)))
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+class _NoOpAsyncContext:
+    async def __aenter__(self):
+        return None
+    
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        return False
+
+_NO_OP_ASYNC = _NoOpAsyncContext()
+
+# ============================================================================
+# MEMORY-MAPPED DECODING
+# ============================================================================
+
+def load_bmp_mmap(file_path, contiguous=False):
+    """
+    Memory-maps a 24 or 32-bit BMP file and returns its pixels as an RGB array.
+    
+    Opening the file is close to free: nothing is read until pixels are
+    accessed, and the returned view shares pages with the OS file cache.
+    The mapping stays alive for as long as the returned array (or any view
+    of it) is referenced.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        contiguous (bool): Copy the pixels into a contiguous array instead of
+            returning a strided view over the mapping (default: False)
+        
+    Returns:
+        numpy.ndarray: Array with shape (height, width, 3) containing RGB values
+    """
+    with open(file_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        header = parse_bmp_header(mapped)
+        _require_decodable(header, file_path, "Memory-mapped decoding", bit_counts=DIRECT_BIT_COUNTS,
+                           allow_rle=False)
+        return extract_rgb_values(mapped, header.data_offset, header.width, header.height,
+                                  copy=contiguous, bit_count=header.bit_count)
+    except Exception:
+        mapped.close()
+        raise
+
+# ============================================================================
+# REGION-OF-INTEREST DECODING
+# ============================================================================
+
+def extract_region(file_path, x, y, width, height):
+    """
+    Decodes a rectangular crop of an uncompressed BMP file.
+    
+    The file is memory-mapped and only the stored rows covered by the crop
+    are addressed (accounting for bottom-up order). Within each row only
+    the byte span of the requested columns is sliced out with NumPy
+    striding, so I/O and memory scale with the crop, not the image.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        x (int): Left column of the crop
+        y (int): Top row of the crop (top-down image coordinates)
+        width (int): Crop width in pixels
+        height (int): Crop height in pixels
+        
+    Returns:
+        numpy.ndarray: Array with shape (height, width, 3) containing RGB values
+    """
+    with open(file_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    try:
+        header = parse_bmp_header(mapped)
+        _require_decodable(header, file_path, "Region decoding", allow_rle=False)
+        if (x < 0 or y < 0 or width < 1 or height < 1
+                or x + width > header.width or y + height > header.abs_height):
+            raise ValueError(f"Region ({x}, {y}, {width}x{height}) is outside the "
+                             f"{header.width}x{header.abs_height} image")
+        
+        row_size = header.row_size
+        first_stored_row = y if header.top_down else header.abs_height - y - height
+        offset = header.data_offset + first_stored_row * row_size
+        if offset + row_size * height > len(mapped):
+            raise ValueError(f"Pixel data truncated in {file_path}")
+    except Exception:
+        mapped.close()
+        raise
+    
+    rows = np.frombuffer(mapped, dtype=np.uint8, count=row_size * height,
+                         offset=offset).reshape(height, row_size)
+    if not header.top_down:
+        rows = rows[::-1]
+    
+    bit_count = header.bit_count
+    if bit_count in DIRECT_BIT_COUNTS:
+        bytes_per_pixel = bit_count // 8
+        span = rows[:, x * bytes_per_pixel:(x + width) * bytes_per_pixel]
+        bgr = span.reshape(height, width, bytes_per_pixel)
+        region = np.empty((height, width, 3), dtype=np.uint8)
+        for channel in range(3):
+            region[:, :, channel] = bgr[:, :, 2 - channel]
+        return region
+    
+    # Indexed: slice whole bytes, then drop the leading pixels of the first byte
+    pixels_per_byte = 8 // bit_count
+    first_byte = x // pixels_per_byte
+    last_byte = (x + width + pixels_per_byte - 1) // pixels_per_byte
+    indices = _unpack_index_rows(rows[:, first_byte:last_byte], width, bit_count,
+                                 skip=x - first_byte * pixels_per_byte)
+    return np.take(read_color_table(mapped, header), indices, axis=0)
+
+# ============================================================================
+# PARALLEL SHARED-MEMORY DECODING
+# ============================================================================
+
+# Held while resource tracker registration is suppressed for an attach, and
+# around every create, so no block created here can miss its registration
+_shared_memory_lock = threading.Lock()
+
+def _create_shared_memory(size):
+    """
+    Creates a new shared memory block owned (and tracked) by this process.
+    
+    Always use this instead of SharedMemory(create=True) in this codebase,
+    so that a create never overlaps an attach in _attach_shared_memory.
+    """
+    with _shared_memory_lock:
+        return shared_memory.SharedMemory(create=True, size=max(1, size))
+
+def _attach_shared_memory(name):
+    """
+    Attaches to an existing shared memory block without taking ownership.
+    
+    Only the creating process may unlink the block. Python 3.13+ can skip
+    resource tracking outright. Older versions always register the block
+    with the resource tracker, which unlinks it when the attaching process
+    exits. Unregistering afterwards races with sibling processes that share
+    the same tracker (pool workers, or several clients forked from one
+    parent), so registration is suppressed for the duration of the attach.
+    The suppression is process-wide, so creates take the same lock (see
+    _create_shared_memory).
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    from multiprocessing import resource_tracker
+    
+    with _shared_memory_lock:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+class SharedImage:
+    """
+    A decoded image living in a multiprocessing.shared_memory block.
+    
+    array is a view of the block, (height, width, 3) uint8 for RGB images
+    or any shape and dtype given (see bmp_server). Other processes
+    can attach to it by name without copying. The creating process owns
+    the block: close() releases the view and unlinks the block, so drop any
+    other references to array (or copy it) first.
+    
+    Usage:
+        with decode_bmp_parallel("huge.bmp") as image:
+            process(image.array)
+    """
+    
+    def __init__(self, shm, shape, owner=True, dtype='uint8'):
+        self.shm = shm
+        self.shape = tuple(shape)
+        self.owner = owner
+        self.array = np.ndarray(self.shape, dtype=dtype, buffer=shm.buf)
+    
+    @property
+    def name(self):
+        return self.shm.name
+    
+    def close(self):
+        """
+        Releases the view and, for the owner, frees the shared block.
+        
+        The owner unlinks the block even if closing it fails because its
+        buffer is still exported elsewhere (for example a memoryview of
+        shm.buf); the BufferError is then re-raised.
+        """
+        if self.array is None:
+            return
+        # Our own view has to go before the block can be closed
+        self.array = None
+        try:
+            self.shm.close()
+        finally:
+            if self.owner:
+                self.shm.unlink()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+def _decode_band_into_shared(file_path, shm_name, first_row, band_height):
+    """
+    Worker: decodes top-down rows [first_row, first_row + band_height) of a
+    BMP file straight into the shared output block.
+    """
+    with open(file_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    header = parse_bmp_header(mapped)
+    shm = _attach_shared_memory(shm_name)
+    try:
+        out = np.ndarray((header.abs_height, header.width, 3), dtype=np.uint8,
+                         buffer=shm.buf)[first_row:first_row + band_height]
+        stored_row = first_row if header.top_down else header.abs_height - first_row - band_height
+        offset = header.data_offset + stored_row * header.row_size
+        height = -band_height if header.top_down else band_height
+        
+        if header.bit_count in DIRECT_BIT_COUNTS:
+            # Strip padding and swizzle BGR -> RGB channel by channel into the band
+            rgb_view = bgr_rows_to_rgb_view(mapped, offset, header.width, height,
+                                            header.bit_count)
+            for channel in range(3):
+                np.copyto(out[:, :, channel], rgb_view[:, :, channel])
+        else:
+            indices = extract_palette_indices(mapped, offset, header.width, height,
+                                              header.bit_count)
+            np.take(read_color_table(mapped, header), indices, axis=0, out=out)
+        # The view must be gone before the block can be closed
+        del out
+    finally:
+        shm.close()
+    return band_height
+
+def decode_bmp_parallel(file_path, workers=None, rows_per_band=None):
+    """
+    Decodes one large uncompressed BMP on several cores into shared memory.
+    
+    The image is split into row bands. Each worker process memory-maps the
+    file, strips the row padding and swizzles BGR -> RGB (or looks up the
+    color table) for its band, writing directly into one shared output
+    block. Only band coordinates cross the process boundary; no pixel data
+    is pickled.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        workers (int): Worker processes (default: CPU count). With 1 the
+            bands are decoded in this process.
+        rows_per_band (int): Rows per work item (default: about four bands
+            per worker so faster workers can pick up slack)
+        
+    Returns:
+        SharedImage: Owner of the shared block; its array is (height, width, 3)
+    """
+    header = read_bmp_header(file_path)
+    _require_decodable(header, file_path, "Parallel decoding", allow_rle=False)
+    if header.data_offset + header.pixel_data_size > os.path.getsize(file_path):
+        raise ValueError(f"Pixel data truncated in {file_path}")
+    
+    height = header.abs_height
+    workers = workers or os.cpu_count() or 1
+    rows_per_band = rows_per_band or max(1, -(-height // (workers * 4)))
+    bands = [(row, min(rows_per_band, height - row)) for row in range(0, height, rows_per_band)]
+    
+    shape = (height, header.width, 3)
+    shm = _create_shared_memory(height * header.width * 3)
+    image = SharedImage(shm, shape)
+    try:
+        if workers == 1:
+            for first_row, band_height in bands:
+                _decode_band_into_shared(file_path, shm.name, first_row, band_height)
+        else:
+            with futures.ProcessPoolExecutor(max_workers=min(workers, len(bands))) as executor:
+                band_futures = [executor.submit(_decode_band_into_shared, file_path, shm.name,
+                                                first_row, band_height)
+                                for first_row, band_height in bands]
+                for future in band_futures:
+                    future.result()
+    except BaseException:
+        image.close()
+        raise
+    return image
+
+# ============================================================================
+# THUMBNAIL DECODING
+# ============================================================================
+
+THUMBNAIL_METHODS = ('nearest', 'box')
+
+def extract_thumbnail(file_path, factor=4, method='box', rows_per_band=64):
+    """
+    Decodes a BMP file directly at 1/factor of its size.
+    
+    The file is memory-mapped and processed band by band into a
+    preallocated thumbnail, so the full-size image is never materialized.
+    'nearest' picks every factor-th stored row and pixel, so only those rows
+    are read from disk. 'box' averages each factor x factor block (partial
+    blocks at the right and bottom edges are averaged over the pixels they
+    contain).
+    
+    Args:
+        file_path (str): Path to the BMP file
+        factor (int): Integer reduction factor, e.g. 2, 4 or 8 (default: 4)
+        method (str): 'nearest' or 'box' (default: 'box')
+        rows_per_band (int): Thumbnail rows produced per band (default: 64)
+        
+    Returns:
+        numpy.ndarray: Array with shape (ceil(height / factor),
+        ceil(width / factor), 3) containing RGB values
+    """
+    if factor < 1:
+        raise ValueError(f"factor must be at least 1, got {factor}")
+    if method not in THUMBNAIL_METHODS:
+        raise ValueError(f"method must be one of {THUMBNAIL_METHODS}, got {method!r}")
+    
+    with open(file_path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
+    header = parse_bmp_header(mapped)
+    _require_decodable(header, file_path, "Thumbnail decoding", allow_rle=False)
+    rows, width, row_size = header.abs_height, header.width, header.row_size
+    if header.data_offset + row_size * rows > len(mapped):
+        raise ValueError(f"Pixel data truncated in {file_path}")
+    
+    stored = np.frombuffer(mapped, dtype=np.uint8, count=row_size * rows,
+                           offset=header.data_offset).reshape(rows, row_size)
+    if not header.top_down:
+        stored = stored[::-1]
+    palette = read_color_table(mapped, header) if header.bit_count in INDEXED_BIT_COUNTS else None
+    
+    out_rows = -(-rows // factor)
+    out_width = -(-width // factor)
+    thumbnail = np.empty((out_rows, out_width, 3), dtype=np.uint8)
+    col_starts = np.arange(0, width, factor)
+    col_counts = np.diff(np.append(col_starts, width))
+    # uint16 row sums are enough for up to 257 rows of 8-bit values
+    sum_dtype = np.uint16 if factor <= 257 else np.uint32
+    
+    for top in range(0, out_rows, rows_per_band):
+        band_out = min(rows_per_band, out_rows - top)
+        first = top * factor
+        if method == 'nearest':
+            pixels, channels = _band_pixels(stored[first:first + band_out * factor:factor],
+                                            header, palette, step=factor)
+            for channel in range(3):
+                thumbnail[top:top + band_out, :, channel] = pixels[:, :, channels[channel]]
+            continue
+        
+        pixels, channels = _band_pixels(stored[first:first + band_out * factor], header, palette)
+        band_in = pixels.shape[0]
+        
+        # Sum each block's rows with strided slices, then its columns with reduceat
+        row_sums = np.zeros((band_out,) + pixels.shape[1:], dtype=sum_dtype)
+        for offset in range(factor):
+            rows_at_offset = pixels[offset::factor]
+            row_sums[:rows_at_offset.shape[0]] += rows_at_offset
+        sums = np.add.reduceat(row_sums, col_starts, axis=1, dtype=np.uint32)
+        
+        row_counts = np.minimum(factor, band_in - np.arange(band_out) * factor)
+        counts = (row_counts[:, None] * col_counts[None, :]).astype(np.uint32)
+        for channel in range(3):
+            channel_sums = sums[:, :, channels[channel]]
+            thumbnail[top:top + band_out, :, channel] = (channel_sums + counts // 2) // counts
+    
+    return thumbnail
+
+def _band_pixels(stored_rows, header, palette, step=1):
+    """
+    Converts top-down rows of stored pixel bytes into per-pixel channels.
+    
+    Args:
+        stored_rows (numpy.ndarray): uint8 array of padded rows, top-down
+        header (BmpHeader): The parsed header
+        palette (numpy.ndarray): Color table for indexed images
+        step (int): Keep every step-th pixel of each row (default: 1)
+        
+    Returns:
+        tuple: (pixels, channels) where pixels has shape (rows,
+        ceil(width / step), channels) and channels lists the indices of the
+        red, green and blue values. For 24/32-bit data pixels is a view over
+        stored_rows in BGR(A) order.
+    """
+    width = header.width
+    if header.bit_count in DIRECT_BIT_COUNTS:
+        bytes_per_pixel = header.bit_count // 8
+        bgr = stored_rows[:, :width * bytes_per_pixel].reshape(-1, width, bytes_per_pixel)
+        return bgr[:, ::step], (2, 1, 0)
+    indices = _unpack_index_rows(stored_rows, width, header.bit_count)
+    return np.take(palette, indices[:, ::step], axis=0), (0, 1, 2)
+
+# ============================================================================
+# STREAMING DECODING
+# ============================================================================
+
+def iter_rgb_bands(file_path, rows_per_band=256, output='rgb'):
+    """
+    Decodes a BMP file as a stream of RGB row bands.
+    
+    Bands are yielded in top-down order. For bottom-up files each band is
+    read from the end of the pixel data backwards, so only one band of raw
+    rows is buffered at a time and peak memory is set by rows_per_band, not
+    by the image size. Row padding is stripped and BGR is swapped to RGB;
+    palette-indexed files are expanded through their color table.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        rows_per_band (int): Maximum number of rows per yielded band (default: 256)
+        output (str): Layout of each band, one of OUTPUT_FORMATS (default: 'rgb')
+        
+    Yields:
+        numpy.ndarray: Array with shape (band_rows, width, 3) containing RGB
+        values, or (band_rows, width, 4) RGBA values for images with alpha
+    """
+    if rows_per_band < 1:
+        raise ValueError(f"rows_per_band must be at least 1, got {rows_per_band}")
+    
+    with open(file_path, 'rb') as f:
+        header = parse_bmp_header(f.read(BMP_HEADER_SIZE))
+        _require_decodable(header, file_path, "Streaming decoding", allow_rle=False,
+                           allow_bitfields=True)
+        
+        # The color table and channel masks sit between the header and the pixels
+        palette = masks = None
+        if header.bit_count in INDEXED_BIT_COUNTS:
+            f.seek(0)
+            palette = read_color_table(f.read(header.data_offset), header)
+        elif _uses_channel_masks(header):
+            f.seek(0)
+            masks = read_channel_masks(f.read(header.data_offset), header)
+        
+        rows = header.abs_height
+        row_size = header.row_size
+        chunk = bytearray(row_size * min(rows_per_band, rows))
+        
+        for top in range(0, rows, rows_per_band):
+            band_rows = min(rows_per_band, rows - top)
+            first_stored_row = top if header.top_down else rows - top - band_rows
+            band_bytes = band_rows * row_size
+            
+            f.seek(header.data_offset + first_stored_row * row_size)
+            if f.readinto(memoryview(chunk)[:band_bytes]) != band_bytes:
+                raise ValueError(f"Pixel data truncated in {file_path}")
+            
+            # Within a bottom-up band the rows still need flipping
+            stored_height = -band_rows if header.top_down else band_rows
+            yield decode_pixels(chunk, header, palette=palette, data_offset=0,
+                                height=stored_height, masks=masks, output=output)
+
+# ============================================================================
+# PIXEL STATISTICS
+# ============================================================================
+
+CHANNEL_NAMES = ('red', 'green', 'blue', 'alpha')
+
+class PixelStats:
+    """
+    Per-channel and luminance histograms accumulated band by band.
+    
+    Each band passed to update() costs one np.bincount per channel plus
+    one for luminance. Min, max, mean and standard deviation are derived
+    from the 256-bin histograms afterwards rather than from more passes
+    over the pixels. Luminance uses the integer Rec. 601 weights in
+    LUMA_WEIGHTS, the same as the 'gray' output layout.
+    """
+    
+    def __init__(self, channels=3):
+        self.channels = channels
+        self.pixels = 0
+        self.histograms = np.zeros((channels, 256), dtype=np.int64)
+        self.luminance = np.zeros(256, dtype=np.int64)
+    
+    def update(self, band):
+        """
+        Adds a (rows, width, channels) uint8 band of pixels.
+        """
+        if band.shape[2] != self.channels:
+            raise ValueError(f"Expected {self.channels} channels, got {band.shape[2]}")
+        self.pixels += band.shape[0] * band.shape[1]
+        for channel in range(self.channels):
+            self.histograms[channel] += np.bincount(band[:, :, channel].ravel(), minlength=256)
+        
+        self.luminance += np.bincount(_luma(band).ravel(), minlength=256)
+    
+    @staticmethod
+    def _describe(histogram):
+        total = histogram.sum()
+        if total == 0:
+            return {"min": None, "max": None, "mean": None, "std": None}
+        levels = np.arange(256, dtype=np.float64)
+        nonzero = np.flatnonzero(histogram)
+        mean = float(histogram @ levels) / total
+        variance = float(histogram @ (levels - mean) ** 2) / total
+        return {"min": int(nonzero[0]), "max": int(nonzero[-1]), "mean": mean,
+                "std": variance ** 0.5}
+    
+    def summary(self, histograms=True):
+        """
+        Returns:
+            dict: JSON-serializable min/max/mean/std (and histograms) for every
+            channel and for luminance
+        """
+        summary = {"pixels": self.pixels, "channels": {}}
+        entries = [(CHANNEL_NAMES[channel], self.histograms[channel])
+                   for channel in range(self.channels)]
+        entries.append(("luminance", self.luminance))
+        for name, histogram in entries:
+            stats = self._describe(histogram)
+            if histograms:
+                stats["histogram"] = histogram.tolist()
+            if name == "luminance":
+                summary["luminance"] = stats
+            else:
+                summary["channels"][name] = stats
+        return summary
+
+def compute_pixel_stats(file_path, rows_per_band=256, keep_image=False):
+    """
+    Computes pixel statistics for a BMP file in a single decode pass.
+    
+    Without keep_image the file is decoded through iter_rgb_bands and every
+    band is folded into the histograms and then dropped. Peak memory is one
+    band, however large the image. With keep_image (and for RLE files,
+    which cannot be streamed) the image is decoded once and the statistics
+    are gathered over row bands of the result while they are still in cache.
+    
+    Args:
+        file_path (str): Path to the BMP file
+        rows_per_band (int): Rows per band (default: 256)
+        keep_image (bool): Also return the decoded pixels (default: False)
+        
+    Returns:
+        PixelStats: The accumulated statistics, or (PixelStats, numpy.ndarray)
+        when keep_image is True
+    """
+    header = read_bmp_header(file_path)
+    if keep_image or header.compression in RLE_BIT_COUNTS:
+        _, rgb_values = decode_bmp_file(file_path)
+        bands = (rgb_values[top:top + rows_per_band]
+                 for top in range(0, rgb_values.shape[0], rows_per_band))
+    else:
+        rgb_values = None
+        bands = iter_rgb_bands(file_path, rows_per_band)
+    
+    stats = None
+    for band in bands:
+        if stats is None:
+            stats = PixelStats(channels=band.shape[2])
+        stats.update(band)
+    
+    if keep_image:
+        return stats, rgb_values
+    return stats
+
+# ============================================================================
+# INCREMENTAL (PUSH) DECODING
+# ============================================================================
+
+class BmpStreamDecoder:
+    """
+    Push-style decoder for BMPs arriving in pieces over a pipe or socket.
+    
+    Call feed() with each chunk as it arrives. The header is parsed as soon
+    as its bytes are in. After that, every complete band of rows_per_band
+    stored rows is decoded right away into a preallocated output at its
+    final position. Bottom-up bands fill the output from the bottom, and
+    top-down bands from the top. Only the current partial band is buffered,
+    never the whole payload, so decoding overlaps the transfer.
+    
+    Usage:
+        decoder = BmpStreamDecoder()
+        while chunk := sock.recv(65536):
+            for top, band in decoder.feed(chunk):
+                ...                     # rows [top, top + len(band)) are final
+        image = decoder.finish()
+    """
+    
+    def __init__(self, rows_per_band=64, output='rgb'):
+        """
+        Args:
+            rows_per_band (int): Stored rows decoded per emitted band (default: 64)
+            output (str): Layout of the output, one of OUTPUT_FORMATS (default: 'rgb')
+        """
+        if rows_per_band < 1:
+            raise ValueError(f"rows_per_band must be at least 1, got {rows_per_band}")
+        self.rows_per_band = rows_per_band
+        self.output_format = output
+        self.header = None
+        self.output = None
+        self.rows_decoded = 0
+        self._pending = bytearray()
+        self._palette = None
+        self._masks = None
+    
+    @property
+    def done(self):
+        """True once every row of the image has been decoded."""
+        return self.header is not None and self.rows_decoded == self.header.abs_height
+    
+    def feed(self, data):
+        """
+        Consumes the next chunk of the stream.
+        
+        Args:
+            data (bytes): Any number of bytes, continuing the stream
+            
+        Returns:
+            list: (top_row, band) tuples for the bands completed by this chunk,
+            where band is a view of the output rows it filled
+        """
+        if self.done:
+            return []  # Trailing bytes after the pixel data are ignored
+        self._pending += data
+        
+        if self.header is None and not self._start():
+            return []
+        return self._decode_bands()
+    
+    def finish(self):
+        """
+        Ends the stream.
+        
+        Returns:
+            numpy.ndarray: The decoded image in the requested layout
+            
+        Raises:
+            ValueError: If the stream ended before the image was complete
+        """
+        if self.header is None:
+            raise ValueError(f"BMP stream ended after {len(self._pending)} bytes, "
+                             f"before the header and color table were complete")
+        if not self.done:
+            raise ValueError(f"BMP stream truncated after {self.rows_decoded} of "
+                             f"{self.header.abs_height} rows")
+        return self.output
+    
+    def _start(self):
+        """Parses the header and color table/masks once they have arrived."""
+        if len(self._pending) < BMP_HEADER_SIZE:
+            return False
+        header = parse_bmp_header(self._pending)
+        _require_decodable(header, "stream", "Incremental decoding", allow_rle=False,
+                           allow_bitfields=True)
+        if len(self._pending) < header.data_offset:
+            return False
+        
+        prefix = bytes(self._pending[:header.data_offset])
+        channels = 3
+        if header.bit_count in INDEXED_BIT_COUNTS:
+            self._palette = read_color_table(prefix, header)
+        elif _uses_channel_masks(header):
+            self._masks = read_channel_masks(prefix, header)
+            channels = 4 if self._masks[3] else 3
+        
+        self.header = header
+        self.output = _allocate_output(self.output_format, header.abs_height, header.width,
+                                       channels)
+        del self._pending[:header.data_offset]
+        return True
+    
+    def _decode_bands(self):
+        header = self.header
+        rows = header.abs_height
+        row_size = header.row_size
+        bands = []
+        consumed = 0
+        while self.rows_decoded < rows:
+            remaining = rows - self.rows_decoded
+            available = (len(self._pending) - consumed) // row_size
+            band_rows = min(self.rows_per_band, remaining)
+            if available < band_rows:
+                break
+            
+            stored_row = self.rows_decoded
+            top = stored_row if header.top_down else rows - stored_row - band_rows
+            band = _band_rgb(self._pending, header, consumed,
+                             -band_rows if header.top_down else band_rows,
+                             self._palette, self._masks)
+            _write_output_band(band, self.output, top, self.output_format)
+            del band
+            
+            consumed += band_rows * row_size
+            self.rows_decoded += band_rows
+            if self.output_format == 'planar':
+                bands.append((top, self.output[:, top:top + band_rows]))
+            else:
+                bands.append((top, self.output[top:top + band_rows]))
+        
+        # Keep only the partial band; the decoded rows are no longer needed
+        del self._pending[:consumed]
+        return bands
+
+def decode_stream(stream, rows_per_band=64, output='rgb', chunk_size=1 << 16):
+    """
+    Decodes a BMP from a non-seekable binary stream such as sys.stdin.buffer
+    or socket.makefile('rb'), decoding bands while later bytes are in transit.
+    
+    Args:
+        stream: Binary file-like object with read() (read1() is used when
+            available, so partial reads are decoded immediately)
+        rows_per_band (int): Stored rows decoded per band (default: 64)
+        output (str): Layout of the result, one of OUTPUT_FORMATS (default: 'rgb')
+        chunk_size (int): Maximum bytes per read (default: 64 KiB)
+        
+    Returns:
+        tuple: (BmpHeader, numpy.ndarray) with the decoded image
+    """
+    decoder = BmpStreamDecoder(rows_per_band, output)
+    read = getattr(stream, 'read1', stream.read)
+    while not decoder.done:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        decoder.feed(chunk)
+    return decoder.header, decoder.finish()
+
+# ============================================================================
+# BMP ENCODING
+# ============================================================================
+
+# BITMAPV4HEADER fields after the 40-byte info header: red, green, blue and
+# alpha masks, color space type, 36 bytes of endpoints and three gamma values
+_V4_EXTENSION_STRUCT = struct.Struct('<4II36x12x')
+_V4_DATA_OFFSET = BMP_HEADER_SIZE + _V4_EXTENSION_STRUCT.size
+_BGRA_MASKS = (0x00FF0000, 0x0000FF00, 0x000000FF, 0xFF000000)
+_LCS_SRGB = 0x73524742  # 'sRGB'
+
+def write_bmp(file_path, rgb_array, bit_count=24, top_down=False):
+    """
+    Writes an RGB (or RGBA) NumPy array to an uncompressed BMP file.
+    
+    This mirrors extract_rgb_values in reverse. The whole file is assembled
+    in one preallocated buffer: the headers are written with a single
+    struct.pack_into, and the pixels are copied in through a strided view
+    that performs the RGB -> BGR flip and bottom-up row order while leaving
+    the (zeroed) row padding untouched. The buffer is then written with one
+    bulk write.
+    
+    Args:
+        file_path (str): Path of the BMP file to write
+        rgb_array (numpy.ndarray): uint8 array with shape (height, width, 3)
+            or (height, width, 4)
+        bit_count (int): 24 or 32 bits per pixel (default: 24). RGBA input
+            needs 32 bits and is written as BI_BITFIELDS with a V4 header
+            whose alpha mask covers the fourth byte, so readers decode it
+            back to RGBA. RGB input at 32 bits is plain BI_RGB with the
+            fourth byte set to 255.
+        top_down (bool): Store rows top-to-bottom with a negative height
+            (default: False)
+        
+    Returns:
+        int: Number of bytes written
+    """
+    rgb_array = np.asarray(rgb_array)
+    if rgb_array.dtype != np.uint8 or rgb_array.ndim != 3 or rgb_array.shape[2] not in (3, 4):
+        raise ValueError(f"Expected a uint8 array with shape (height, width, 3 or 4), "
+                         f"got {rgb_array.dtype} {rgb_array.shape}")
+    if bit_count not in DIRECT_BIT_COUNTS:
+        raise ValueError(f"Can only write 24 or 32-bit BMPs, got {bit_count}-bit")
+    has_alpha = rgb_array.shape[2] == 4
+    if has_alpha and bit_count != 32:
+        raise ValueError(f"RGBA input needs bit_count=32 to keep its alpha, got {bit_count}")
+    
+    height, width = rgb_array.shape[:2]
+    bytes_per_pixel = bit_count // 8
+    row_size = padded_row_size(width, bit_count)
+    image_size = row_size * height
+    data_offset = _V4_DATA_OFFSET if has_alpha else BMP_HEADER_SIZE
+    file_size = data_offset + image_size
+    
+    buffer = bytearray(file_size)
+    _BMP_HEADER_STRUCT.pack_into(
+        buffer, 0, b'BM', file_size, 0, 0, data_offset, data_offset - 14, width,
+        -height if top_down else height, 1, bit_count,
+        BI_BITFIELDS if has_alpha else BI_RGB, image_size,
+        2835, 2835, 0, 0)  # 2835 pixels/metre = 72 DPI
+    if has_alpha:
+        _V4_EXTENSION_STRUCT.pack_into(buffer, BMP_HEADER_SIZE, *_BGRA_MASKS, _LCS_SRGB)
+    
+    pixels = np.frombuffer(buffer, dtype=np.uint8, offset=data_offset)
+    pixels = pixels.reshape(height, row_size)[:, :width * bytes_per_pixel]
+    pixels = pixels.reshape(height, width, bytes_per_pixel)
+    if not top_down:
+        pixels = pixels[::-1]
+    
+    # One plain strided copy per channel is several times faster than a
+    # single assignment through a reversed channel axis
+    for channel in range(3):
+        pixels[:, :, 2 - channel] = rgb_array[:, :, channel]
+    if bytes_per_pixel == 4:
+        pixels[:, :, 3] = rgb_array[:, :, 3] if has_alpha else 255
+    
+    with open(file_path, 'wb') as f:
+        f.write(buffer)
+    return file_size
+
+# ============================================================================
+# ⚠️  DO NOT EDIT ANYTHING BELOW THIS LINE  ⚠️
+# ============================================================================
+# This section contains the automated test system.
+# Modifying this code may break the testing functionality.
+# ============================================================================
+
+def run_tests_for_ticket(ticket_number):
+    """
+    Runs tests based on the current ticket number.
+    Tests are cumulative - setting ticket 3 will test tickets 1, 2, and 3.
+    """
+    if ticket_number < 1:
+        print("🎯 No tests to run. Set CURRENT_TICKET to 1 or higher to start testing.")
+        return
+
+    print(f"🧪 Running tests for tickets 1-{ticket_number}...")
+    print("=" * 50)
+
+    # Test data for Ticket 2
+    test_buffer = create_test_buffer()
+
+    # Mock BMP data for Tickets 3-6
+    mock_bmp_data = bytes([
+        # BITMAPFILEHEADER (14 bytes)
+        0x42, 0x4D,             # Signature: "BM"
+        0x4A, 0x00, 0x00, 0x00, # FileSize: 74 bytes
+        0x00, 0x00, 0x00, 0x00, # Reserved: 0
+        0x36, 0x00, 0x00, 0x00, # DataOffset: 54 bytes
+        
+        # BITMAPINFOHEADER (40 bytes)
+        0x28, 0x00, 0x00, 0x00, # Size: 40
+        0x02, 0x00, 0x00, 0x00, # Width: 2 pixels
+        0x02, 0x00, 0x00, 0x00, # Height: 2 pixels
+        0x01, 0x00,             # Planes: 1
+        0x18, 0x00,             # BitCount: 24 bits
+        0x00, 0x00, 0x00, 0x00, # Compression: 0 (none)
+        0x14, 0x00, 0x00, 0x00, # ImageSize: 20 bytes (2x2 with padding)
+        0x00, 0x00, 0x00, 0x00, # XpixelsPerM: 0
+        0x00, 0x00, 0x00, 0x00, # YpixelsPerM: 0
+        0x00, 0x00, 0x00, 0x00, # ColorsUsed: 0
+        0x00, 0x00, 0x00, 0x00, # ColorsImportant: 0
+        
+        # Pixel data (2x2 with 4-byte row padding)
+        # Row 1: Red pixel, Blue pixel + 2 bytes padding
+        0xFF, 0x00, 0x00, 0x00, 0x00, 0xFF, 0x00, 0x00,
+        # Row 2: Green pixel, White pixel + 2 bytes padding
+        0x00, 0xFF, 0x00, 0xFF, 0xFF, 0xFF, 0x00, 0x00
+    ])
+
+    # Ticket 1: NumPy Array Creation
+    if ticket_number >= 1:
+        print("=== Testing Ticket 1: NumPy Array Creation ===")
+        if callable(create_random_array):
+            try:
+                result = create_random_array(10, 10)
+                if isinstance(result, np.ndarray) and result.shape == (10, 10, 3):
+                    print("✅ Ticket 1: PASSED (random array created successfully)")
+                else:
+                    print("❌ Ticket 1: FAILED - expected shape (10, 10, 3), got", result.shape if hasattr(result, 'shape') else type(result))
+            except Exception as error:
+                print(f"❌ Ticket 1: FAILED - {error}")
+        else:
+            print("⏭️ Ticket 1: SKIPPED (function not implemented)")
+        print()
+
+    # Ticket 2: Struct Module Functions
+    if ticket_number >= 2:
+        print("=== Testing Ticket 2: Struct Module Functions ===")
+        
+        if callable(read_uint32_le):
+            result1 = read_uint32_le(test_buffer, 0)
+            expected1 = 0x12345678
+            if result1 == expected1:
+                print("✅ read_uint32_le: PASSED")
+            else:
+                print(f"❌ read_uint32_le: FAILED - expected {expected1}, got {result1}")
+        else:
+            print("⏭️ read_uint32_le: SKIPPED (function not implemented)")
+
+        if callable(read_int32_le):
+            result2 = read_int32_le(test_buffer, 4)
+            expected2 = -8388608
+            if result2 == expected2:
+                print("✅ read_int32_le: PASSED")
+            else:
+                print(f"❌ read_int32_le: FAILED - expected {expected2}, got {result2}")
+        else:
+            print("⏭️ read_int32_le: SKIPPED (function not implemented)")
+
+        if callable(read_uint16_le):
+            result3 = read_uint16_le(test_buffer, 8)
+            expected3 = 0xABCD
+            if result3 == expected3:
+                print("✅ read_uint16_le: PASSED")
+            else:
+                print(f"❌ read_uint16_le: FAILED - expected {expected3}, got {result3}")
+        else:
+            print("⏭️ read_uint16_le: SKIPPED (function not implemented)")
+        print()
+
+    # Ticket 3: BMP Loading and Header Logging
+    if ticket_number >= 3:
+        print("=== Testing Ticket 3: BMP Header Parsing ===")
+        
+        if callable(read_uint16_le) and callable(read_uint32_le):
+            signature = read_uint16_le(mock_bmp_data, 0)
+            expected_signature = 0x4D42  # "BM" in little-endian
+            if signature == expected_signature:
+                print("✅ BMP Signature: PASSED")
+            else:
+                print(f"❌ BMP Signature: FAILED - expected {expected_signature}, got {signature}")
+
+            data_offset = read_uint32_le(mock_bmp_data, 10)
+            expected_offset = 54
+            if data_offset == expected_offset:
+                print("✅ Data Offset: PASSED")
+            else:
+                print(f"❌ Data Offset: FAILED - expected {expected_offset}, got {data_offset}")
+        else:
+            print("⏭️ Ticket 3: SKIPPED (read functions not implemented)")
+        print()
+
+    # Ticket 4: Info Header Logging
+    if ticket_number >= 4:
+        print("=== Testing Ticket 4: BMP Info Header ===")
+        
+        if callable(read_int32_le) and callable(read_uint16_le):
+            width = read_int32_le(mock_bmp_data, 18)
+            height = read_int32_le(mock_bmp_data, 22)
+            bit_count = read_uint16_le(mock_bmp_data, 28)
+            
+            if width == 2 and height == 2 and bit_count == 24:
+                print("✅ Image Dimensions & Bit Count: PASSED")
+            else:
+                print(f"❌ Image Dimensions & Bit Count: FAILED - width: {width}, height: {height}, bitCount: {bit_count}")
+        else:
+            print("⏭️ Ticket 4: SKIPPED (read functions not implemented)")
+        print()
+
+    # Ticket 5: RGB Values Extraction
+    if ticket_number >= 5:
+        print("=== Testing Ticket 5: RGB Values Extraction ===")
+        
+        if callable(extract_rgb_values):
+            data_offset = 54
+            width = 2
+            height = 2
+            
+            try:
+                rgb_values = extract_rgb_values(mock_bmp_data, data_offset, width, height)
+                
+                if isinstance(rgb_values, np.ndarray) and rgb_values.shape == (2, 2, 3):
+                    print("✅ RGB Extraction: PASSED")
+                    print("   Extracted RGB values:", rgb_values.tolist())
+                else:
+                    print("❌ RGB Extraction: FAILED - expected NumPy array with shape (2, 2, 3)")
+            except Exception as error:
+                print(f"❌ RGB Extraction: FAILED - {error}")
+        else:
+            print("⏭️ Ticket 5: SKIPPED (function not implemented)")
+        print()
+
+    print("=" * 50)
+    print(f"🎯 Tests complete for tickets 1-{ticket_number}")
+    if ticket_number >= 6:
+        print("💡 Use load_bmp_file() to test Ticket 6 (complete workflow)")
+    else:
+        print("💡 Change CURRENT_TICKET to test more tickets as you complete them!")
+    print()
+
+def run_ticket6_test(file_path):
+    """
+    Runs Ticket 6 test when a file is actually loaded by the user.
+    This tests the complete end-to-end workflow with real file data.
+    """
+    print("=" * 50)
+    print("=== Testing Ticket 6: Complete Workflow with Real File ===")
+    
+    if (callable(render_rgb_to_image) and 
+        callable(log_bmp_info_header) and 
+        callable(extract_rgb_values) and 
+        file_loaded and loaded_file_data):
+        
+        try:
+            # Get image dimensions from the loaded data
+            width = read_int32_le(loaded_file_data, 18)
+            height = read_int32_le(loaded_file_data, 22)
+            data_offset = read_uint32_le(loaded_file_data, 10)
+            
+            # Extract RGB values
+            rgb_values = extract_rgb_values(loaded_file_data, data_offset, width, height)
+            
+            # Render to image
+            image = render_rgb_to_image(rgb_values, width, height)
+            
+            if image is not None:
+                print("✅ Ticket 6: PASSED (file successfully loaded and rendered)")
+                print(f"   File: {file_path}")
+                print(f"   Image dimensions: {width} x {height}")
+                print("   🎉 Complete workflow working!")
+            else:
+                print("❌ Ticket 6: FAILED - image rendering failed")
+                
+        except Exception as error:
+            print(f"❌ Ticket 6: FAILED - {error}")
+    else:
+        print("⏭️ Ticket 6: SKIPPED (required functions not implemented or no file loaded)")
+        print("   Need: log_bmp_info_header, extract_rgb_values, render_rgb_to_image")
+    
+    print("=" * 50)
+    print()
+
+if __name__ == "__main__":
+    # Run tests based on current ticket
+    run_tests_for_ticket(CURRENT_TICKET)
+    
+    # Example usage for Ticket 6 testing
+    if CURRENT_TICKET >= 6:
+        print("Example: To test the complete workflow with a real BMP file:")
+        print("load_bmp_file('images/image-1.bmp')")
         print() 
\ No newline at end of file
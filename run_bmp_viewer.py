@@ -1,187 +1,532 @@
-#!/usr/bin/env python3
-"""
-BMP Viewer Runner - Simple interface to load and display BMP files
-
-This script provides a simple way to test the BMP parsing functionality
-by loading files from the images directory and displaying them.
-
-Usage:
-    python run_bmp_viewer.py [filename]
-    
-Examples:
-    python run_bmp_viewer.py                    # List available files
-    python run_bmp_viewer.py image-1.bmp        # Load specific file
-    python run_bmp_viewer.py --list             # List available files
-    python run_bmp_viewer.py --test             # Run test with mock data
-"""
-
-import os
-import sys
-import glob
-from pathlib import Path
-
-# Import the main functions from main.py
-try:
-    from main import (
-        load_bmp_file, 
-        create_random_array, 
-        read_uint32_le, 
-        read_int32_le, 
-        read_uint16_le,
-        extract_rgb_values,
-        render_rgb_to_image,
-        create_test_buffer
-    )
-    print("✅ Successfully imported functions from main.py")
-except ImportError as e:
-    print(f"❌ Error importing functions: {e}")
-    print("Make sure you have implemented the required functions in main.py")
-    sys.exit(1)
-
-def list_available_files():
-    """List all BMP files in the images directory."""
-    images_dir = Path("images")
-    if not images_dir.exists():
-        print("❌ Images directory not found!")
-        return []
-    
-    bmp_files = list(images_dir.glob("*.bmp"))
-    if not bmp_files:
-        print("❌ No BMP files found in images directory!")
-        return []
-    
-    print("📁 Available BMP files in images directory:")
-    for i, file_path in enumerate(bmp_files, 1):
-        file_size = file_path.stat().st_size
-        print(f"  {i}. {file_path.name} ({file_size:,} bytes)")
-    
-    return bmp_files
-
-def load_and_display_file(filename):
-    """Load and display a specific BMP file."""
-    file_path = Path("images") / filename
-    
-    if not file_path.exists():
-        print(f"❌ File not found: {file_path}")
-        return False
-    
-    print(f"🖼️  Loading BMP file: {filename}")
-    print("=" * 50)
-    
-    try:
-        # Load and display the BMP file
-        image = load_bmp_file(str(file_path))
-        
-        if image:
-            print(f"✅ Successfully loaded and displayed {filename}")
-            print(f"   Image size: {image.size[0]} x {image.size[1]} pixels")
-            print(f"   Image mode: {image.mode}")
-            return True
-        else:
-            print(f"❌ Failed to load {filename}")
-            return False
-            
-    except Exception as e:
-        print(f"❌ Error loading {filename}: {e}")
-        return False
-
-def run_interactive_mode():
-    """Run in interactive mode, letting user choose files."""
-    print("🎮 BMP Viewer - Interactive Mode")
-    print("=" * 50)
-    
-    while True:
-        print("\nOptions:")
-        print("  1. List available files")
-        print("  2. Load a specific file")
-        print("  3. Run test with mock data")
-        print("  4. Exit")
-        
-        choice = input("\nEnter your choice (1-4): ").strip()
-        
-        if choice == "1":
-            list_available_files()
-            
-        elif choice == "2":
-            files = list_available_files()
-            if files:
-                try:
-                    file_num = int(input("Enter file number: ")) - 1
-                    if 0 <= file_num < len(files):
-                        load_and_display_file(files[file_num].name)
-                    else:
-                        print("❌ Invalid file number!")
-                except ValueError:
-                    print("❌ Please enter a valid number!")
-                    
-        elif choice == "3":
-            run_test_mode()
-            
-        elif choice == "4":
-            print("👋 Goodbye!")
-            break
-            
-        else:
-            print("❌ Invalid choice! Please enter 1-4.")
-
-def run_test_mode():
-    """Run a test with mock data to verify functions work."""
-    print("🧪 Running test mode with mock data...")
-    print("=" * 50)
-    
-    try:
-        # Test 1: Create random array
-        print("1. Testing random array creation...")
-        random_array = create_random_array(50, 50)
-        print(f"   ✅ Created array with shape: {random_array.shape}")
-        
-        # Test 2: Test struct functions
-        print("2. Testing struct functions...")
-        test_buffer = create_test_buffer()
-        value1 = read_uint32_le(test_buffer, 0)
-        value2 = read_int32_le(test_buffer, 4)
-        value3 = read_uint16_le(test_buffer, 8)
-        print(f"   ✅ read_uint32_le: {value1} (0x{value1:X})")
-        print(f"   ✅ read_int32_le: {value2}")
-        print(f"   ✅ read_uint16_le: {value3} (0x{value3:X})")
-        
-        # Test 3: Display random image
-        print("3. Testing image display...")
-        image = render_rgb_to_image(random_array, 50, 50)
-        print(f"   ✅ Displayed random image: {image.size[0]} x {image.size[1]} pixels")
-        
-        print("\n🎉 All tests passed! Your functions are working correctly.")
-        
-    except Exception as e:
-        print(f"❌ Test failed: {e}")
-        print("Make sure you have implemented all required functions in main.py")
-
-def main():
-    """Main function to handle command line arguments."""
-    if len(sys.argv) == 1:
-        # No arguments - run interactive mode
-        run_interactive_mode()
-        
-    elif len(sys.argv) == 2:
-        arg = sys.argv[1]
-        
-        if arg in ["--help", "-h"]:
-            print(__doc__)
-            
-        elif arg in ["--list", "-l"]:
-            list_available_files()
-            
-        elif arg in ["--test", "-t"]:
-            run_test_mode()
-            
-        else:
-            # Assume it's a filename
-            load_and_display_file(arg)
-            
-    else:
-        print("❌ Too many arguments!")
-        print("Usage: python run_bmp_viewer.py [filename|--list|--test]")
-        print("Run 'python run_bmp_viewer.py --help' for more information.")
-
-if __name__ == "__main__":
+#!/usr/bin/env python3
+"""
+BMP Viewer Runner - Simple interface to load and display BMP files
+
+This script provides a simple way to test the BMP parsing functionality
+by loading files from the images directory and displaying them.
+
+Usage:
+    python run_bmp_viewer.py [filename]
+    
+Examples:
+    python run_bmp_viewer.py                    # List available files
+    python run_bmp_viewer.py image-1.bmp        # Load specific file
+    python run_bmp_viewer.py --list             # List available files
+    python run_bmp_viewer.py --test             # Run test with mock data
+    python run_bmp_viewer.py --batch images     # Decode every BMP in a directory
+    python run_bmp_viewer.py --batch "scans/**/*.bmp" --output out --workers 8
+    python run_bmp_viewer.py --catalog scans --bit-count 24 --min-width 4000
+    python run_bmp_viewer.py --validate incoming --json report.json
+    python run_bmp_viewer.py --info images      # Header fields only (no NumPy/PIL)
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+from pathlib import Path
+
+# Import the main functions from main.py. NumPy and PIL are only loaded by
+# main.py once pixel work actually happens, so header-only commands stay fast.
+try:
+    from main import (
+        BMP_HEADER_SIZE,
+        parse_bmp_header,
+        load_bmp_file, 
+        create_random_array, 
+        read_uint32_le, 
+        read_int32_le, 
+        read_uint16_le,
+        read_uint32_le_many,
+        read_int32_le_many,
+        read_uint16_le_many,
+        extract_rgb_values,
+        render_rgb_to_image,
+        create_test_buffer,
+        decode_bmp_file,
+        configure_logging
+    )
+except ImportError as e:
+    print(f"❌ Error importing functions: {e}")
+    print("Make sure you have implemented the required functions in main.py")
+    sys.exit(1)
+
+def discover_bmp_files(source="images"):
+    """
+    Find BMP files from a directory, a glob pattern or a single file path.
+    
+    Args:
+        source (str): Directory to scan for *.bmp, glob pattern, or file path
+        
+    Returns:
+        list: Sorted list of Path objects
+    """
+    source_path = Path(source)
+    if source_path.is_dir():
+        return sorted(source_path.glob("*.bmp"))
+    if source_path.is_file():
+        return [source_path]
+    return sorted(Path(p) for p in glob.glob(str(source), recursive=True) if os.path.isfile(p))
+
+def source_root(source):
+    """
+    Directory that files found by discover_bmp_files(source) are relative to.
+    
+    For a glob pattern this is the part of the path before the first
+    wildcard, so "scans/**/*.bmp" gives "scans".
+    
+    Args:
+        source (str): Directory, glob pattern or file path
+        
+    Returns:
+        Path: Root directory of the source
+    """
+    source_path = Path(source)
+    if source_path.is_dir():
+        return source_path
+    if source_path.is_file():
+        return source_path.parent
+    root = Path()
+    for part in source_path.parts:
+        if glob.has_magic(part):
+            break
+        root /= part
+    return root
+
+def list_available_files():
+    """List all BMP files in the images directory."""
+    images_dir = Path("images")
+    if not images_dir.exists():
+        print("❌ Images directory not found!")
+        return []
+    
+    bmp_files = discover_bmp_files(images_dir)
+    if not bmp_files:
+        print("❌ No BMP files found in images directory!")
+        return []
+    
+    print("📁 Available BMP files in images directory:")
+    for i, file_path in enumerate(bmp_files, 1):
+        file_size = file_path.stat().st_size
+        print(f"  {i}. {file_path.name} ({file_size:,} bytes)")
+    
+    return bmp_files
+
+def load_and_display_file(filename):
+    """Load and display a specific BMP file."""
+    file_path = Path("images") / filename
+    
+    if not file_path.exists():
+        print(f"❌ File not found: {file_path}")
+        return False
+    
+    print(f"🖼️  Loading BMP file: {filename}")
+    print("=" * 50)
+    
+    try:
+        # Load and display the BMP file
+        image = load_bmp_file(str(file_path), show=True)
+        
+        if image:
+            print(f"✅ Successfully loaded and displayed {filename}")
+            print(f"   Image size: {image.size[0]} x {image.size[1]} pixels")
+            print(f"   Image mode: {image.mode}")
+            return True
+        else:
+            print(f"❌ Failed to load {filename}")
+            return False
+            
+    except Exception as e:
+        print(f"❌ Error loading {filename}: {e}")
+        return False
+
+def run_interactive_mode():
+    """Run in interactive mode, letting user choose files."""
+    print("🎮 BMP Viewer - Interactive Mode")
+    print("=" * 50)
+    
+    while True:
+        print("\nOptions:")
+        print("  1. List available files")
+        print("  2. Load a specific file")
+        print("  3. Run test with mock data")
+        print("  4. Exit")
+        
+        choice = input("\nEnter your choice (1-4): ").strip()
+        
+        if choice == "1":
+            list_available_files()
+            
+        elif choice == "2":
+            files = list_available_files()
+            if files:
+                try:
+                    file_num = int(input("Enter file number: ")) - 1
+                    if 0 <= file_num < len(files):
+                        load_and_display_file(files[file_num].name)
+                    else:
+                        print("❌ Invalid file number!")
+                except ValueError:
+                    print("❌ Please enter a valid number!")
+                    
+        elif choice == "3":
+            run_test_mode()
+            
+        elif choice == "4":
+            print("👋 Goodbye!")
+            break
+            
+        else:
+            print("❌ Invalid choice! Please enter 1-4.")
+
+def check_bulk_readers():
+    """
+    Check that the bulk readers agree with the scalar readers at every offset.
+    
+    Returns:
+        bool: True if every reader agrees
+    """
+    test_buffer = create_test_buffer()
+    try:
+        for read_many, read_one, size in ((read_uint32_le_many, read_uint32_le, 4),
+                                          (read_int32_le_many, read_int32_le, 4),
+                                          (read_uint16_le_many, read_uint16_le, 2)):
+            offsets = range(len(test_buffer) - size + 1)
+            expected = [read_one(test_buffer, offset) for offset in offsets]
+            if read_many(test_buffer, list(offsets)).tolist() != expected:
+                raise AssertionError(f"{read_many.__name__} disagrees with {read_one.__name__}")
+            if read_many(test_buffer, start=0, stride=1).tolist() != expected:
+                raise AssertionError(f"{read_many.__name__} (strided) disagrees with {read_one.__name__}")
+    except Exception as e:
+        print(f"   ❌ Bulk reader check failed: {e}")
+        return False
+    print("   ✅ Bulk readers match the scalar readers")
+    return True
+
+def run_test_mode():
+    """Run a test with mock data to verify functions work."""
+    print("🧪 Running test mode with mock data...")
+    print("=" * 50)
+    
+    # Runs first and on its own, so unfinished tickets below cannot skip it
+    print("0. Checking bulk readers against the scalar readers...")
+    check_bulk_readers()
+    
+    try:
+        # Test 1: Create random array
+        print("1. Testing random array creation...")
+        random_array = create_random_array(50, 50)
+        print(f"   ✅ Created array with shape: {random_array.shape}")
+        
+        # Test 2: Test struct functions
+        print("2. Testing struct functions...")
+        test_buffer = create_test_buffer()
+        value1 = read_uint32_le(test_buffer, 0)
+        value2 = read_int32_le(test_buffer, 4)
+        value3 = read_uint16_le(test_buffer, 8)
+        print(f"   ✅ read_uint32_le: {value1} (0x{value1:X})")
+        print(f"   ✅ read_int32_le: {value2}")
+        print(f"   ✅ read_uint16_le: {value3} (0x{value3:X})")
+        
+        # Test 3: Display random image
+        print("3. Testing image display...")
+        image = render_rgb_to_image(random_array, 50, 50, show=True)
+        print(f"   ✅ Displayed random image: {image.size[0]} x {image.size[1]} pixels")
+        
+        print("\n🎉 All tests passed! Your functions are working correctly.")
+        
+    except Exception as e:
+        print(f"❌ Test failed: {e}")
+        print("Make sure you have implemented all required functions in main.py")
+
+def _convert_file(file_path, output_path):
+    """Decode one BMP (and optionally save it) inside a worker process."""
+    from PIL import Image
+    
+    header, rgb_values = decode_bmp_file(file_path)
+    if output_path is not None:
+        os.makedirs(os.path.dirname(output_path), exist_ok=True)
+        Image.fromarray(rgb_values).save(output_path)
+    return os.path.getsize(file_path), header.width * header.abs_height
+
+def _output_paths(files, root, output_dir, output_format):
+    """
+    Map each input file to its converted path, mirroring its location under
+    root so same-named files in different directories do not overwrite
+    each other.
+    
+    Returns:
+        tuple: (dict of file -> output path, dict of file -> error) where the
+        errors are files whose output path is claimed by another file
+    """
+    outputs = {}
+    claimed = {}
+    errors = {}
+    for file_path in files:
+        try:
+            relative = file_path.relative_to(root)
+        except ValueError:
+            relative = Path(file_path.name)
+        output_path = str((Path(output_dir) / relative).with_suffix("." + output_format))
+        # x.bmp and x.BMP in one directory both map to x.<format>
+        first = claimed.setdefault(os.path.normcase(output_path), file_path)
+        if first is file_path:
+            outputs[file_path] = output_path
+        else:
+            errors[str(file_path)] = f"Output {output_path} would overwrite the one for {first}"
+    return outputs, errors
+
+def run_batch_mode(source, workers=None, output_dir=None, output_format="png", max_in_flight=None):
+    """
+    Decode (and optionally convert) every BMP in a directory or glob on all cores.
+    
+    At most max_in_flight files are queued in the process pool at a time, so
+    memory stays bounded no matter how many files are found.
+    
+    Args:
+        source (str): Directory, glob pattern or file passed to discover_bmp_files
+        workers (int): Number of worker processes (default: CPU count)
+        output_dir (str): Directory to write converted images to, mirroring each
+            file's path under the source (default: decode only)
+        output_format (str): Image format extension for converted files (default: png)
+        max_in_flight (int): Maximum queued files (default: 2 per worker)
+        
+    Returns:
+        dict: Summary with counts, per-file errors and throughput
+    """
+    from concurrent.futures import ProcessPoolExecutor, FIRST_COMPLETED, wait
+    
+    files = discover_bmp_files(source)
+    if not files:
+        print(f"❌ No BMP files found for: {source}")
+        return {"files": 0, "succeeded": 0, "failed": 0, "errors": {}}
+    
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = max_in_flight or workers * 2
+    outputs = {}
+    errors = {}
+    if output_dir is not None:
+        os.makedirs(output_dir, exist_ok=True)
+        outputs, errors = _output_paths(files, source_root(source), output_dir, output_format)
+        for file_path, error in errors.items():
+            print(f"❌ {file_path}: {error}")
+        files_to_convert = [file_path for file_path in files if file_path in outputs]
+    else:
+        files_to_convert = files
+    
+    print(f"⚙️  Batch decoding {len(files):,} files with {workers} workers...")
+    succeeded = 0
+    total_bytes = 0
+    total_pixels = 0
+    start = time.perf_counter()
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        pending = {}
+        file_iter = iter(files_to_convert)
+        while True:
+            # Keep the pool fed without queueing every file up front
+            for file_path in file_iter:
+                future = executor.submit(_convert_file, str(file_path), outputs.get(file_path))
+                pending[future] = file_path
+                if len(pending) >= max_in_flight:
+                    break
+            if not pending:
+                break
+            
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                file_path = pending.pop(future)
+                try:
+                    file_bytes, pixels = future.result()
+                except Exception as e:
+                    errors[str(file_path)] = f"{type(e).__name__}: {e}"
+                    print(f"❌ {file_path}: {e}")
+                else:
+                    succeeded += 1
+                    total_bytes += file_bytes
+                    total_pixels += pixels
+    
+    elapsed = time.perf_counter() - start
+    summary = {
+        "files": len(files),
+        "succeeded": succeeded,
+        "failed": len(errors),
+        "errors": errors,
+        "seconds": elapsed,
+        "files_per_second": succeeded / elapsed if elapsed else 0.0,
+        "mb_per_second": total_bytes / 1e6 / elapsed if elapsed else 0.0,
+        "megapixels": total_pixels / 1e6,
+    }
+    
+    print("=" * 50)
+    print(f"✅ Decoded {succeeded:,}/{len(files):,} files in {elapsed:.2f}s")
+    print(f"   Throughput: {summary['files_per_second']:.1f} files/s, "
+          f"{summary['mb_per_second']:.1f} MB/s ({summary['megapixels']:.1f} MP total)")
+    if errors:
+        print(f"❌ {len(errors):,} files failed:")
+        for file_path, error in errors.items():
+            print(f"   {file_path}: {error}")
+    return summary
+
+def run_batch_command(args):
+    """Parse --batch arguments and run batch mode."""
+    parser = argparse.ArgumentParser(prog="run_bmp_viewer.py --batch",
+                                     description="Decode and convert many BMP files in parallel.")
+    parser.add_argument("source", help="Directory, glob pattern or BMP file")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    parser.add_argument("--output", "-o", default=None,
+                        help="Directory for converted images (default: decode only)")
+    parser.add_argument("--format", "-f", default="png",
+                        help="Output image format extension (default: png)")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Maximum queued files (default: 2 per worker)")
+    options = parser.parse_args(args)
+    
+    summary = run_batch_mode(options.source, options.workers, options.output,
+                             options.format, options.max_in_flight)
+    return 1 if summary["failed"] else 0
+
+def run_catalog_command(args):
+    """Parse --catalog arguments, update the header index and print matches."""
+    from bmp_catalog import BmpCatalog, DEFAULT_CATALOG_PATH
+    
+    parser = argparse.ArgumentParser(prog="run_bmp_viewer.py --catalog",
+                                     description="Index BMP headers and query the index.")
+    parser.add_argument("source", help="Directory to index")
+    parser.add_argument("--db", default=DEFAULT_CATALOG_PATH,
+                        help=f"Catalog database path (default: {DEFAULT_CATALOG_PATH})")
+    parser.add_argument("--no-update", action="store_true",
+                        help="Query the existing index without re-scanning")
+    parser.add_argument("--bit-count", type=int, default=None)
+    parser.add_argument("--compression", type=int, default=None)
+    parser.add_argument("--min-width", type=int, default=None)
+    parser.add_argument("--min-height", type=int, default=None)
+    options = parser.parse_args(args)
+    
+    with BmpCatalog(options.db) as catalog:
+        if not options.no_update:
+            start = time.perf_counter()
+            stats = catalog.update(options.source)
+            print(f"📇 Indexed {stats['scanned']:,} files in {time.perf_counter() - start:.2f}s "
+                  f"({stats['updated']:,} updated, {stats['unchanged']:,} unchanged, "
+                  f"{stats['removed']:,} removed)")
+        
+        start = time.perf_counter()
+        rows = catalog.query(bit_count=options.bit_count, compression=options.compression,
+                             min_width=options.min_width, min_height=options.min_height)
+        print(f"🔎 {len(rows):,} matching files ({(time.perf_counter() - start) * 1000:.1f} ms)")
+        for row in rows:
+            print(f"  {row['path']}: {row['width']} x {abs(row['height'])}, "
+                  f"{row['bit_count']}-bit, compression {row['compression']}")
+    return 0
+
+def run_validate_command(args):
+    """Parse --validate arguments, check every BMP's structure and report."""
+    import json
+    from bmp_validate import validate_tree
+    
+    parser = argparse.ArgumentParser(prog="run_bmp_viewer.py --validate",
+                                     description="Check the header structure of every BMP in a directory.")
+    parser.add_argument("source", help="Directory to validate")
+    parser.add_argument("--workers", "-w", type=int, default=None,
+                        help="Reader threads (default: 4 per CPU, at most 32)")
+    parser.add_argument("--no-recursive", action="store_true",
+                        help="Only check the top-level directory")
+    parser.add_argument("--json", default=None, metavar="PATH",
+                        help="Write the full report, valid files included, as JSON")
+    options = parser.parse_args(args)
+    
+    report = validate_tree(options.source, recursive=not options.no_recursive,
+                           workers=options.workers, include_valid=options.json is not None)
+    if options.json:
+        with open(options.json, "w") as f:
+            json.dump(report, f, indent=2)
+    
+    print(f"🔍 Checked {report['checked']:,} files in {report['seconds']:.2f}s: "
+          f"{report['valid']:,} valid, {report['invalid']:,} invalid")
+    for entry in report["files"]:
+        if not entry["ok"]:
+            print(f"  ❌ {entry['path']}: " + "; ".join(error["message"] for error in entry["errors"]))
+    return 1 if report["invalid"] else 0
+
+def run_info_command(args):
+    """
+    Print the header fields of BMP files using only struct and os.
+    
+    Only the first 54 bytes of each file are read, and NumPy and PIL are
+    never imported, so this is cheap enough to call once per file from scripts.
+    """
+    parser = argparse.ArgumentParser(prog="run_bmp_viewer.py --info",
+                                     description="Print BMP header fields without decoding pixels.")
+    parser.add_argument("sources", nargs="+", help="BMP files, directories or glob patterns")
+    options = parser.parse_args(args)
+    
+    failed = 0
+    for source in options.sources:
+        files = discover_bmp_files(source)
+        if not files:
+            print(f"❌ No BMP files found for: {source}")
+            failed += 1
+        for file_path in files:
+            try:
+                with open(file_path, "rb") as f:
+                    header = parse_bmp_header(f.read(BMP_HEADER_SIZE))
+            except (OSError, ValueError) as e:
+                print(f"❌ {file_path}: {e}")
+                failed += 1
+                continue
+            if not header.is_bmp:
+                print(f"❌ {file_path}: invalid BMP signature {header.signature!r}")
+                failed += 1
+                continue
+            print(f"{file_path}: {header.width} x {header.abs_height}, {header.bit_count}-bit, "
+                  f"compression {header.compression}, "
+                  f"{'top-down' if header.top_down else 'bottom-up'}, "
+                  f"data offset {header.data_offset}, {header.file_size:,} bytes")
+    return 1 if failed else 0
+
+def main():
+    """Main function to handle command line arguments."""
+    configure_logging()
+    
+    if len(sys.argv) > 1 and sys.argv[1] in ["--batch", "-b"]:
+        sys.exit(run_batch_command(sys.argv[2:]))
+    
+    if len(sys.argv) > 1 and sys.argv[1] in ["--catalog", "-c"]:
+        sys.exit(run_catalog_command(sys.argv[2:]))
+    
+    if len(sys.argv) > 1 and sys.argv[1] in ["--validate", "-V"]:
+        sys.exit(run_validate_command(sys.argv[2:]))
+    
+    if len(sys.argv) > 1 and sys.argv[1] in ["--info", "-i"]:
+        sys.exit(run_info_command(sys.argv[2:]))
+    
+    if len(sys.argv) == 1:
+        # No arguments - run interactive mode
+        run_interactive_mode()
+        
+    elif len(sys.argv) == 2:
+        arg = sys.argv[1]
+        
+        if arg in ["--help", "-h"]:
+            print(__doc__)
+            
+        elif arg in ["--list", "-l"]:
+            list_available_files()
+            
+        elif arg in ["--test", "-t"]:
+            run_test_mode()
+            
+        else:
+            # Assume it's a filename
+            load_and_display_file(arg)
+            
+    else:
+        print("❌ Too many arguments!")
+        print("Usage: python run_bmp_viewer.py [filename|--list|--test|--batch SOURCE|--catalog SOURCE|--validate SOURCE|--info FILE...]")
+        print("Run 'python run_bmp_viewer.py --help' for more information.")
+
+if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -0,0 +1,31 @@
+import struct
+
+import numpy as np
+
+from main import padded_row_size
+
+def write_masked_bmp(path, pixels, bit_count, compression, masks=(), header_size=40,
+                     top_down=False):
+    """Write raw 16/32-bit pixel values with the given masks after the header."""
+    height, width = pixels.shape
+    row_size = padded_row_size(width, bit_count)
+    rows = np.zeros((height, row_size), dtype=np.uint8)
+    rows[:, :width * bit_count // 8] = pixels.astype(f"<u{bit_count // 8}").view(np.uint8)
+    if not top_down:
+        rows = rows[::-1]
+
+    # BITMAPINFOHEADER files store the masks after the header; V2+ headers
+    # (52 bytes and up) hold them inside the header itself
+    extension = struct.pack(f"<{len(masks)}I", *masks)
+    if header_size > 40:
+        extension = extension.ljust(header_size - 40, b"\0")
+    data_offset = 54 + len(extension)
+    header = struct.pack("<2sIHHIIiiHHIIiiII", b"BM", data_offset + rows.nbytes, 0, 0,
+                         data_offset, header_size, width, -height if top_down else height,
+                         1, bit_count, compression, rows.nbytes, 0, 0, 0, 0)
+    path.write_bytes(header + extension + rows.tobytes())
+    return str(path)
+
+def random_pixels(bit_count, height=9, width=13):
+    return np.random.default_rng(bit_count).integers(0, 1 << bit_count, (height, width),
+                                                    dtype=np.uint64)
@@ -0,0 +1,70 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from main import BmpDecoder, aiter_bmp, write_bmp
+
+class _SlowDecoder(BmpDecoder):
+    """Sleeps before decoding and records how many decodes overlap."""
+
+    def __init__(self, delay):
+        super().__init__()
+        self.delay = delay
+        self.running = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def decode(self, file_path):
+        with self._lock:
+            self.running += 1
+            self.peak = max(self.peak, self.running)
+        try:
+            time.sleep(self.delay)
+            return super().decode(file_path)
+        finally:
+            with self._lock:
+                self.running -= 1
+
+def _collect(file_paths, **kwargs):
+    async def run():
+        return [result async for result in aiter_bmp(file_paths, **kwargs)]
+    return asyncio.run(run())
+
+def _write_images(tmp_path, count):
+    paths = []
+    for index in range(count):
+        path = tmp_path / f"{index}.bmp"
+        write_bmp(path, np.full((2, 3, 3), index, dtype=np.uint8))
+        paths.append(str(path))
+    return paths
+
+def test_results_cover_every_file(tmp_path):
+    paths = _write_images(tmp_path, 5)
+    results = _collect(paths)
+    assert sorted(result.file_path for result in results) == paths
+    for result in results:
+        assert result.ok
+        assert (result.rgb == int(result.file_path[-5])).all()
+
+def test_failures_are_returned_as_results(tmp_path):
+    paths = _write_images(tmp_path, 2)
+    missing = str(tmp_path / "missing.bmp")
+    results = {result.file_path: result for result in _collect(paths + [missing])}
+    assert isinstance(results[missing].error, FileNotFoundError)
+    assert all(results[path].ok for path in paths)
+
+def test_timeout_is_returned_as_a_result(tmp_path):
+    paths = _write_images(tmp_path, 2)
+    results = _collect(paths, timeout=0.05, decoder=_SlowDecoder(0.5))
+    assert all(isinstance(result.error, asyncio.TimeoutError) for result in results)
+
+def test_max_concurrency_bounds_files_in_flight(tmp_path):
+    paths = _write_images(tmp_path, 12)
+    decoder = _SlowDecoder(0.02)
+    with ThreadPoolExecutor(max_workers=12) as executor:
+        results = _collect(paths, max_concurrency=3, decoder=decoder, executor=executor)
+    assert len(results) == 12 and all(result.ok for result in results)
+    assert decoder.peak == 3
@@ -0,0 +1,34 @@
+from pathlib import Path
+
+import numpy as np
+
+from main import write_bmp
+from run_bmp_viewer import run_batch_mode, source_root
+
+def test_source_root(tmp_path):
+    (tmp_path / "scans").mkdir()
+    (tmp_path / "scans" / "x.bmp").write_bytes(b"")
+    assert source_root(str(tmp_path / "scans")) == tmp_path / "scans"
+    assert source_root(str(tmp_path / "scans" / "x.bmp")) == tmp_path / "scans"
+    assert source_root(str(tmp_path / "scans" / "**" / "*.bmp")) == tmp_path / "scans"
+
+def test_recursive_glob_keeps_same_named_files_apart(tmp_path):
+    image = np.zeros((2, 3, 3), dtype=np.uint8)
+    for directory in ("a", "b/c"):
+        (tmp_path / "scans" / directory).mkdir(parents=True)
+        write_bmp(tmp_path / "scans" / directory / "x.bmp", image)
+
+    summary = run_batch_mode(str(tmp_path / "scans" / "**" / "*.bmp"), workers=1,
+                             output_dir=str(tmp_path / "out"))
+    assert summary["succeeded"] == 2
+    assert sorted(path.relative_to(tmp_path / "out").as_posix()
+                  for path in Path(tmp_path / "out").rglob("*.png")) == ["a/x.png", "b/c/x.png"]
+
+def test_colliding_outputs_are_reported(tmp_path):
+    image = np.zeros((2, 3, 3), dtype=np.uint8)
+    write_bmp(tmp_path / "x.bmp", image)
+    write_bmp(tmp_path / "x.BMP", image)
+
+    summary = run_batch_mode(str(tmp_path / "x.*"), workers=1, output_dir=str(tmp_path / "out"))
+    assert summary["succeeded"] == 1
+    assert summary["failed"] == 1
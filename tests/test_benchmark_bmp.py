@@ -0,0 +1,41 @@
+from benchmark_bmp import build_corpus, compare_rle_ratios, compare_to_baseline, rle_ratios
+from main import BI_RLE8, decode_bmp_file
+
+def _entry(seconds, peak_bytes=0):
+    return {"case": "tiny-24bit", "stage": "parse_bmp_header", "seconds": seconds,
+            "peak_bytes": peak_bytes}
+
+def test_zero_baseline_time_is_compared_without_dividing():
+    regressions = compare_to_baseline([_entry(1e-3)], [_entry(0.0)], 0.25)
+    assert len(regressions) == 1
+    assert "below timer resolution" in regressions[0]
+
+def test_small_changes_are_noise():
+    assert compare_to_baseline([_entry(1e-5)], [_entry(0.0)], 0.25) == []
+    assert compare_to_baseline([_entry(1.1)], [_entry(1.0)], 0.25) == []
+
+def test_slowdown_and_memory_growth_are_reported():
+    regressions = compare_to_baseline([_entry(2.0, 10_000_000)], [_entry(1.0, 1_000_000)], 0.25)
+    assert len(regressions) == 2
+    assert "+100%" in regressions[0]
+
+def test_rle_cases_pair_with_the_same_uncompressed_image(tmp_path):
+    cases = build_corpus(str(tmp_path), ["tiny"], [8], [1], [False, True])
+    rle = [case for case in cases if case["compression"] == BI_RLE8]
+    assert len(rle) == 1
+    twin = rle[0]["path"].replace("-rle", "")
+    assert (decode_bmp_file(rle[0]["path"])[1] == decode_bmp_file(twin)[1]).all()
+
+    results = [{"case": case["name"], "stage": "decode_pixels",
+                "seconds": 4.0 if case["compression"] == BI_RLE8 else 1.0} for case in cases]
+    ratios = rle_ratios(results, cases)
+    assert [(entry["case"], entry["ratio"]) for entry in ratios] == [(rle[0]["name"], 4.0)]
+
+def test_rle_ratio_growth_is_reported():
+    def ratio(rle_seconds):
+        return {"case": "small-8bit-w64-rle-bottomup", "rle_seconds": rle_seconds,
+                "rgb_seconds": 1e-3, "ratio": rle_seconds / 1e-3}
+
+    assert compare_rle_ratios([ratio(4e-3)], [ratio(3e-3)], 0.25) != []
+    assert compare_rle_ratios([ratio(3.5e-3)], [ratio(3e-3)], 0.25) == []
+    assert compare_rle_ratios([ratio(4e-3)], [], 0.25) == []
@@ -0,0 +1,50 @@
+import os
+
+import numpy as np
+
+import bmp_catalog
+from bmp_catalog import BmpCatalog
+from main import write_bmp
+
+def _write_tree(root):
+    image = np.zeros((2, 3, 3), dtype=np.uint8)
+    (root / "sub").mkdir(parents=True)
+    for name in ("a.bmp", "b.bmp", "sub/c.bmp"):
+        write_bmp(root / name, image)
+
+def test_rescan_only_reads_changed_files(tmp_path, monkeypatch):
+    _write_tree(tmp_path / "scans")
+    with BmpCatalog(str(tmp_path / "catalog.sqlite3")) as catalog:
+        assert catalog.update(str(tmp_path / "scans"))["updated"] == 3
+
+        read = []
+        original = bmp_catalog.read_header_record
+        monkeypatch.setattr(bmp_catalog, "read_header_record",
+                            lambda path: read.append(path) or original(path))
+        assert catalog.update(str(tmp_path / "scans")) == {
+            "scanned": 3, "updated": 0, "unchanged": 3, "removed": 0}
+        assert read == []
+
+        changed = tmp_path / "scans" / "a.bmp"
+        write_bmp(changed, np.zeros((4, 5, 3), dtype=np.uint8))
+        os.utime(changed, ns=(0, 1))
+        assert catalog.update(str(tmp_path / "scans"))["updated"] == 1
+        assert read == [str(changed)]
+        assert [row["width"] for row in catalog.query()] == [5, 3, 3]
+
+def test_deleted_files_are_removed(tmp_path):
+    _write_tree(tmp_path / "scans")
+    with BmpCatalog(str(tmp_path / "catalog.sqlite3")) as catalog:
+        catalog.update(str(tmp_path / "scans"))
+        (tmp_path / "scans" / "sub" / "c.bmp").unlink()
+        assert catalog.update(str(tmp_path / "scans"))["removed"] == 1
+        assert [os.path.basename(row["path"]) for row in catalog.query()] == ["a.bmp", "b.bmp"]
+
+def test_non_recursive_update_keeps_subdirectory_entries(tmp_path):
+    _write_tree(tmp_path / "scans")
+    with BmpCatalog(str(tmp_path / "catalog.sqlite3")) as catalog:
+        catalog.update(str(tmp_path / "scans"))
+        (tmp_path / "scans" / "b.bmp").unlink()
+        assert catalog.update(str(tmp_path / "scans"), recursive=False) == {
+            "scanned": 1, "updated": 0, "unchanged": 1, "removed": 1}
+        assert [os.path.basename(row["path"]) for row in catalog.query()] == ["a.bmp", "c.bmp"]
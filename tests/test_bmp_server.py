@@ -0,0 +1,74 @@
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from bmp_server import BmpDecodeServer, BmpServerClient, SharedImageCache
+from main import decode_bmp_file, write_bmp
+
+@pytest.fixture
+def server(tmp_path):
+    server = BmpDecodeServer(str(tmp_path / "bmp.sock"), SharedImageCache(max_bytes=1000))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+@pytest.fixture
+def images(tmp_path):
+    rng = np.random.default_rng(0)
+    paths = []
+    for index in range(2):
+        path = tmp_path / f"{index}.bmp"
+        write_bmp(path, rng.integers(0, 256, (12, 10, 3), dtype=np.uint8))
+        paths.append(str(path))
+    return paths
+
+def test_acquire_serves_decoded_pixels(server, images):
+    with BmpServerClient(server.server_address) as client:
+        for output in ("rgb", "float32"):
+            with client.acquire(images[0], output) as image:
+                assert not image.array.flags.writeable
+                assert np.array_equal(image.array, decode_bmp_file(images[0], output=output)[1])
+
+def test_held_blocks_are_not_evicted(server, images):
+    with BmpServerClient(server.server_address) as client:
+        first = client.acquire(images[0])
+        with client.acquire(images[1]):
+            # 2 x 360 bytes fit the 1000-byte budget; the float32 copy does not
+            with client.acquire(images[1], "float32"):
+                assert client.stats()["entries"] == 3
+            # Only the released float32 copy is evicted
+            assert client.stats()["entries"] == 2
+            assert client.stats()["evictions"] == 1
+        assert np.array_equal(first.array, decode_bmp_file(images[0])[1])
+        first.close()
+        assert client.stats()["references"] == 0
+
+def test_disconnect_releases_references(server, images):
+    with BmpServerClient(server.server_address) as client:
+        other = BmpServerClient(server.server_address)
+        other.acquire(images[0])
+        assert client.stats()["references"] == 1
+        other.close()
+        deadline = time.monotonic() + 5
+        while client.stats()["references"] and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert client.stats()["references"] == 0
+
+def test_release_of_unheld_block_fails(server, images):
+    with BmpServerClient(server.server_address) as client:
+        with pytest.raises(ValueError):
+            client._request(op="release", name="not-a-block")
+
+def test_failed_detach_still_releases(server, images):
+    with BmpServerClient(server.server_address) as client:
+        image = client.acquire(images[0])
+        export = image.shm.buf[:4]
+        with pytest.raises(BufferError):
+            image.close()
+        assert client.stats()["references"] == 0
+        export.release()
+        image.shm.close()
@@ -0,0 +1,49 @@
+import struct
+
+import numpy as np
+
+from bmp_validate import validate_file, validate_tree
+from main import write_bmp
+
+def _write_image(path, width=5, height=3):
+    write_bmp(path, np.zeros((height, width, 3), dtype=np.uint8))
+    return path
+
+def _codes(result):
+    return [error["code"] for error in result["errors"]]
+
+def test_valid_file(tmp_path):
+    result = validate_file(str(_write_image(tmp_path / "ok.bmp")))
+    assert result["ok"]
+    assert result["width"] == 5
+
+def test_truncated_pixel_data(tmp_path):
+    path = _write_image(tmp_path / "short.bmp")
+    path.write_bytes(path.read_bytes()[:-8])
+    assert _codes(validate_file(str(path))) == ["file_size_mismatch", "truncated_pixel_data"]
+
+def test_bad_signature_and_offset(tmp_path):
+    path = _write_image(tmp_path / "bad.bmp")
+    data = bytearray(path.read_bytes())
+    struct.pack_into("<I", data, 10, 20)
+    path.write_bytes(bytes(data))
+    assert "bad_data_offset" in _codes(validate_file(str(path)))
+
+    data[:2] = b"XX"
+    path.write_bytes(bytes(data))
+    assert _codes(validate_file(str(path))) == ["bad_signature"]
+
+def test_missing_file_is_unreadable(tmp_path):
+    assert _codes(validate_file(str(tmp_path / "gone.bmp"))) == ["unreadable"]
+
+def test_tree_with_bounded_window(tmp_path):
+    for index in range(20):
+        _write_image(tmp_path / f"{index:02}.bmp")
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "sub" / "broken.bmp").write_bytes(b"BM")
+
+    report = validate_tree(str(tmp_path), workers=2, max_in_flight=3)
+    assert (report["checked"], report["valid"], report["invalid"]) == (21, 20, 1)
+    assert report["error_counts"] == {"truncated_header": 1}
+    assert [entry["path"] for entry in report["files"]] == sorted(
+        entry["path"] for entry in report["files"])
@@ -0,0 +1,47 @@
+import numpy as np
+
+import main
+from main import (
+    BMP_HEADER_SIZE,
+    bmp_header_dtype,
+    create_test_buffer,
+    parse_bmp_header,
+    parse_bmp_headers,
+    read_int32_le,
+    read_int32_le_many,
+    read_uint16_le,
+    read_uint16_le_many,
+    read_uint32_le,
+    read_uint32_le_many,
+    write_bmp,
+)
+
+def test_bulk_readers_match_scalar_readers():
+    buffer = create_test_buffer()
+    for read_many, read_one, size in ((read_uint32_le_many, read_uint32_le, 4),
+                                      (read_int32_le_many, read_int32_le, 4),
+                                      (read_uint16_le_many, read_uint16_le, 2)):
+        offsets = list(range(len(buffer) - size + 1))
+        expected = [read_one(buffer, offset) for offset in offsets]
+        assert read_many(buffer, offsets).tolist() == expected
+        assert read_many(buffer, start=0, stride=1).tolist() == expected
+
+def test_header_dtype_is_a_numpy_dtype():
+    assert isinstance(main.BMP_HEADER_DTYPE, np.dtype)
+    assert main.BMP_HEADER_DTYPE is bmp_header_dtype()
+    assert main.BMP_HEADER_DTYPE.itemsize == BMP_HEADER_SIZE
+    assert main.BMP_HEADER_DTYPE.names[:3] == ('signature', 'file_size', 'reserved1')
+
+def test_parse_bmp_headers_matches_parse_bmp_header(tmp_path):
+    blobs = []
+    for width, height in ((3, 2), (5, -4), (8, 1)):
+        path = tmp_path / f"{width}x{height}.bmp"
+        write_bmp(path, np.zeros((abs(height), width, 3), dtype=np.uint8),
+                  top_down=height < 0)
+        blobs.append(path.read_bytes()[:BMP_HEADER_SIZE])
+
+    records = parse_bmp_headers(b"".join(blobs))
+    for record, blob in zip(records, blobs):
+        header = parse_bmp_header(blob)
+        for field in ('width', 'height', 'bit_count', 'data_offset', 'file_size'):
+            assert record[field] == getattr(header, field)
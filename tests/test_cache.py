@@ -0,0 +1,57 @@
+import os
+
+import numpy as np
+import pytest
+
+from main import DecodedImageCache, decode_bmp_file, write_bmp
+
+@pytest.fixture
+def images(tmp_path):
+    # 2 x 3 RGB pixels decode to 18 bytes each
+    paths = []
+    for index in range(3):
+        path = tmp_path / f"{index}.bmp"
+        write_bmp(path, np.full((2, 3, 3), index, dtype=np.uint8))
+        paths.append(str(path))
+    return paths
+
+def test_hit_returns_the_cached_read_only_array(images):
+    cache = DecodedImageCache()
+    header, rgb = decode_bmp_file(images[0], cache=cache)
+    assert not rgb.flags.writeable
+    with pytest.raises(ValueError):
+        rgb[0, 0, 0] = 1
+
+    assert decode_bmp_file(images[0], cache=cache)[1] is rgb
+    assert cache.stats() == {"entries": 1, "bytes": 18, "max_bytes": cache.max_bytes,
+                             "hits": 1, "misses": 1, "evictions": 0}
+
+def test_byte_budget_evicts_least_recently_used(images):
+    cache = DecodedImageCache(max_bytes=40)
+    decode_bmp_file(images[0], cache=cache)
+    decode_bmp_file(images[1], cache=cache)
+    decode_bmp_file(images[0], cache=cache)
+    decode_bmp_file(images[2], cache=cache)
+
+    stats = cache.stats()
+    assert (stats["entries"], stats["bytes"], stats["evictions"]) == (2, 36, 1)
+    assert cache.get(cache.make_key(images[1])) is None
+    assert cache.get(cache.make_key(images[0])) is not None
+
+def test_rewritten_file_is_decoded_again(images):
+    cache = DecodedImageCache()
+    first = decode_bmp_file(images[0], cache=cache)[1]
+    write_bmp(images[0], np.full((2, 3, 3), 9, dtype=np.uint8))
+    os.utime(images[0], ns=(0, 1))
+
+    second = decode_bmp_file(images[0], cache=cache)[1]
+    assert second is not first
+    assert (second == 9).all()
+    # The stale entry is replaced, not kept alongside the new one
+    assert cache.stats()["entries"] == 1
+    assert cache.stats()["misses"] == 2
+
+def test_oversized_images_are_not_cached(images):
+    cache = DecodedImageCache(max_bytes=10)
+    assert not decode_bmp_file(images[0], cache=cache)[1].flags.writeable
+    assert len(cache) == 0
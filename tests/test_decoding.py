@@ -0,0 +1,82 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from bmp_samples import random_pixels, write_masked_bmp
+from main import (
+    BI_ALPHABITFIELDS,
+    BI_BITFIELDS,
+    BI_RGB,
+    decode_bmp_file,
+    parse_bmp_header,
+    read_channel_masks,
+    write_bmp,
+)
+
+def _expected_rgb(pixels, masks):
+    """Reference channel extraction: round(value * 255 / channel maximum)."""
+    channels = []
+    for mask in masks:
+        if not mask:
+            continue
+        shift = (mask & -mask).bit_length() - 1
+        maximum = mask >> shift
+        values = ((pixels.astype(np.uint64) & mask) >> shift).astype(np.float64)
+        channels.append(np.floor(values * 255 / maximum + 0.5).astype(np.uint8))
+    return np.stack(channels, axis=-1)
+
+# ============================================================================
+# CHANNEL MASKS
+# ============================================================================
+
+@pytest.mark.parametrize("top_down", [False, True])
+def test_16bit_default_555(tmp_path, top_down):
+    pixels = random_pixels(16)
+    path = write_masked_bmp(tmp_path / "555.bmp", pixels, 16, BI_RGB, top_down=top_down)
+    header, rgb = decode_bmp_file(path)
+    assert read_channel_masks(b"", header) == (0x7C00, 0x03E0, 0x001F, 0)
+    assert np.array_equal(rgb, _expected_rgb(pixels, (0x7C00, 0x03E0, 0x001F)))
+
+@pytest.mark.parametrize("top_down", [False, True])
+def test_16bit_565_bitfields(tmp_path, top_down):
+    masks = (0xF800, 0x07E0, 0x001F)
+    pixels = random_pixels(16)
+    path = write_masked_bmp(tmp_path / "565.bmp", pixels, 16, BI_BITFIELDS, masks,
+                            top_down=top_down)
+    assert np.array_equal(decode_bmp_file(path)[1], _expected_rgb(pixels, masks))
+
+def test_16bit_alphabitfields_4444(tmp_path):
+    masks = (0x0F00, 0x00F0, 0x000F, 0xF000)
+    pixels = random_pixels(16)
+    path = write_masked_bmp(tmp_path / "4444.bmp", pixels, 16, BI_ALPHABITFIELDS, masks)
+    rgba = decode_bmp_file(path)[1]
+    assert rgba.shape == (9, 13, 4)
+    assert np.array_equal(rgba, _expected_rgb(pixels, masks))
+
+def test_32bit_bitfields_with_non_byte_masks(tmp_path):
+    masks = (0x3FF00000, 0x000FFC00, 0x000003FF)  # 10-10-10
+    pixels = random_pixels(30)
+    path = write_masked_bmp(tmp_path / "101010.bmp", pixels, 32, BI_BITFIELDS, masks)
+    assert np.array_equal(decode_bmp_file(path)[1], _expected_rgb(pixels, masks))
+
+def test_32bit_v4_alpha_matches_pillow(tmp_path):
+    rgba = np.random.default_rng(4).integers(0, 256, (9, 13, 4), dtype=np.uint8)
+    path = tmp_path / "bgra.bmp"
+    write_bmp(path, rgba, 32)
+    decoded = decode_bmp_file(str(path))[1]
+    assert np.array_equal(decoded, rgba)
+    assert np.array_equal(decoded, np.asarray(Image.open(path).convert("RGBA")))
+
+def test_read_channel_masks_layouts(tmp_path):
+    pixels = random_pixels(16, 1, 1)
+    cases = [
+        (BI_BITFIELDS, (0xF800, 0x07E0, 0x001F), 40, (0xF800, 0x07E0, 0x001F, 0)),
+        (BI_ALPHABITFIELDS, (0x0F00, 0x00F0, 0x000F, 0xF000), 40,
+         (0x0F00, 0x00F0, 0x000F, 0xF000)),
+        (BI_BITFIELDS, (0x7C00, 0x03E0, 0x001F, 0x8000), 108, (0x7C00, 0x03E0, 0x001F, 0x8000)),
+    ]
+    for index, (compression, masks, header_size, expected) in enumerate(cases):
+        path = write_masked_bmp(tmp_path / f"{index}.bmp", pixels, 16, compression, masks,
+                                header_size)
+        data = open(path, "rb").read()
+        assert read_channel_masks(data, parse_bmp_header(data)) == expected
@@ -0,0 +1,27 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+def _loaded_after(code):
+    script = (f"import sys; {code}; "
+              "print(','.join(m for m in ('numpy', 'PIL') if m in sys.modules))")
+    completed = subprocess.run([sys.executable, "-c", script], cwd=ROOT,
+                               capture_output=True, text=True, check=True)
+    return completed.stdout.strip().splitlines()[-1] if completed.stdout.strip() else ""
+
+@pytest.mark.parametrize("module", ["main", "run_bmp_viewer"])
+def test_import_loads_neither_numpy_nor_pil(module):
+    assert _loaded_after(f"import {module}") == ""
+
+def test_header_only_work_stays_light():
+    code = ("import main; "
+            "main.read_bmp_header('images/image-1.bmp'); "
+            "main.create_test_buffer()")
+    assert _loaded_after(code) == ""
+
+def test_first_use_loads_numpy():
+    assert _loaded_after("import main; main.np.zeros(1)") == "numpy"
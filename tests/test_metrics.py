@@ -0,0 +1,77 @@
+import numpy as np
+import pytest
+
+from benchmark_bmp import write_synthetic_bmp
+from main import (
+    BI_RGB,
+    BI_RLE8,
+    DecodeMetrics,
+    collect_decode_metrics,
+    decode_bmp_file,
+    extract_rgb_values,
+    parse_bmp_header,
+)
+
+@pytest.mark.parametrize("bit_count, compression, output", [
+    (24, BI_RGB, "rgb"), (32, BI_RGB, "rgb"), (8, BI_RGB, "rgb"), (8, BI_RLE8, "rgb"),
+    (24, BI_RGB, "float32"),
+])
+def test_decode_counts_each_allocation_once(tmp_path, bit_count, compression, output):
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 13, 9, bit_count, compression=compression)
+    with collect_decode_metrics() as metrics:
+        pixels = decode_bmp_file(path, output=output)[1]
+    assert metrics.snapshot()["counters"]["bytes_allocated"] == pixels.nbytes
+
+def test_extract_rgb_values_counts_its_copy(tmp_path):
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 13, 9, 24)
+    data = open(path, "rb").read()
+    header = parse_bmp_header(data)
+    with collect_decode_metrics() as metrics:
+        extract_rgb_values(data, header.data_offset, header.width, header.height, copy=False)
+        assert "bytes_allocated" not in metrics.snapshot()["counters"]
+        rgb = extract_rgb_values(data, header.data_offset, header.width, header.height)
+    assert metrics.snapshot()["counters"]["bytes_allocated"] == rgb.nbytes == 13 * 9 * 3
+
+def test_snapshot_counts_calls_stages_and_counters(tmp_path):
+    path = str(tmp_path / "image.bmp")
+    size = write_synthetic_bmp(path, 13, 9, 24)
+    records = []
+    with collect_decode_metrics(DecodeMetrics(listeners=[records.append])) as metrics:
+        for _ in range(3):
+            decode_bmp_file(path)
+
+    snapshot = metrics.snapshot()
+    assert snapshot["calls"] == 3
+    assert snapshot["counters"] == {"bytes_read": 3 * size, "pixels_decoded": 3 * 13 * 9,
+                                    "bytes_allocated": 3 * 13 * 9 * 3}
+    for name in ("read", "parse", "extract"):
+        stage = snapshot["stages"][name]
+        assert stage["count"] == 3
+        assert sum(stage["buckets"].values()) == 3
+        assert 0 <= stage["max_seconds"] <= stage["total_seconds"]
+
+    assert len(records) == 3
+    assert records[0]["path"] == path
+    assert set(records[0]["stages"]) == {"read", "parse", "extract"}
+    assert records[0]["counters"]["bytes_read"] == size
+
+def test_to_prometheus_format():
+    metrics = DecodeMetrics()
+    with metrics.call("a.bmp"):
+        metrics.record_stage("read", 0.002)
+        metrics.record_stage("read", 2.0)
+        metrics.count(bytes_read=10)
+
+    lines = metrics.to_prometheus().splitlines()
+    assert lines[0] == "# TYPE bmp_decode_stage_seconds histogram"
+    assert 'bmp_decode_stage_seconds_bucket{stage="read",le="0.001"} 0' in lines
+    assert 'bmp_decode_stage_seconds_bucket{stage="read",le="0.005"} 1' in lines
+    assert 'bmp_decode_stage_seconds_bucket{stage="read",le="5.0"} 2' in lines
+    assert 'bmp_decode_stage_seconds_bucket{stage="read",le="+Inf"} 2' in lines
+    assert 'bmp_decode_stage_seconds_sum{stage="read"} 2.002' in lines
+    assert 'bmp_decode_stage_seconds_count{stage="read"} 2' in lines
+    assert lines[-4:] == ["# TYPE bmp_decode_calls_total counter", "bmp_decode_calls_total 1",
+                          "# TYPE bmp_decode_bytes_read_total counter",
+                          "bmp_decode_bytes_read_total 10"]
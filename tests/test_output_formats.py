@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+import main
+from benchmark_bmp import write_synthetic_bmp
+from main import BI_RGB, BI_RLE8, decode_bmp_file, write_bmp
+
+def _cases(tmp_path):
+    for bit_count, compression in ((1, BI_RGB), (4, BI_RGB), (8, BI_RGB), (8, BI_RLE8),
+                                   (16, BI_RGB), (24, BI_RGB), (32, BI_RGB)):
+        for top_down in (False, True) if compression == BI_RGB else (False,):
+            path = str(tmp_path / f"{bit_count}-{compression}-{top_down}.bmp")
+            write_synthetic_bmp(path, 13, 11, bit_count, top_down=top_down,
+                                compression=compression, seed=bit_count)
+            yield path
+    path = tmp_path / "rgba.bmp"
+    write_bmp(path, np.random.default_rng(0).integers(0, 256, (11, 13, 4), dtype=np.uint8), 32)
+    yield str(path)
+
+@pytest.fixture(autouse=True)
+def small_bands(monkeypatch):
+    # Several bands per image, including a short last one
+    monkeypatch.setattr(main, "OUTPUT_BAND_ROWS", 4)
+
+def test_layouts_match_conversions_of_rgb(tmp_path):
+    for path in _cases(tmp_path):
+        rgb = decode_bmp_file(path)[1]
+        luma = (rgb[:, :, :3].astype(np.uint32) @ np.array(main.LUMA_WEIGHTS) + 128) >> 8
+
+        gray = decode_bmp_file(path, output="gray")[1]
+        assert gray.dtype == np.uint8
+        assert np.array_equal(gray, luma), path
+        planar = decode_bmp_file(path, output="planar")[1]
+        assert np.array_equal(planar, np.moveaxis(rgb, -1, 0)), path
+        floats = decode_bmp_file(path, output="float32")[1]
+        assert floats.dtype == np.float32
+        assert np.array_equal(floats, rgb.astype(np.float32) / np.float32(255)), path
+
+def test_unknown_layout_is_rejected(tmp_path):
+    path = tmp_path / "image.bmp"
+    write_bmp(path, np.zeros((2, 3, 3), dtype=np.uint8))
+    with pytest.raises(ValueError):
+        decode_bmp_file(str(path), output="bgr")
@@ -0,0 +1,40 @@
+import os
+
+import numpy as np
+import pytest
+
+from benchmark_bmp import write_synthetic_bmp
+from main import SharedImage, _create_shared_memory, decode_bmp_file, decode_bmp_parallel
+
+def _shm_exists(name):
+    return os.path.exists(os.path.join("/dev/shm", name.lstrip("/")))
+
+def test_close_unlinks_even_if_the_buffer_is_still_exported():
+    image = SharedImage(_create_shared_memory(12), (2, 2, 3))
+    image.array[:] = 7
+    export = image.shm.buf[:4]
+    with pytest.raises(BufferError):
+        image.close()
+    assert not _shm_exists(image.name)
+    assert export.tolist() == [7, 7, 7, 7]
+
+    export.release()
+    image.shm.close()
+
+@pytest.mark.parametrize("bit_count", [1, 4, 8, 24, 32])
+@pytest.mark.parametrize("top_down", [False, True])
+def test_parallel_decode_matches_decode_bmp_file(tmp_path, bit_count, top_down):
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 37, 23, bit_count, top_down=top_down, seed=bit_count)
+    expected = decode_bmp_file(path)[1]
+    with decode_bmp_parallel(path, workers=1, rows_per_band=5) as image:
+        assert np.array_equal(image.array, expected)
+
+def test_worker_processes_leave_no_shared_memory(tmp_path):
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 37, 23, 24, seed=1)
+    image = decode_bmp_parallel(path, workers=2, rows_per_band=4)
+    assert np.array_equal(image.array, decode_bmp_file(path)[1])
+    assert _shm_exists(image.name)
+    image.close()
+    assert not _shm_exists(image.name)
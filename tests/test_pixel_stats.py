@@ -0,0 +1,33 @@
+import numpy as np
+import pytest
+
+from benchmark_bmp import write_synthetic_bmp
+from main import BI_RGB, BI_RLE8, compute_pixel_stats, decode_bmp_file
+
+@pytest.mark.parametrize("bit_count, compression", [(24, BI_RGB), (8, BI_RGB), (8, BI_RLE8)])
+def test_stats_match_numpy_on_the_full_decode(tmp_path, bit_count, compression):
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 37, 23, bit_count, compression=compression, seed=bit_count)
+    rgb = decode_bmp_file(path)[1]
+    gray = decode_bmp_file(path, output="gray")[1]
+
+    stats = compute_pixel_stats(path, rows_per_band=5)
+    assert stats.pixels == 37 * 23
+    summary = stats.summary()
+    for channel, name in enumerate(("red", "green", "blue")):
+        values = rgb[:, :, channel]
+        assert np.array_equal(stats.histograms[channel], np.bincount(values.ravel(), minlength=256))
+        described = summary["channels"][name]
+        assert (described["min"], described["max"]) == (values.min(), values.max())
+        assert described["mean"] == pytest.approx(values.mean())
+        assert described["std"] == pytest.approx(values.std())
+    assert np.array_equal(stats.luminance, np.bincount(gray.ravel(), minlength=256))
+    assert summary["luminance"]["mean"] == pytest.approx(gray.mean())
+
+def test_keep_image_returns_the_decoded_pixels(tmp_path):
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 37, 23, 24)
+    stats, rgb = compute_pixel_stats(path, rows_per_band=7, keep_image=True)
+    assert np.array_equal(rgb, decode_bmp_file(path)[1])
+    assert np.array_equal(stats.histograms,
+                          compute_pixel_stats(path, rows_per_band=7).histograms)
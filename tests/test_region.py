@@ -0,0 +1,34 @@
+import os
+
+import numpy as np
+import pytest
+
+from benchmark_bmp import write_synthetic_bmp
+from main import decode_bmp_file, extract_region
+
+@pytest.mark.parametrize("bit_count", [1, 4, 8, 24, 32])
+@pytest.mark.parametrize("top_down", [False, True])
+def test_region_matches_slice_of_full_decode(tmp_path, bit_count, top_down):
+    # An odd width leaves padding at the end of every stored row
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 37, 11, bit_count, top_down=top_down, seed=bit_count)
+    full = decode_bmp_file(path)[1]
+    for x, y, width, height in ((0, 0, 37, 11), (5, 3, 9, 6), (36, 10, 1, 1), (3, 0, 31, 11)):
+        region = extract_region(path, x, y, width, height)
+        assert np.array_equal(region, full[y:y + height, x:x + width]), (x, y, width, height)
+
+def test_rejected_regions_close_the_mapping(tmp_path):
+    path = str(tmp_path / "image.bmp")
+    write_synthetic_bmp(path, 37, 11, 24)
+    truncated = str(tmp_path / "truncated.bmp")
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(truncated, "wb") as f:
+        f.write(data[:-200])
+
+    open_files = len(os.listdir("/proc/self/fd"))
+    for file_path, region in ((path, (30, 0, 8, 1)), (truncated, (0, 0, 37, 11))):
+        # The traceback keeps the function's locals alive
+        with pytest.raises(ValueError) as excinfo:
+            extract_region(file_path, *region)
+        assert len(os.listdir("/proc/self/fd")) == open_files, excinfo.value
@@ -0,0 +1,40 @@
+import struct
+
+import numpy as np
+import pytest
+from PIL import Image
+
+from benchmark_bmp import write_synthetic_bmp
+from main import BI_RLE4, BI_RLE8, decode_bmp_file
+
+@pytest.mark.parametrize("bit_count, compression", [(8, BI_RLE8), (4, BI_RLE4)])
+def test_rle_matches_uncompressed_and_pillow(tmp_path, bit_count, compression):
+    # The same seed draws the same palette and runs for both files
+    rle_path = str(tmp_path / "rle.bmp")
+    raw_path = str(tmp_path / "raw.bmp")
+    write_synthetic_bmp(rle_path, 37, 11, bit_count, compression=compression, seed=3)
+    write_synthetic_bmp(raw_path, 37, 11, bit_count, seed=3)
+
+    rgb = decode_bmp_file(rle_path)[1]
+    assert np.array_equal(rgb, decode_bmp_file(raw_path)[1])
+    assert np.array_equal(rgb, np.asarray(Image.open(rle_path).convert("RGB")))
+
+def test_rle8_absolute_mode_and_end_of_line(tmp_path):
+    palette = bytes(value for index in range(256) for value in (3 * index % 256,
+                                                                2 * index % 256, index, 0))
+    data = bytes([
+        0, 3, 1, 2, 3, 0,  # bottom row: absolute run of 3, padded to a word
+        1, 4,              # one pixel of index 4
+        0, 0,              # end of line
+        4, 6,              # top row: four pixels of index 6
+        0, 1,              # end of bitmap
+    ])
+    data_offset = 54 + len(palette)
+    header = struct.pack("<2sIHHIIiiHHIIiiII", b"BM", data_offset + len(data), 0, 0,
+                         data_offset, 40, 4, 2, 1, 8, BI_RLE8, len(data), 0, 0, 256, 0)
+    path = tmp_path / "abs.bmp"
+    path.write_bytes(header + palette + data)
+
+    indices = np.array([[6, 6, 6, 6], [1, 2, 3, 4]])
+    expected = np.stack([indices, 2 * indices, 3 * indices], axis=-1).astype(np.uint8)
+    assert np.array_equal(decode_bmp_file(str(path))[1], expected)
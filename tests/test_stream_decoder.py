@@ -0,0 +1,54 @@
+import numpy as np
+import pytest
+
+from benchmark_bmp import write_synthetic_bmp
+from bmp_samples import random_pixels, write_masked_bmp
+from main import (
+    BI_BITFIELDS,
+    BI_RLE8,
+    OUTPUT_FORMATS,
+    BmpStreamDecoder,
+    decode_bmp_file,
+    write_bmp,
+)
+
+def _stream_cases(tmp_path):
+    for bit_count in (1, 4, 8, 16, 24, 32):
+        for top_down in (False, True):
+            path = str(tmp_path / f"{bit_count}-{top_down}.bmp")
+            write_synthetic_bmp(path, 13, 9, bit_count, top_down=top_down, seed=bit_count)
+            yield path
+    yield write_masked_bmp(tmp_path / "565.bmp", random_pixels(16), 16, BI_BITFIELDS,
+                           (0xF800, 0x07E0, 0x001F), top_down=True)
+    path = tmp_path / "rgba.bmp"
+    write_bmp(path, np.random.default_rng(0).integers(0, 256, (9, 13, 4), dtype=np.uint8), 32)
+    yield str(path)
+
+@pytest.mark.parametrize("output", OUTPUT_FORMATS)
+def test_stream_decoder_byte_at_a_time(tmp_path, output):
+    for path in _stream_cases(tmp_path):
+        data = open(path, "rb").read()
+        expected = decode_bmp_file(path, output=output)[1]
+        for rows_per_band in (1, 4, 64):
+            decoder = BmpStreamDecoder(rows_per_band, output)
+            rows = 0
+            for index in range(len(data)):
+                for top, band in decoder.feed(data[index:index + 1]):
+                    rows += band.shape[1 if output == "planar" else 0]
+            result = decoder.finish()
+            assert rows == 9
+            assert result.dtype == expected.dtype
+            assert np.array_equal(result, expected), (path, rows_per_band)
+
+def test_stream_decoder_rejects_truncated_and_rle(tmp_path):
+    path = tmp_path / "image.bmp"
+    write_bmp(path, np.zeros((9, 13, 3), dtype=np.uint8))
+    decoder = BmpStreamDecoder()
+    decoder.feed(path.read_bytes()[:-1])
+    with pytest.raises(ValueError):
+        decoder.finish()
+
+    rle_path = str(tmp_path / "rle.bmp")
+    write_synthetic_bmp(rle_path, 13, 9, 8, compression=BI_RLE8)
+    with pytest.raises(ValueError):
+        BmpStreamDecoder().feed(open(rle_path, "rb").read())
@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+from PIL import Image
+
+from main import BI_BITFIELDS, BI_RGB, decode_bmp_file, load_bmp_file, write_bmp
+
+def _random_image(channels, height=7, width=5):
+    return np.random.default_rng(channels).integers(0, 256, (height, width, channels),
+                                                    dtype=np.uint8)
+
+@pytest.mark.parametrize("top_down", [False, True])
+@pytest.mark.parametrize("bit_count", [24, 32])
+def test_rgb_round_trip(tmp_path, bit_count, top_down):
+    rgb = _random_image(3)
+    path = tmp_path / "out.bmp"
+    write_bmp(path, rgb, bit_count, top_down)
+
+    header, decoded = decode_bmp_file(str(path))
+    assert header.compression == BI_RGB
+    assert np.array_equal(decoded, rgb)
+
+@pytest.mark.parametrize("top_down", [False, True])
+def test_rgba_round_trip_at_32_bits(tmp_path, top_down):
+    rgba = _random_image(4)
+    path = tmp_path / "out.bmp"
+    write_bmp(path, rgba, 32, top_down)
+
+    header, decoded = decode_bmp_file(str(path))
+    assert header.compression == BI_BITFIELDS
+    assert header.header_size == 108
+    assert np.array_equal(decoded, rgba)
+    assert np.array_equal(np.asarray(load_bmp_file(str(path))), rgba)
+    assert np.array_equal(np.asarray(Image.open(path)), rgba)
+
+def test_rgba_at_24_bits_is_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_bmp(tmp_path / "out.bmp", _random_image(4), 24)